@@ -0,0 +1,168 @@
+# © 2026 SolarWinds Worldwide, LLC. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with the License. You may obtain a copy of the License at:http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
+
+"""Application served by bench_e2e, with or without the distro.
+
+The process is started by bench_e2e, with the OpenTelemetry auto
+instrumentation sitecustomize on PYTHONPATH when instrumented. It prints
+``PORT <port>`` once listening. GET /__stats returns process CPU time and,
+with BENCH_E2E_COMPONENTS set, time spent in each distro component.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import socket
+import sys
+import time
+from collections import defaultdict
+
+STATS_PATH = "/__stats"
+BODY = b'{"status": "ok"}'
+
+_timings: dict[str, int] = defaultdict(int)
+
+
+def _timed(name: str, func):
+    def timed(*args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _timings[name] += time.perf_counter_ns() - start
+
+    return timed
+
+
+def _time_hooks(name: str, obj, hooks: tuple[str, ...]) -> None:
+    for hook in hooks:
+        if hasattr(obj, hook):
+            setattr(obj, hook, _timed(name, getattr(obj, hook)))
+
+
+def time_components() -> None:
+    """Wrap distro components so that time spent in each is accumulated."""
+    # pylint: disable=import-outside-toplevel,protected-access
+    from opentelemetry import propagate, trace
+    from opentelemetry.instrumentation.propagators import (
+        get_global_response_propagator,
+    )
+
+    provider = trace.get_tracer_provider()
+    _time_hooks("sampler", provider.sampler, ("should_sample",))
+    for processor in provider._active_span_processor._span_processors:
+        _time_hooks(
+            "processors", processor, ("on_start", "_on_ending", "on_end")
+        )
+        exporter = getattr(processor, "span_exporter", None)
+        if exporter is not None:
+            _time_hooks("export", exporter, ("export",))
+    _time_hooks("propagator", propagate.get_global_textmap(), ("extract",))
+    response_propagator = get_global_response_propagator()
+    if response_propagator is not None:
+        _time_hooks("propagator", response_propagator, ("inject",))
+
+
+def stats() -> bytes:
+    """Flush telemetry and return process CPU time and component timings."""
+    # pylint: disable=import-outside-toplevel
+    from opentelemetry import metrics, trace
+
+    for provider in (
+        trace.get_tracer_provider(),
+        metrics.get_meter_provider(),
+    ):
+        force_flush = getattr(provider, "force_flush", None)
+        if force_flush is not None:
+            force_flush()
+    times = os.times()
+    return json.dumps(
+        {"cpu": times.user + times.system, "components": dict(_timings)}
+    ).encode()
+
+
+def wsgi_app():
+    # pylint: disable=import-outside-toplevel
+    from flask import Flask, Response
+
+    app = Flask(__name__)
+
+    @app.route("/api/orders")
+    def orders():
+        return Response(BODY, mimetype="application/json")
+
+    @app.route(STATS_PATH)
+    def stats_route():
+        return Response(stats(), mimetype="application/json")
+
+    return app
+
+
+async def asgi_app(scope, receive, send):
+    if scope["type"] != "http":
+        return
+    body = stats() if scope["path"] == STATS_PATH else BODY
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+def _listen() -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("127.0.0.1", 0))
+    sock.listen(128)
+    print(f"PORT {sock.getsockname()[1]}", flush=True)
+    return sock
+
+
+def serve_wsgi() -> None:
+    # pylint: disable=import-outside-toplevel
+    from werkzeug.serving import make_server
+
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    app = wsgi_app()
+    sock = _listen()
+    server = make_server("127.0.0.1", 0, app, threaded=False, fd=sock.fileno())
+    server.serve_forever()
+
+
+def serve_asgi() -> None:
+    # pylint: disable=import-outside-toplevel
+    import uvicorn
+
+    app = asgi_app
+    if os.environ.get("BENCH_E2E_INSTRUMENTED"):
+        from opentelemetry.instrumentation.asgi import OpenTelemetryMiddleware
+
+        app = OpenTelemetryMiddleware(app, excluded_urls=STATS_PATH)
+    sock = _listen()
+    config = uvicorn.Config(app, log_level="warning", access_log=False)
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("app", choices=("wsgi", "asgi"))
+    args = parser.parse_args()
+    if os.environ.get("BENCH_E2E_COMPONENTS"):
+        time_components()
+    if args.app == "wsgi":
+        serve_wsgi()
+    else:
+        serve_asgi()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+# © 2026 SolarWinds Worldwide, LLC. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with the License. You may obtain a copy of the License at:http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
+
+"""Timing helpers shared by the benchmark modules."""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable
+
+
+def ns_per_call(
+    func: Callable[[], object],
+    number: int = 100_000,
+    repeat: int = 5,
+) -> float:
+    """
+    Time func and return the best observed nanoseconds per call.
+
+    Parameters:
+    func (Callable[[], object]): Zero-argument callable to time.
+    number (int): Calls per timing run. Defaults to 100_000.
+    repeat (int): Number of timing runs; the fastest is reported. Defaults to 5.
+
+    Returns:
+    float: Nanoseconds per call of the fastest run.
+    """
+    timings = timeit.repeat(func, number=number, repeat=repeat)
+    return min(timings) / number * 1e9
+
+
+def report(name: str, value: float, unit: str = "ns/op") -> None:
+    """
+    Print one benchmark result line.
+
+    Parameters:
+    name (str): Benchmark name.
+    value (float): Measured value.
+    unit (str): Unit of the value. Defaults to "ns/op".
+    """
+    print(f"{name:<56} {value:>12.1f} {unit}")
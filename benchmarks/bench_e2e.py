@@ -0,0 +1,320 @@
+# © 2026 SolarWinds Worldwide, LLC. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with the License. You may obtain a copy of the License at:http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
+
+"""Benchmark per-request overhead of the distro on local WSGI and ASGI apps.
+
+Run with ``python -m benchmarks.bench_e2e``. Each app in benchmarks._e2e_app
+is started in a subprocess three times: uninstrumented, instrumented through
+the OpenTelemetry auto instrumentation sitecustomize (which loads
+SolarWindsDistro and SolarWindsConfigurator), and instrumented with timing
+wrappers around the sampler, span processors, propagators and span exporter.
+Instrumented apps export to a local fake OTLP receiver and fetch sampling
+settings, which sample every request, from a local HTTPS stub.
+
+Reports p50/p99 client latency and server CPU per request, and for the
+third run the time per request spent in each component. The stub needs the
+openssl command to create a certificate; ASGI needs uvicorn and
+opentelemetry-instrumentation-asgi and is skipped without them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import importlib.util
+import json
+import os
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import opentelemetry.instrumentation.auto_instrumentation as auto_instrumentation
+
+from benchmarks._e2e_app import STATS_PATH
+from benchmarks._util import report
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVICE = "bench-e2e"
+TRACEPARENT = "00-3a02f8a392478c3700000000deadbeef-1000100010001000-01"
+TRACESTATE = "sw=1000100010001000-01,vendor1=value1"
+BUCKET = 1e12
+COMPONENTS = ("sampler", "processors", "propagator", "export")
+
+
+class _QuietHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+    def _respond(self, body: bytes, content_type: str) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FakeOtlpHandler(_QuietHandler):
+    """Accepts OTLP/HTTP exports and counts them by path."""
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.exports[self.path] = (
+            self.server.exports.get(self.path, 0) + 1
+        )
+        self._respond(b"", "application/x-protobuf")
+
+
+class SettingsHandler(_QuietHandler):
+    """Serves sampling settings that sample every request."""
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        body = json.dumps(
+            {
+                "value": 1_000_000,
+                "flags": "SAMPLE_START,SAMPLE_THROUGH_ALWAYS,TRIGGER_TRACE",
+                "timestamp": int(time.time()),
+                "ttl": 120,
+                "arguments": {
+                    "BucketCapacity": BUCKET,
+                    "BucketRate": BUCKET,
+                    "TriggerRelaxedBucketCapacity": BUCKET,
+                    "TriggerRelaxedBucketRate": BUCKET,
+                    "TriggerStrictBucketCapacity": BUCKET,
+                    "TriggerStrictBucketRate": BUCKET,
+                },
+            }
+        ).encode()
+        self.server.fetched.set()
+        self._respond(body, "application/json")
+
+
+def _serve(handler, ssl_context: ssl.SSLContext | None = None):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    server.exports = {}
+    server.fetched = threading.Event()
+    if ssl_context is not None:
+        server.socket = ssl_context.wrap_socket(
+            server.socket, server_side=True
+        )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _certificate(directory: str) -> tuple[str, str]:
+    cert = os.path.join(directory, "cert.pem")
+    key = os.path.join(directory, "key.pem")
+    subprocess.run(
+        [
+            "openssl",
+            "req",
+            "-x509",
+            "-newkey",
+            "rsa:2048",
+            "-nodes",
+            "-days",
+            "1",
+            "-subj",
+            "/CN=localhost",
+            "-addext",
+            "subjectAltName=DNS:localhost,IP:127.0.0.1",
+            "-keyout",
+            key,
+            "-out",
+            cert,
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return cert, key
+
+
+class App:
+    """An app subprocess and a keep-alive client connection to it."""
+
+    def __init__(
+        self, app: str, env: dict[str, str], verbose: bool = False
+    ) -> None:
+        self.process = subprocess.Popen(  # pylint: disable=consider-using-with
+            [sys.executable, "-m", "benchmarks._e2e_app", app],
+            cwd=ROOT,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=None if verbose else subprocess.DEVNULL,
+            text=True,
+        )
+        line = self.process.stdout.readline()
+        if not line.startswith("PORT "):
+            self.process.kill()
+            raise RuntimeError(f"{app} app failed to start")
+        self.connection = http.client.HTTPConnection(
+            "127.0.0.1", int(line.split()[1]), timeout=30
+        )
+
+    def get(self, path: str, headers: dict[str, str]) -> bytes:
+        self.connection.request("GET", path, headers=headers)
+        response = self.connection.getresponse()
+        body = response.read()
+        if response.will_close:
+            self.connection.close()
+        return body
+
+    def stats(self) -> dict:
+        return json.loads(self.get(STATS_PATH, {}))
+
+    def close(self) -> None:
+        self.connection.close()
+        self.process.terminate()
+        self.process.wait(timeout=30)
+
+
+def run(
+    app: str,
+    env: dict[str, str],
+    requests: int,
+    verbose: bool = False,
+    settings_fetched: threading.Event | None = None,
+) -> dict:
+    """
+    Drive requests against one app subprocess.
+
+    Parameters:
+    app (str): "wsgi" or "asgi".
+    env (dict[str, str]): Environment of the app subprocess.
+    requests (int): Measured requests, after a tenth as many for warm up.
+    verbose (bool): Whether to pass through app stderr. Defaults to False.
+    settings_fetched (threading.Event | None): If given, set once the app fetches sampling settings, which is awaited before load. Defaults to None.
+
+    Returns:
+    dict: Latencies in ns, CPU seconds and component timings.
+    """
+    headers = {"traceparent": TRACEPARENT, "tracestate": TRACESTATE}
+    if settings_fetched is not None:
+        settings_fetched.clear()
+    server = App(app, env, verbose)
+    try:
+        if settings_fetched is not None and not settings_fetched.wait(30):
+            raise RuntimeError(f"{app} app did not fetch sampling settings")
+        for _ in range(max(1, requests // 10)):
+            server.get("/api/orders", headers)
+        before = server.stats()
+        latencies = []
+        for _ in range(requests):
+            start = time.perf_counter_ns()
+            server.get("/api/orders", headers)
+            latencies.append(time.perf_counter_ns() - start)
+        after = server.stats()
+    finally:
+        server.close()
+    latencies.sort()
+    components = after["components"]
+    for name, ns in before["components"].items():
+        components[name] -= ns
+    return {
+        "p50": latencies[len(latencies) // 2],
+        "p99": latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)],
+        "cpu": after["cpu"] - before["cpu"],
+        "components": components,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument(
+        "--verbose", action="store_true", help="show app logs on stderr"
+    )
+    args = parser.parse_args(argv)
+
+    apps = ["wsgi"]
+    if importlib.util.find_spec("uvicorn") and importlib.util.find_spec(
+        "opentelemetry.instrumentation.asgi"
+    ):
+        apps.append("asgi")
+    else:
+        print("skipping asgi: uvicorn or opentelemetry-instrumentation-asgi")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cert, key = _certificate(tmp)
+        ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        ssl_context.load_cert_chain(cert, key)
+        otlp = _serve(FakeOtlpHandler)
+        settings = _serve(SettingsHandler, ssl_context)
+
+        base_env = dict(os.environ)
+        base_env.pop("PYTHONPATH", None)
+        instrumented_env = {
+            **base_env,
+            "PYTHONPATH": os.path.dirname(auto_instrumentation.__file__),
+            "BENCH_E2E_INSTRUMENTED": "1",
+            "REQUESTS_CA_BUNDLE": cert,
+            "SW_APM_SERVICE_KEY": f"bench-token:{SERVICE}",
+            "SW_APM_COLLECTOR": f"localhost:{settings.server_port}",
+            "OTEL_EXPORTER_OTLP_ENDPOINT": (
+                f"http://127.0.0.1:{otlp.server_port}"
+            ),
+            "OTEL_PYTHON_FLASK_EXCLUDED_URLS": STATS_PATH,
+        }
+        components_env = {**instrumented_env, "BENCH_E2E_COMPONENTS": "1"}
+
+        for app in apps:
+            baseline = run(app, base_env, args.requests, args.verbose)
+            instrumented = run(
+                app,
+                instrumented_env,
+                args.requests,
+                args.verbose,
+                settings.fetched,
+            )
+            timed = run(
+                app,
+                components_env,
+                args.requests,
+                args.verbose,
+                settings.fetched,
+            )
+
+            for label, result in (
+                ("uninstrumented", baseline),
+                ("instrumented", instrumented),
+            ):
+                report(f"{app} {label} p50", result["p50"] / 1e3, "us")
+                report(f"{app} {label} p99", result["p99"] / 1e3, "us")
+                report(
+                    f"{app} {label} cpu",
+                    result["cpu"] / args.requests * 1e6,
+                    "us/request",
+                )
+            report(
+                f"{app} overhead p50",
+                (instrumented["p50"] - baseline["p50"]) / 1e3,
+                "us",
+            )
+            report(
+                f"{app} overhead cpu",
+                (instrumented["cpu"] - baseline["cpu"]) / args.requests * 1e6,
+                "us/request",
+            )
+            for component in COMPONENTS:
+                report(
+                    f"{app} component {component}",
+                    timed["components"].get(component, 0) / args.requests,
+                    "ns/request",
+                )
+        print(f"otlp exports received: {otlp.exports}")
+        otlp.shutdown()
+        settings.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
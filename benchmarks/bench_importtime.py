@@ -0,0 +1,97 @@
+# © 2026 SolarWinds Worldwide, LLC. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with the License. You may obtain a copy of the License at:http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
+
+"""Benchmark import time of the distro entry points.
+
+Run with ``python -m benchmarks.bench_importtime``. Each module is imported
+in a fresh interpreter with ``python -X importtime`` and the fastest of
+several runs is reported. With ``--check`` the run exits non-zero if any
+module exceeds its budget in BUDGETS or imports a module in DEFERRED.
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+
+from benchmarks._util import report
+
+# Per-module budgets of cumulative import time in us. Set well above
+# typical CI runner timings so only real regressions fail.
+BUDGETS = {
+    "solarwinds_apm.distro": 600_000,
+    "solarwinds_apm.configurator": 600_000,
+}
+
+# Modules that must only be imported once the component needing them is
+# created, not by importing the distro entry points
+DEFERRED = ("requests",)
+
+
+def import_time(module: str) -> tuple[int, set[str]]:
+    """
+    Import a module in a fresh interpreter and time it.
+
+    Parameters:
+    module (str): Module to import.
+
+    Returns:
+    tuple[int, set[str]]: Cumulative import time in us and the modules imported.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    cumulative = 0
+    imported = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        name = name.strip()
+        if not cumulative_us.strip().isdigit():
+            continue
+        imported.add(name)
+        if name == module:
+            cumulative = int(cumulative_us)
+    return cumulative, imported
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit non-zero if any module exceeds its budget",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    violations = []
+    for module, budget_us in BUDGETS.items():
+        best = None
+        imported: set[str] = set()
+        for _ in range(args.repeat):
+            cumulative, imported = import_time(module)
+            best = cumulative if best is None else min(best, cumulative)
+        report(f"import {module}", best / 1e3, "ms")
+        if best > budget_us:
+            violations.append(f"{module} over budget")
+        for deferred in DEFERRED:
+            if deferred in imported:
+                violations.append(f"{module} imports {deferred}")
+
+    if args.check and violations:
+        print(f"import time: {', '.join(violations)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
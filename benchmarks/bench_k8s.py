@@ -0,0 +1,94 @@
+# © 2026 SolarWinds Worldwide, LLC. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with the License. You may obtain a copy of the License at:http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
+
+"""Benchmark K8s pod UID lookup over a synthetic 10k-line mountinfo file."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import uuid
+
+from benchmarks._util import ns_per_call, report
+from solarwinds_apm import k8s
+
+_LINES = 10_000
+_POD_UID = str(uuid.uuid4())
+
+
+def _write_mountinfo(path: str) -> None:
+    # Overlay and proc mounts of a busy node, with the kubelet pod mounts
+    # at the end so a scan reads the whole file
+    with open(path, "w", encoding="utf-8") as file:
+        for index in range(_LINES - 2):
+            file.write(
+                f"{1000 + index} 757 0:{index % 200} /bus{index} "
+                f"/proc/bus{index} ro,nosuid,nodev,noexec,relatime - overlay "
+                "overlay rw,lowerdir=/var/lib/containerd/io.containerd."
+                f"snapshotter.v1.overlayfs/snapshots/{index}/fs\n"
+            )
+        file.write(
+            f"769 757 259:16 /var/lib/kubelet/pods/{_POD_UID}/volumes/"
+            "kubernetes.io~empty-dir/html /html rw,nosuid,nodev,noatime - "
+            "ext4 /dev/nvme1n1p1 rw,seclabel\n"
+        )
+        file.write(
+            f"772 757 259:16 /var/lib/kubelet/pods/{_POD_UID}/etc-hosts "
+            "/etc/hosts rw,nosuid,nodev,noatime - ext4 /dev/nvme1n1p1 rw\n"
+        )
+
+
+def _uncached(mountinfo: str, cgroup: str) -> str | None:
+    k8s._pod_uid_cache.clear()  # pylint: disable=protected-access
+    return k8s._pod_uid(mountinfo, cgroup)  # pylint: disable=protected-access
+
+
+def main() -> None:
+    os.environ.pop(k8s.UID_ENV, None)
+    with tempfile.TemporaryDirectory() as tmp:
+        mountinfo = os.path.join(tmp, "mountinfo")
+        _write_mountinfo(mountinfo)
+        namespaced_cgroup = os.path.join(tmp, "cgroup-namespaced")
+        with open(namespaced_cgroup, "w", encoding="utf-8") as file:
+            file.write("0::/\n")
+        kubepods_cgroup = os.path.join(tmp, "cgroup-kubepods")
+        with open(kubepods_cgroup, "w", encoding="utf-8") as file:
+            file.write(
+                "0::/kubepods.slice/kubepods-burstable.slice/"
+                f"kubepods-burstable-pod{_POD_UID.replace('-', '_')}.slice/"
+                "cri-containerd-0123.scope\n"
+            )
+
+        assert _uncached(mountinfo, namespaced_cgroup) == _POD_UID
+        assert _uncached(mountinfo, kubepods_cgroup) == _POD_UID
+
+        report(
+            f"k8s pod uid mountinfo scan {_LINES} lines",
+            ns_per_call(
+                lambda: _uncached(mountinfo, namespaced_cgroup),
+                number=20,
+            )
+            / 1e3,
+            "us",
+        )
+        report(
+            "k8s pod uid from cgroup",
+            ns_per_call(
+                lambda: _uncached(mountinfo, kubepods_cgroup), number=2_000
+            )
+            / 1e3,
+            "us",
+        )
+        report(
+            "k8s pod uid memoized",
+            ns_per_call(
+                lambda: k8s._pod_uid(mountinfo, namespaced_cgroup)  # pylint: disable=protected-access
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
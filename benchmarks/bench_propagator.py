@@ -0,0 +1,154 @@
+# © 2026 SolarWinds Worldwide, LLC. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with the License. You may obtain a copy of the License at:http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
+
+"""Benchmark SolarWinds propagators per inbound request, outbound request and response."""
+
+from __future__ import annotations
+
+from functools import partial
+
+from opentelemetry import trace
+from opentelemetry.context import set_value
+from opentelemetry.instrumentation.wsgi import wsgi_getter
+from opentelemetry.trace import NonRecordingSpan, SpanContext, TraceFlags
+from opentelemetry.trace.propagation.tracecontext import (
+    TraceContextTextMapPropagator,
+)
+from opentelemetry.trace.span import TraceState
+
+from benchmarks._util import ns_per_call, report
+from solarwinds_apm.apm_constants import INTL_SWO_X_OPTIONS_KEY
+from solarwinds_apm.propagator import EMPTY_XTRACEOPTIONS, SolarWindsPropagator
+from solarwinds_apm.response_propagator import (
+    SolarWindsTraceResponsePropagator,
+)
+from solarwinds_apm.traceoptions import XTraceOptions
+
+
+class _TwoPassPropagator(SolarWindsPropagator):
+    """Reference extract: W3C extract, then separate X-Trace-Options pass."""
+
+    def extract(self, carrier, context=None, getter=wsgi_getter):
+        context = TraceContextTextMapPropagator.extract(
+            self, carrier, context, getter
+        )
+        xtraceoptions_header = getter.get(
+            carrier, self._XTRACEOPTIONS_HEADER_NAME
+        ) or [""]
+        signature_header = getter.get(
+            carrier, self._XTRACEOPTIONS_SIGNATURE_HEADER_NAME
+        ) or [""]
+        xtraceoptions = XTraceOptions(
+            xtraceoptions_header[0],
+            signature_header[0],
+        )
+        return set_value(INTL_SWO_X_OPTIONS_KEY, xtraceoptions, context)
+
+
+def _environ(**headers: str) -> dict:
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": "/api/orders",
+        "SERVER_NAME": "localhost",
+        "SERVER_PORT": "8000",
+        "HTTP_HOST": "localhost:8000",
+        "HTTP_ACCEPT": "*/*",
+        "HTTP_USER_AGENT": "bench",
+    }
+    for name, value in headers.items():
+        environ[f"HTTP_{name.upper()}"] = value
+    return environ
+
+
+def _context(trace_state: TraceState):
+    span_context = SpanContext(
+        trace_id=0x3A02F8A392478C3700000000DEADBEEF,
+        span_id=0x1000100010001000,
+        is_remote=False,
+        trace_flags=TraceFlags(TraceFlags.SAMPLED),
+        trace_state=trace_state,
+    )
+    return trace.set_span_in_context(NonRecordingSpan(span_context))
+
+
+def main() -> None:
+    propagator = SolarWindsPropagator()
+
+    inject_cases = {
+        "inject, no tracestate": TraceState(),
+        "inject, sw only": TraceState([("sw", "1000100010001000-01")]),
+        "inject, sw + 3 vendors + response": TraceState(
+            [
+                ("sw", "1000100010001000-01"),
+                ("xtrace_options_response", "trigger-trace####ok"),
+                ("congo", "t61rcWkgMzE"),
+                ("rojo", "00f067aa0ba902b7"),
+                ("dd", "s:1;o:rum"),
+            ]
+        ),
+    }
+    for name, trace_state in inject_cases.items():
+        context = _context(trace_state)
+        report(name, ns_per_call(partial(propagator.inject, {}, context)))
+
+    traceparent = "00-3a02f8a392478c3700000000deadbeef-1000100010001000-01"
+    extract_cases = {
+        "no headers": _environ(),
+        "traceparent + tracestate": _environ(
+            traceparent=traceparent,
+            tracestate="sw=1000100010001000-01,congo=t61rcWkgMzE",
+        ),
+        "traceparent + x-trace-options": _environ(
+            traceparent=traceparent,
+            x_trace_options="trigger-trace;sw-keys=check-id:check-1013",
+        ),
+    }
+    two_pass = _TwoPassPropagator()
+    for name, environ in extract_cases.items():
+        report(
+            f"extract WSGI, {name}, two-pass",
+            ns_per_call(
+                partial(two_pass.extract, environ, getter=wsgi_getter)
+            ),
+        )
+        report(
+            f"extract WSGI, {name}, single-pass",
+            ns_per_call(
+                partial(propagator.extract, environ, getter=wsgi_getter)
+            ),
+        )
+
+    response_cases = {
+        "response inject": (
+            SolarWindsTraceResponsePropagator(),
+            TraceState([("sw", "1000100010001000-01")]),
+        ),
+        "response inject, x-trace-options response": (
+            SolarWindsTraceResponsePropagator(),
+            TraceState(
+                [
+                    ("sw", "1000100010001000-01"),
+                    ("xtrace_options_response", "trigger-trace####ok"),
+                ]
+            ),
+        ),
+        "response inject, trigger_trace_only, not requested": (
+            SolarWindsTraceResponsePropagator(trigger_trace_only=True),
+            TraceState([("sw", "1000100010001000-01")]),
+        ),
+    }
+    for name, (response_propagator, trace_state) in response_cases.items():
+        context = set_value(
+            INTL_SWO_X_OPTIONS_KEY, EMPTY_XTRACEOPTIONS, _context(trace_state)
+        )
+        report(
+            name,
+            ns_per_call(partial(response_propagator.inject, {}, context)),
+        )
+
+
+if __name__ == "__main__":
+    main()
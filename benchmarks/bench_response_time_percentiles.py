@@ -0,0 +1,39 @@
+# © 2026 SolarWinds Worldwide, LLC. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with the License. You may obtain a copy of the License at:http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
+
+"""Benchmark ResponseTimePercentiles record and query cost."""
+
+from __future__ import annotations
+
+import random
+
+from benchmarks._util import ns_per_call, report
+from solarwinds_apm.trace.response_time_percentiles import (
+    ResponseTimePercentiles,
+)
+
+
+def main() -> None:
+    store = ResponseTimePercentiles()
+    values = [int(random.lognormvariate(4, 1)) for _ in range(1024)]
+    position = 0
+
+    def record():
+        nonlocal position
+        position = (position + 1) & 1023
+        store.record("GET /api/orders", values[position])
+
+    report("record", ns_per_call(record))
+    report(
+        "percentiles p50/p95/p99",
+        ns_per_call(
+            lambda: store.percentiles("GET /api/orders"), number=10_000
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# © 2026 SolarWinds Worldwide, LLC. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with the License. You may obtain a copy of the License at:http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
+
+"""Benchmark ResponseTimeProcessor.record_response_time CPU and attribute allocations."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+from benchmarks._util import ns_per_call, report
+from solarwinds_apm.trace import ResponseTimeProcessor
+
+_SPANS = 100_000
+
+
+class _CountingHistogram:
+    """Histogram stand-in counting distinct attribute mapping objects."""
+
+    def __init__(self) -> None:
+        # Keep mappings alive so ids are not reused
+        self.attributes = {}
+
+    def record(self, amount, attributes=None, context=None):
+        self.attributes[id(attributes)] = attributes
+
+
+def _span() -> SimpleNamespace:
+    return SimpleNamespace(
+        kind=SpanKind.SERVER,
+        status=Status(StatusCode.UNSET),
+        start_time=1_000_000_000,
+        end_time=1_250_000_000,
+        attributes={
+            "sw.transaction": "GET /api/orders",
+            "http.request.method": "GET",
+            "http.response.status_code": 200,
+        },
+    )
+
+
+def _processor() -> ResponseTimeProcessor:
+    return ResponseTimeProcessor(
+        SimpleNamespace(
+            service_name="bench-service",
+            lambda_function_name=None,
+            get=lambda key, default=None: default,
+        )
+    )
+
+
+def main() -> None:
+    span = _span()
+
+    # Processor cost only, without SDK histogram aggregation
+    processor = _processor()
+    processor.response_time = SimpleNamespace(
+        record=lambda amount, attributes=None: None
+    )
+    per_span = ns_per_call(
+        lambda: processor.record_response_time(span), number=_SPANS
+    )
+    report(f"record_response_time x{_SPANS}", per_span * _SPANS / 1e6, "ms")
+
+    # Including SDK histogram aggregation
+    processor = _processor()
+    processor.response_time = (
+        MeterProvider().get_meter(__name__).create_histogram("bench")
+    )
+    per_span = ns_per_call(
+        lambda: processor.record_response_time(span), number=_SPANS
+    )
+    report(
+        f"record_response_time + SDK histogram x{_SPANS}",
+        per_span * _SPANS / 1e6,
+        "ms",
+    )
+
+    histogram = _CountingHistogram()
+    processor.response_time = histogram
+    for _ in range(_SPANS):
+        processor.record_response_time(span)
+    report(
+        f"attribute mappings built x{_SPANS}",
+        len(histogram.attributes),
+        unit="",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+# © 2026 SolarWinds Worldwide, LLC. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with the License. You may obtain a copy of the License at:http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
+
+"""Benchmark sampling decisions of JsonSampler and HttpSampler.
+
+Run with ``python -m benchmarks.bench_sampler``. HttpSampler gets the same
+settings as JsonSampler from a stubbed settings fetch, without a request
+to a collector. Each scenario is also
+timed with the OpenTelemetry SDK ParentBased(ALWAYS_ON) sampler in the same
+run, and with ``--check`` the run exits non-zero if any scenario exceeds its
+budget in BUDGETS relative to that baseline, so that it can gate CI on any
+runner (see the ``benchmark`` tox environment).
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from functools import partial
+
+from opentelemetry import trace
+from opentelemetry.context import Context, set_value
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.trace.sampling import ALWAYS_ON, ParentBased
+from opentelemetry.semconv.attributes.http_attributes import (
+    HTTP_REQUEST_METHOD,
+)
+from opentelemetry.semconv.attributes.server_attributes import SERVER_ADDRESS
+from opentelemetry.semconv.attributes.url_attributes import (
+    URL_PATH,
+    URL_SCHEME,
+)
+from opentelemetry.trace import (
+    NonRecordingSpan,
+    SpanContext,
+    SpanKind,
+    TraceFlags,
+    TraceState,
+)
+
+from benchmarks._util import ns_per_call, report
+from solarwinds_apm.apm_constants import INTL_SWO_X_OPTIONS_KEY
+from solarwinds_apm.oboe.configuration import Configuration, TransactionSetting
+from solarwinds_apm.oboe.http_sampler import HttpSampler
+from solarwinds_apm.oboe.json_sampler import JsonSampler
+from solarwinds_apm.traceoptions import XTraceOptions
+
+TRACE_ID = 0x3A02F8A392478C3700000000DEADBEEF
+SIGNATURE_KEY = "8mZ98ZnZhhggcsUmdMbS"
+# Buckets large enough that every scenario stays on its steady-state path
+BUCKET = 1e12
+
+# Per-scenario budgets: (time per decision as a multiple of the baseline
+# sampler's, transient bytes per decision), for JsonSampler and HttpSampler
+# alike. Timings on shared CI runners vary too much for absolute budgets,
+# so the time budget is relative to a baseline measured in the same run.
+# Budgets are the slowest ratios seen over repeated local runs plus about
+# 25%, and about 1.5x the measured transient bytes.
+BUDGETS = {
+    "root": (20, 1_280),
+    "remote parent sampled": (12, 2_816),
+    "remote parent not sampled": (9, 2_816),
+    "trigger trace unsigned": (32, 4_608),
+    "trigger trace signed": (45, 4_608),
+    "filtered transaction": (10, 1_280),
+}
+
+
+def _settings() -> dict:
+    return {
+        "flags": "SAMPLE_START,SAMPLE_THROUGH_ALWAYS,TRIGGER_TRACE",
+        "value": 1_000_000,
+        "arguments": {
+            "BucketCapacity": BUCKET,
+            "BucketRate": BUCKET,
+            "TriggerRelaxedBucketCapacity": BUCKET,
+            "TriggerRelaxedBucketRate": BUCKET,
+            "TriggerStrictBucketCapacity": BUCKET,
+            "TriggerStrictBucketRate": BUCKET,
+            "SignatureKey": SIGNATURE_KEY,
+        },
+        "timestamp": int(time.time()),
+        "ttl": 3600,
+    }
+
+
+def _write_settings(path: str) -> None:
+    with open(path, "w", encoding="utf-8") as settings_file:
+        json.dump([_settings()], settings_file)
+
+
+def _configuration() -> Configuration:
+    health = re.compile(r".*/health$")
+    return Configuration(
+        enabled=True,
+        service="bench",
+        collector="localhost",
+        headers={},
+        tracing_mode=True,
+        trigger_trace_enabled=True,
+        transaction_name=None,
+        transaction_settings=[
+            TransactionSetting(
+                tracing=False,
+                matcher=lambda s, regex=health: regex.match(s),
+            )
+        ],
+    )
+
+
+def _sampler(path: str) -> JsonSampler:
+    return JsonSampler(
+        meter_provider=MeterProvider(),
+        config=_configuration(),
+        path=path,
+    )
+
+
+class _StubHttpSampler(HttpSampler):
+    """HttpSampler whose settings fetch returns _settings without a request."""
+
+    def _fetch_from_collector(self):
+        return _settings()
+
+
+def _http_sampler() -> HttpSampler:
+    sampler = _StubHttpSampler(
+        meter_provider=MeterProvider(),
+        config=_configuration(),
+        initial=None,
+    )
+    if not sampler.wait_until_ready(10):
+        raise RuntimeError("HttpSampler settings were not applied")
+    return sampler
+
+
+def _remote_parent(trace_flags: int) -> Context:
+    span_context = SpanContext(
+        trace_id=TRACE_ID,
+        span_id=0x1000100010001000,
+        is_remote=True,
+        trace_flags=TraceFlags(trace_flags),
+        trace_state=TraceState(
+            [
+                ("sw", f"1000100010001000-0{trace_flags}"),
+                ("vendor1", "value1"),
+            ]
+        ),
+    )
+    return trace.set_span_in_context(NonRecordingSpan(span_context))
+
+
+def _trigger_trace(signed: bool) -> Context:
+    header = "trigger-trace;custom-key=value"
+    signature = None
+    if signed:
+        header = f"{header};ts={int(time.time())}"
+        signature = hmac.new(
+            SIGNATURE_KEY.encode(), header.encode(), hashlib.sha1
+        ).hexdigest()
+    return set_value(INTL_SWO_X_OPTIONS_KEY, XTraceOptions(header, signature))
+
+
+def _http_attributes(path: str) -> dict:
+    return {
+        HTTP_REQUEST_METHOD: "GET",
+        URL_SCHEME: "http",
+        SERVER_ADDRESS: "localhost",
+        URL_PATH: path,
+    }
+
+
+def scenarios() -> dict:
+    """
+    Get the span streams to benchmark.
+
+    Returns:
+    dict: should_sample keyword arguments by scenario name.
+    """
+    return {
+        "root": {
+            "parent_context": None,
+            "name": "GET /api/orders",
+            "kind": SpanKind.SERVER,
+            "attributes": _http_attributes("/api/orders"),
+        },
+        "remote parent sampled": {
+            "parent_context": _remote_parent(TraceFlags.SAMPLED),
+            "name": "GET /api/orders",
+            "kind": SpanKind.SERVER,
+            "attributes": _http_attributes("/api/orders"),
+        },
+        "remote parent not sampled": {
+            "parent_context": _remote_parent(TraceFlags.DEFAULT),
+            "name": "GET /api/orders",
+            "kind": SpanKind.SERVER,
+            "attributes": _http_attributes("/api/orders"),
+        },
+        "trigger trace unsigned": {
+            "parent_context": _trigger_trace(signed=False),
+            "name": "GET /api/orders",
+            "kind": SpanKind.SERVER,
+            "attributes": _http_attributes("/api/orders"),
+        },
+        "trigger trace signed": {
+            "parent_context": _trigger_trace(signed=True),
+            "name": "GET /api/orders",
+            "kind": SpanKind.SERVER,
+            "attributes": _http_attributes("/api/orders"),
+        },
+        "filtered transaction": {
+            "parent_context": None,
+            "name": "GET /health",
+            "kind": SpanKind.SERVER,
+            "attributes": _http_attributes("/health"),
+        },
+    }
+
+
+def transient_bytes(decide, number: int = 1_000) -> float:
+    """
+    Measure the peak memory allocated by a decision beyond what it keeps.
+
+    Parameters:
+    decide (Callable[[], object]): Zero-argument sampling decision.
+    number (int): Decisions to run while tracing. Defaults to 1_000.
+
+    Returns:
+    float: Peak traced bytes above the starting level.
+    """
+    decide()
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for _ in range(number):
+            decide()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - start
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit non-zero if any scenario exceeds its budget",
+    )
+    parser.add_argument("--number", type=int, default=20_000)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "solarwinds-apm-settings.json")
+        _write_settings(path)
+        samplers = {"json": _sampler(path), "http": _http_sampler()}
+        baseline = ParentBased(ALWAYS_ON)
+
+        over_budget = []
+        try:
+            for name, kwargs in scenarios().items():
+                baseline_ns = ns_per_call(
+                    partial(
+                        baseline.should_sample, trace_id=TRACE_ID, **kwargs
+                    ),
+                    number=args.number,
+                )
+                budget_ratio, budget_bytes = BUDGETS[name]
+                for sampler_name, sampler in samplers.items():
+                    decide = partial(
+                        sampler.should_sample, trace_id=TRACE_ID, **kwargs
+                    )
+                    ns = ns_per_call(decide, number=args.number)
+                    allocated = transient_bytes(decide)
+                    label = f"{sampler_name} sampler {name}"
+                    report(label, ns, "ns/decision")
+                    report(label, ns / baseline_ns, "x baseline")
+                    report(label, allocated, "B transient")
+                    if (
+                        ns > budget_ratio * baseline_ns
+                        or allocated > budget_bytes
+                    ):
+                        over_budget.append(f"{sampler_name} {name}")
+        finally:
+            samplers["http"].shutdown()
+
+    if args.check and over_budget:
+        print(f"over budget: {', '.join(over_budget)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
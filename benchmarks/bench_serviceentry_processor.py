@@ -0,0 +1,57 @@
+# © 2026 SolarWinds Worldwide, LLC. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with the License. You may obtain a copy of the License at:http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
+
+"""Benchmark ServiceEntrySpanProcessor on_start/on_end cost per entry span."""
+
+from __future__ import annotations
+
+import logging
+
+from opentelemetry.sdk.trace import TracerProvider
+
+from benchmarks._util import ns_per_call, report
+from solarwinds_apm.trace import ServiceEntrySpanProcessor
+
+
+def main() -> None:
+    # _on_ending runs after the SDK marks the span ended, so its attribute
+    # update is rejected with a warning; keep log output out of the timings
+    logging.getLogger("opentelemetry.sdk.trace").setLevel(logging.ERROR)
+
+    bare_tracer = TracerProvider().get_tracer(__name__)
+
+    provider = TracerProvider()
+    processor = ServiceEntrySpanProcessor()
+    provider.add_span_processor(processor)
+    tracer = provider.get_tracer(__name__)
+
+    def start_end_bare():
+        bare_tracer.start_span("entry").end()
+
+    def start_end_processor():
+        tracer.start_span("entry").end()
+
+    span = bare_tracer.start_span("entry")
+
+    def on_start_on_end():
+        processor.on_start(span)
+        processor.on_end(span)
+
+    bare = ns_per_call(start_end_bare, number=20_000)
+    processed = ns_per_call(start_end_processor, number=20_000)
+    report("span start/end, no processor", bare)
+    report("span start/end, ServiceEntrySpanProcessor", processed)
+    report("ServiceEntrySpanProcessor overhead", processed - bare)
+    report(
+        "ServiceEntrySpanProcessor on_start + on_end",
+        ns_per_call(on_start_on_end, number=20_000),
+    )
+    span.end()
+    assert not processor.context_tokens, "context tokens leaked"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# © 2026 SolarWinds Worldwide, LLC. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with the License. You may obtain a copy of the License at:http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
+
+"""Benchmark separate entry/response time processors against the fused one."""
+
+from __future__ import annotations
+
+import functools
+import logging
+from types import SimpleNamespace
+
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+
+from benchmarks._util import ns_per_call, report
+from solarwinds_apm.trace import (
+    ResponseTimeProcessor,
+    ServiceEntrySpanProcessor,
+    SolarWindsSpanProcessor,
+)
+
+
+def _config() -> SimpleNamespace:
+    return SimpleNamespace(
+        service_name="bench-service",
+        lambda_function_name=None,
+        get=lambda key, default=None: default,
+    )
+
+
+def main() -> None:
+    # _on_ending runs after the SDK marks the span ended, so its attribute
+    # update is rejected with a warning; keep log output out of the timings
+    logging.getLogger("opentelemetry.sdk.trace").setLevel(logging.ERROR)
+
+    tracer = TracerProvider().get_tracer(__name__)
+    entry = tracer.start_span("entry", kind=trace.SpanKind.SERVER)
+    child = tracer.start_span(
+        "child", context=trace.set_span_in_context(entry)
+    )
+
+    # Hooks are called directly, as the SDK's processor fan-out would, so
+    # that span creation cost does not drown out processor cost
+    separate = (ServiceEntrySpanProcessor(), ResponseTimeProcessor(_config()))
+    fused = SolarWindsSpanProcessor(_config())
+
+    def hooks_separate(span):
+        for processor in separate:
+            processor.on_start(span)
+        for processor in separate:
+            processor._on_ending(span)
+        for processor in separate:
+            processor.on_end(span)
+
+    def hooks_fused(span):
+        fused.on_start(span)
+        fused._on_ending(span)
+        fused.on_end(span)
+
+    for kind, span in (("entry", entry), ("child", child)):
+        report(
+            f"{kind} span hooks, separate processors",
+            ns_per_call(
+                functools.partial(hooks_separate, span), number=20_000
+            ),
+        )
+        report(
+            f"{kind} span hooks, SolarWindsSpanProcessor",
+            ns_per_call(functools.partial(hooks_fused, span), number=20_000),
+        )
+    child.end()
+    entry.end()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# © 2026 SolarWinds Worldwide, LLC. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with the License. You may obtain a copy of the License at:http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
+
+"""Benchmark every W3CTransformer method, with warm and cold format caches."""
+
+from __future__ import annotations
+
+import random
+
+from opentelemetry.trace import SpanContext, TraceFlags
+from opentelemetry.trace.span import TraceState
+
+from benchmarks._util import ns_per_call, report
+from solarwinds_apm.w3c_transformer import W3CTransformer
+
+_CONTEXTS = 8192
+
+
+def main() -> None:
+    span_context = SpanContext(
+        trace_id=random.getrandbits(128),
+        span_id=random.getrandbits(64),
+        is_remote=False,
+        trace_flags=TraceFlags(TraceFlags.SAMPLED),
+    )
+    # More distinct contexts than the cache holds, so each call misses
+    cold_contexts = [
+        SpanContext(
+            trace_id=random.getrandbits(128),
+            span_id=random.getrandbits(64),
+            is_remote=False,
+            trace_flags=TraceFlags(TraceFlags.SAMPLED),
+        )
+        for _ in range(_CONTEXTS)
+    ]
+    position = 0
+
+    def next_cold():
+        nonlocal position
+        position = (position + 1) % _CONTEXTS
+        return cold_contexts[position]
+
+    trace_state = TraceState(
+        [("sw", "1234567890abcdef-01"), ("xtrace_options_response", "x")]
+    )
+
+    benchmarks = {
+        "span_id_from_int": lambda: W3CTransformer.span_id_from_int(
+            span_context.span_id
+        ),
+        "span_id_from_sw": lambda: W3CTransformer.span_id_from_sw(
+            "1234567890abcdef-01"
+        ),
+        "trace_flags_from_int": lambda: W3CTransformer.trace_flags_from_int(1),
+        "traceparent_from_context": lambda: (
+            W3CTransformer.traceparent_from_context(span_context)
+        ),
+        "traceparent_from_context, cold": lambda: (
+            W3CTransformer.traceparent_from_context(next_cold())
+        ),
+        "sw_from_context": lambda: W3CTransformer.sw_from_context(
+            span_context
+        ),
+        "sw_from_context, cold": lambda: W3CTransformer.sw_from_context(
+            next_cold()
+        ),
+        "trace_and_span_id_from_context": lambda: (
+            W3CTransformer.trace_and_span_id_from_context(span_context)
+        ),
+        "trace_and_span_id_from_context, cold": lambda: (
+            W3CTransformer.trace_and_span_id_from_context(next_cold())
+        ),
+        "sw_from_span_and_decision": lambda: (
+            W3CTransformer.sw_from_span_and_decision(
+                span_context.span_id, "01"
+            )
+        ),
+        "remove_response_from_sw": lambda: (
+            W3CTransformer.remove_response_from_sw(trace_state)
+        ),
+        "next_cold (overhead of cold variants)": next_cold,
+    }
+    for name, func in benchmarks.items():
+        report(name, ns_per_call(func))
+
+
+if __name__ == "__main__":
+    main()
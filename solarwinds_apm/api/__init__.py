@@ -4,9 +4,10 @@
 #
 # Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
 
-"""SolarWinds APM public API for custom transaction naming and readiness checks."""
+"""SolarWinds APM public API for custom transaction naming, readiness checks and local percentiles."""
 
 import logging
+from collections.abc import Iterable
 
 from opentelemetry import context, trace
 from opentelemetry.trace import NoOpTracerProvider, get_tracer_provider
@@ -19,6 +20,10 @@ from solarwinds_apm.apm_constants import (
 from solarwinds_apm.oboe.http_sampler import HttpSampler
 from solarwinds_apm.oboe.json_sampler import JsonSampler
 from solarwinds_apm.sampler import ParentBasedSwSampler
+from solarwinds_apm.trace.response_time_percentiles import (
+    PERCENTILES_DEFAULT,
+    get_response_time_percentiles,
+)
 from solarwinds_apm.tracer_provider import SolarwindsTracerProvider
 from solarwinds_apm.w3c_transformer import W3CTransformer
 
@@ -131,3 +136,37 @@ def solarwinds_ready(
         type(tracer_provider),
     )
     return False
+
+
+def get_transaction_percentiles(
+    transaction_name: str,
+    quantiles: Iterable[float] = PERCENTILES_DEFAULT,
+) -> dict[float, float]:
+    """
+    Get recent response time percentiles of a transaction, in-process.
+
+    Percentiles are calculated from service entry spans that ended within the
+    last minute, with about 3% relative error. Requires
+    SW_APM_RESPONSE_TIME_PERCENTILES=true and response_time metrics enabled.
+
+    Parameters:
+    transaction_name (str): The transaction name, as set on service entry spans.
+    quantiles (Iterable[float]): Quantiles between 0 and 1. Defaults to p50, p95 and p99.
+
+    Returns:
+    dict[float, float]: Response time in milliseconds by quantile,
+          empty if not enabled or no recent spans for the transaction.
+
+    Example:
+        from solarwinds_apm.api import get_transaction_percentiles
+        p99 = get_transaction_percentiles("my-foo-name", quantiles=(0.99,)).get(0.99)
+        if p99 is not None and p99 > 500:
+            shed_load()
+    """
+    response_time_percentiles = get_response_time_percentiles()
+    if response_time_percentiles is None:
+        logger.debug(
+            "Cannot get transaction percentiles because SW_APM_RESPONSE_TIME_PERCENTILES not enabled"
+        )
+        return {}
+    return response_time_percentiles.percentiles(transaction_name, quantiles)
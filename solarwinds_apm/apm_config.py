@@ -75,6 +75,13 @@ class OboeTracingMode:
         return cls.OBOE_SETTINGS_UNSET
 
 
+def _snake_to_camel_case(key: str) -> str:
+    key_parts = key.split("_")
+    camel_head = key_parts[0]
+    camel_body = "".join(part.title() for part in key_parts[1:])
+    return f"{camel_head}{camel_body}"
+
+
 class SolarWindsApmConfig:
     """Manage SolarWinds APM configuration.
 
@@ -89,6 +96,13 @@ class SolarWindsApmConfig:
     _KEY_MASK_BAD_FORMAT_SHORT = "{}<invalid_format>"
     _SW_PREFIX = "sw_apm_"
     _logged_no_config_file = False
+    # Options that reload_cnf_file re-applies without a restart
+    _RELOADABLE_KEYS = ("tracing_mode", "trigger_trace")
+    # ((path, mtime_ns, size), file content, cnf_dict) of the last config
+    # file loaded
+    _cnf_cache: tuple[tuple[str, int, int], str | None, Any] | None = None
+    # Config file path last logged as not found
+    _logged_missing_cnf_filepath: str | None = None
 
     def __init__(
         self,
@@ -118,8 +132,17 @@ class SolarWindsApmConfig:
             "transaction_filters": [],
             "transaction_name": None,
             "export_metrics_enabled": True,
+            "response_time_percentiles": False,
+            "response_headers_trigger_trace_only": False,
+            "tracestate_capture": True,
+            "transaction_buckets": 0,
+            "target_traces_per_second": 0.0,
+            "self_profiling": False,
+            "config_reload_interval": 0,
             "log_filepath": "",
         }
+        self._applied_cnf_dict = None
+        self._reload_failed = False
         self.is_lambda = self.calculate_is_lambda()
         self.lambda_function_name = os.environ.get("AWS_LAMBDA_FUNCTION_NAME")
         self.agent_enabled = True
@@ -644,9 +667,20 @@ class SolarWindsApmConfig:
         return value if value is not None else default
 
     @classmethod
-    def get_cnf_dict(cls) -> Any:
+    def get_cnf_dict(cls, check_content: bool = False) -> Any:
         """Load Python dict from config file (JSON), if any.
 
+        The parsed file is memoized for the process by path, modification
+        time and size, so the distro and configurator share one load until
+        the file changes. Callers must not modify the returned dict.
+
+        Modification time and size miss an edit that keeps the size within
+        one tick of the file system's timestamps, so with check_content the
+        file is read again and its content compared as well.
+
+        Parameters:
+        check_content (bool): Compare file content even if modification time and size are unchanged. Defaults to False.
+
         Returns:
         Any: Configuration dictionary or None if no config file exists.
         """
@@ -664,30 +698,53 @@ class SolarWindsApmConfig:
                     cls._logged_no_config_file = True
                 return cnf_dict
 
+        cnf_abspath = os.path.abspath(cnf_filepath)
+        cache_key = None
+        try:
+            cnf_stat = os.stat(cnf_filepath)
+            cache_key = (cnf_abspath, cnf_stat.st_mtime_ns, cnf_stat.st_size)
+        except OSError:
+            pass
+        cached = cls._cnf_cache
+        if cached is not None and cached[0] == cache_key and not check_content:
+            return cached[2]
+
+        file_content = None
         try:
             with open(cnf_filepath, encoding="utf-8") as cnf_file:
-                try:
-                    file_content = cnf_file.read()
-                    cnf_dict = json.loads(file_content)
-                except ValueError as ex:
-                    logger.error(
-                        "Invalid config file, must be valid json. Ignoring: %s",
-                        ex,
-                    )
+                file_content = cnf_file.read()
         except FileNotFoundError as ex:
-            logger.error("Invalid config file path. Ignoring: %s", ex)
+            # Logged once per path, as the config watcher polls the file
+            if cls._logged_missing_cnf_filepath != cnf_abspath:
+                logger.error("Invalid config file path. Ignoring: %s", ex)
+                cls._logged_missing_cnf_filepath = cnf_abspath
+            else:
+                logger.debug("Invalid config file path. Ignoring: %s", ex)
+            return cnf_dict
+        cls._logged_missing_cnf_filepath = None
+        if (
+            cached is not None
+            and cached[0][0] == cnf_abspath
+            and cached[1] == file_content
+        ):
+            if cache_key is not None:
+                cls._cnf_cache = (cache_key, file_content, cached[2])
+            return cached[2]
+        try:
+            cnf_dict = json.loads(file_content)
+        except ValueError as ex:
+            logger.error(
+                "Invalid config file, must be valid json. Ignoring: %s",
+                ex,
+            )
+        if cache_key is not None:
+            cls._cnf_cache = (cache_key, file_content, cnf_dict)
         return cnf_dict
 
     def update_with_cnf_file(self) -> None:
         """Update configuration settings from config file (JSON), if any."""
-
-        def _snake_to_camel_case(key):
-            key_parts = key.split("_")
-            camel_head = key_parts[0]
-            camel_body = "".join(part.title() for part in key_parts[1:])
-            return f"{camel_head}{camel_body}"
-
         cnf_dict = self.get_cnf_dict()
+        self._applied_cnf_dict = cnf_dict
         if not cnf_dict:
             return
 
@@ -707,6 +764,56 @@ class SolarWindsApmConfig:
 
         self.update_transaction_filters(cnf_dict)
 
+    def reload_cnf_file(self) -> bool:
+        """Re-apply reloadable options if the config file changed.
+
+        Resets tracing_mode, trigger_trace and transaction_filters to their
+        defaults, then applies the config file and environment variables with
+        the same precedence as at startup. Like startup, reload uses only the
+        config file and environment variables, not keyword arguments. Other
+        options need a restart. A config file that cannot be read or parsed,
+        e.g. while it is being written, is ignored and the last applied
+        options are kept; this is logged as a warning once, then at debug
+        level until the file loads again.
+
+        Returns:
+        bool: True if the config file changed and options were re-applied.
+        """
+        cnf_dict = self.get_cnf_dict(check_content=True)
+        if cnf_dict is self._applied_cnf_dict:
+            return False
+        if not isinstance(cnf_dict, dict):
+            message = "Config file could not be loaded; keeping current tracing options"
+            if self._reload_failed:
+                logger.debug(message)
+            else:
+                logger.warning(message)
+                self._reload_failed = True
+            return False
+        self._applied_cnf_dict = cnf_dict
+        self._reload_failed = False
+
+        self.__config["tracing_mode"] = OboeTracingMode.get_oboe_trace_mode(
+            "unset"
+        )
+        self.__config["trigger_trace"] = (
+            OboeTracingMode.get_oboe_trigger_trace_mode("enabled")
+        )
+        # A new list, so that a Configuration built before is not changed
+        self.__config["transaction_filters"] = []
+        for key in self._RELOADABLE_KEYS:
+            val = cnf_dict.get(_snake_to_camel_case(key))
+            if val is not None:
+                self._set_config_value(key, val)
+        self.update_transaction_filters(cnf_dict)
+        for key in self._RELOADABLE_KEYS:
+            val = os.environ.get((self._SW_PREFIX + key).upper())
+            if val is not None:
+                self._set_config_value(key, val)
+
+        logger.debug("Reloaded ApmConfig as: %s", self)
+        return True
+
     def update_transaction_filters(self, cnf_dict: dict) -> None:
         """
         Update configured transaction_filters from configuration dictionary.
@@ -786,14 +893,20 @@ class SolarWindsApmConfig:
         if env_agent_enabled is not None:
             self.agent_enabled = env_agent_enabled
 
-        available_envvs = set(self.__config.keys())
-        for key in available_envvs:
+        # One pass over a snapshot of the SW_APM_* variables rather than a
+        # lookup per config key
+        env_prefix = self._SW_PREFIX.upper()
+        sw_environ = {
+            env: val
+            for env, val in os.environ.items()
+            if env.startswith(env_prefix) and env.isupper()
+        }
+        for env, val in sw_environ.items():
+            key = env[len(env_prefix) :].lower()
             if key == "transaction":
                 # we do not allow complex config options to be set via environment variables
                 continue
-            env = (self._SW_PREFIX + key).upper()
-            val = os.environ.get(env)
-            if val is not None:
+            if key in self.__config:
                 self._set_config_value(key, val)
 
     def update_with_kwargs(self, kwargs: dict) -> None:
@@ -935,4 +1048,10 @@ class SolarWindsApmConfig:
             trigger_trace_enabled=apm_config.get("trigger_trace") == 1,
             transaction_name=apm_config.get("transaction_name"),
             transaction_settings=transaction_settings,
+            tracestate_capture=apm_config.get("tracestate_capture")
+            is not False,
+            transaction_buckets=apm_config.get("transaction_buckets"),
+            target_traces_per_second=apm_config.get(
+                "target_traces_per_second"
+            ),
         )
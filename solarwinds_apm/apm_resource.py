@@ -8,21 +8,357 @@
 
 from __future__ import annotations
 
-from opentelemetry.sdk.resources import Resource
+import hashlib
+import json
+import logging
+import os
+import stat
+import sys
+import tempfile
+import threading
+import time
+from typing import TYPE_CHECKING
 
+from opentelemetry.sdk.resources import (
+    _DEFAULT_RESOURCE,
+    PROCESS_EXECUTABLE_NAME,
+    SERVICE_NAME,
+    Resource,
+    _build_resource_detectors,
+)
+
+from solarwinds_apm.k8s import MOUNTINFO_FILE, _pod_uid
 from solarwinds_apm.version import __version__
 
+if TYPE_CHECKING:
+    from opentelemetry.sdk.resources import ResourceDetector
+
+logger = logging.getLogger(__name__)
+
+# Deadline in seconds for all resource detectors together
+RESOURCE_DETECTION_TIMEOUT = 5.0
+
+# Opt-in on-disk cache of host-level detector results. Read from the
+# environment because detection runs before SolarWindsApmConfig exists.
+RESOURCE_CACHE_ENV = "SW_APM_RESOURCE_CACHE"
+RESOURCE_CACHE_DIR_ENV = "SW_APM_RESOURCE_CACHE_DIR"
+RESOURCE_CACHE_TTL_ENV = "SW_APM_RESOURCE_CACHE_TTL"
+RESOURCE_CACHE_TTL_DEFAULT = 3600
+
+_UAMS_MODULE = "solarwinds_apm.uams"
+
+BOOT_ID_FILE = "/proc/sys/kernel/random/boot_id"
+CGROUP_FILE = "/proc/self/cgroup"
+
+# Host-level detectors whose results are fixed for the boot, container and
+# pod of the cache key. Other detectors, including third-party ones, may
+# report per-process or per-deployment values, so always run.
+_CACHED_DETECTORS = frozenset(
+    (
+        "solarwinds_apm.uams.UamsResourceDetector",
+        "solarwinds_apm.k8s.K8sResourceDetector",
+        "opentelemetry.resource.detector.containerid.ContainerResourceDetector",
+        "opentelemetry.resource.detector.azure.vm.AzureVMResourceDetector",
+        "opentelemetry.sdk.extension.aws.resource.ec2.AwsEc2ResourceDetector",
+        "opentelemetry.sdk.extension.aws.resource.ecs.AwsEcsResourceDetector",
+        "opentelemetry.sdk.extension.aws.resource.eks.AwsEksResourceDetector",
+        "opentelemetry.sdk.extension.aws.resource.beanstalk.AwsBeanstalkResourceDetector",
+    )
+)
+
+
+def _detector_id(detector: ResourceDetector) -> str:
+    detector_type = type(detector)
+    return f"{detector_type.__module__}.{detector_type.__qualname__}"
+
+
+def _read_file(path: str) -> str:
+    try:
+        with open(path, encoding="utf-8") as file:
+            return file.read().strip()
+    # pylint: disable=broad-except
+    except Exception:
+        return ""
+
+
+def _resource_cache_key() -> str:
+    """Identify the boot, container and pod that cached results belong to.
+
+    Returns:
+        str: Hex digest of boot id, cgroup, hostname, pod uid and version.
+    """
+    parts = (
+        _read_file(BOOT_ID_FILE),
+        _read_file(CGROUP_FILE),
+        os.uname().nodename if hasattr(os, "uname") else "",
+        _pod_uid(MOUNTINFO_FILE) or "",
+        __version__,
+    )
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def _resource_cache_dir() -> str | None:
+    """Get the cache directory, created if missing, if only we can write it.
+
+    The default directory is per user under the temp directory. As cache
+    keys can be derived by other local users, a directory that is not a
+    real directory owned by the current user, or that others can access,
+    is not used.
+
+    Returns:
+        str | None: The cache directory, or None if it must not be used.
+    """
+    directory = os.environ.get(RESOURCE_CACHE_DIR_ENV)
+    if not directory:
+        suffix = f"-{os.getuid()}" if hasattr(os, "getuid") else ""
+        directory = os.path.join(
+            tempfile.gettempdir(), f"solarwinds-apm{suffix}"
+        )
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        dir_stat = os.lstat(directory)
+    except OSError as error:
+        logger.debug("Resource cache directory not usable", exc_info=error)
+        return None
+    if not stat.S_ISDIR(dir_stat.st_mode) or (
+        hasattr(os, "getuid")
+        and (dir_stat.st_uid != os.getuid() or dir_stat.st_mode & 0o077)
+    ):
+        logger.warning(
+            "Resource cache directory %s must be a directory accessible only by its owner, the current user; cache not used",
+            directory,
+        )
+        return None
+    return directory
+
+
+def _resource_cache_path(directory: str, key: str) -> str:
+    """Get the cache file for a key.
+
+    Args:
+        directory: Cache directory from _resource_cache_dir.
+        key: Cache key from _resource_cache_key.
+
+    Returns:
+        str: Path of the cache file.
+    """
+    return os.path.join(directory, f"resource-{key[:32]}.json")
+
+
+def _resource_cache_ttl() -> int:
+    try:
+        return int(
+            os.environ.get(RESOURCE_CACHE_TTL_ENV, RESOURCE_CACHE_TTL_DEFAULT)
+        )
+    except ValueError:
+        logger.debug("Invalid %s, using default", RESOURCE_CACHE_TTL_ENV)
+        return RESOURCE_CACHE_TTL_DEFAULT
+
 
-def create_detector_resource() -> Resource:
+def _load_cached_detections(path: str, key: str) -> dict[str, dict]:
+    """Load unexpired cached detector attributes.
+
+    Args:
+        path: Cache file path.
+        key: Cache key the file must have been written for.
+
+    Returns:
+        dict[str, dict]: Attributes by detector id, empty if none are usable.
+    """
+    try:
+        with open(path, encoding="utf-8") as file:
+            cached = json.load(file)
+        if cached["key"] != key or cached["expires"] <= time.time():
+            return {}
+        return {
+            detector_id: attributes
+            for detector_id, attributes in cached["detectors"].items()
+            if detector_id in _CACHED_DETECTORS
+        }
+    # pylint: disable=broad-except
+    except Exception as error:
+        logger.debug("Resource cache not used", exc_info=error)
+        return {}
+
+
+def _store_cached_detections(
+    path: str,
+    key: str,
+    detections: dict[str, dict],
+    ttl: int,
+) -> None:
+    """Atomically write detector attributes to the cache file.
+
+    Args:
+        path: Cache file path.
+        key: Cache key.
+        detections: Attributes by detector id.
+        ttl: Seconds until the cached attributes expire.
+    """
+    try:
+        directory = os.path.dirname(path)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(
+                    {
+                        "key": key,
+                        "expires": time.time() + ttl,
+                        "detectors": detections,
+                    },
+                    file,
+                )
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    # pylint: disable=broad-except
+    except Exception as error:
+        logger.debug("Could not write resource cache", exc_info=error)
+
+
+def _detect_all(
+    detectors: list[ResourceDetector],
+    timeout: float,
+) -> list[tuple[bool, Resource | Exception] | None]:
+    """Run detectors concurrently until all finish or the deadline passes.
+
+    Each detector runs on its own daemon thread so that a detector still
+    blocked on a network probe at the deadline cannot delay startup or
+    interpreter exit.
+
+    Args:
+        detectors: Resource detectors to run.
+        timeout: Deadline in seconds for all detectors together.
+
+    Returns:
+        list: Per detector, in order, (True, Resource) if detected,
+        (False, Exception) if it raised, or None if it missed the deadline.
+    """
+    results: list[tuple[bool, Resource | Exception] | None] = [None] * len(
+        detectors
+    )
+
+    def run(index: int, detector: ResourceDetector) -> None:
+        try:
+            results[index] = (True, detector.detect())
+        # pylint: disable=broad-exception-caught
+        except Exception as ex:
+            results[index] = (False, ex)
+
+    threads = [
+        threading.Thread(
+            target=run,
+            args=(index, detector),
+            name=f"solarwinds-resource-{type(detector).__name__}",
+            daemon=True,
+        )
+        for index, detector in enumerate(detectors)
+    ]
+    deadline = time.monotonic() + timeout
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(max(0.0, deadline - time.monotonic()))
+    # Copy so that detectors finishing late do not change what is merged
+    return list(results)
+
+
+def create_detector_resource(
+    timeout: float = RESOURCE_DETECTION_TIMEOUT,
+) -> Resource:
     """Create Resource from all configured detectors.
 
     Runs all detectors configured in OTEL_EXPERIMENTAL_RESOURCE_DETECTORS.
     Should be called after SolarWindsDistro has configured default detector list.
 
+    Detectors run concurrently and share one deadline, so startup waits for
+    the slowest detector rather than the sum of all of them. Results are
+    merged in configured order as with Resource.create, so later detectors
+    take precedence; detectors that fail or miss the deadline are skipped.
+
+    With SW_APM_RESOURCE_CACHE=true, results of the host-level detectors in
+    _CACHED_DETECTORS are cached on disk (SW_APM_RESOURCE_CACHE_DIR) for
+    SW_APM_RESOURCE_CACHE_TTL seconds, keyed by boot id, cgroup, hostname
+    and pod uid, so restarted processes skip their probes. All other
+    detectors always run.
+
+    Args:
+        timeout: Deadline in seconds for all detectors together.
+
     Returns:
         Resource: Resource with attributes from service_instance, process, OS, cloud, k8s, etc. detectors.
     """
-    return Resource.create()
+    detectors = _build_resource_detectors()
+
+    cache_key = cache_path = None
+    cached = {}
+    cache_dir = None
+    if os.environ.get(RESOURCE_CACHE_ENV, "").lower() == "true":
+        cache_dir = _resource_cache_dir()
+    if cache_dir:
+        cache_key = _resource_cache_key()
+        cache_path = _resource_cache_path(cache_dir, cache_key)
+        cached = _load_cached_detections(cache_path, cache_key)
+    pending = [
+        detector
+        for detector in detectors
+        if _detector_id(detector) not in cached
+    ]
+    detected = dict(zip(pending, _detect_all(pending, timeout), strict=True))
+
+    resource = _DEFAULT_RESOURCE
+    cache_misses = {}
+    for detector in detectors:
+        detector_id = _detector_id(detector)
+        if detector_id in cached:
+            resource = resource.merge(Resource(cached[detector_id]))
+            continue
+        result = detected[detector]
+        if result is None:
+            if detector.raise_on_error:
+                raise TimeoutError(
+                    f"Detector {detector} did not finish within {timeout} seconds"
+                )
+            logger.warning(
+                "Detector %s did not finish within %s seconds, skipping",
+                detector,
+                timeout,
+            )
+            continue
+        success, value = result
+        if not success:
+            if detector.raise_on_error:
+                raise value
+            logger.warning(
+                "Exception %s in detector %s, ignoring", value, detector
+            )
+            continue
+        resource = resource.merge(value)
+        # Deferred detectors finish in the background, see uams
+        if detector_id in _CACHED_DETECTORS and not getattr(
+            detector, "deferred", False
+        ):
+            cache_misses[detector_id] = dict(value.attributes)
+
+    if cache_path and cache_misses:
+        _store_cached_detections(
+            cache_path,
+            cache_key,
+            {**cached, **cache_misses},
+            _resource_cache_ttl(),
+        )
+
+    # Same fallback as Resource.create
+    if not resource.attributes.get(SERVICE_NAME):
+        default_service_name = "unknown_service"
+        executable_name = resource.attributes.get(PROCESS_EXECUTABLE_NAME)
+        if executable_name:
+            default_service_name += ":" + executable_name
+        resource = resource.merge(
+            Resource({SERVICE_NAME: default_service_name})
+        )
+    return resource
 
 
 def create_apm_resource(
@@ -46,6 +382,16 @@ def create_apm_resource(
         "service.name": service_name,
     }
 
+    # A deferred UAMS lookup can only exist if its detector module was
+    # imported, and importing it here would pull in requests
+    uams = sys.modules.get(_UAMS_MODULE)
+    if uams is not None:
+        uams_attributes = uams.background_attributes()
+        if uams_attributes:
+            detector_resource = detector_resource.merge(
+                Resource(uams_attributes)
+            )
+
     # Merge sw_attributes into detector_resource.
     # Resource.merge(other) means other.attributes override self.attributes on conflicts.
     # This preserves all detector attributes (cloud.*, k8s.*, etc.) while ensuring
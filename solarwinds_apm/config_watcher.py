@@ -0,0 +1,88 @@
+# © 2026 SolarWinds Worldwide, LLC. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with the License. You may obtain a copy of the License at:http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
+
+"""Reload of the config file into the live sampler without a restart."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+from solarwinds_apm.apm_config import SolarWindsApmConfig
+
+if TYPE_CHECKING:
+    from solarwinds_apm.sampler import ParentBasedSwSampler
+
+logger = logging.getLogger(__name__)
+
+CONFIG_WATCHER_JOIN_TIMEOUT = 5
+
+
+class ConfigWatcher:
+    """
+    Poll the config file and apply changed tracing options to the sampler.
+
+    Changes of tracingMode, triggerTrace and transactionSettings take effect
+    for the next sampling decisions; see SolarWindsApmConfig.reload_cnf_file.
+    """
+
+    def __init__(
+        self,
+        apm_config: SolarWindsApmConfig,
+        sampler: ParentBasedSwSampler,
+        interval: float,
+    ) -> None:
+        """
+        Initialize the ConfigWatcher.
+
+        Parameters:
+        apm_config (SolarWindsApmConfig): The configuration to reload.
+        sampler (ParentBasedSwSampler): The live sampler to update.
+        interval (float): Seconds between checks of the config file.
+        """
+        self._apm_config = apm_config
+        self._sampler = sampler
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start polling on a daemon thread."""
+        self._thread = threading.Thread(
+            target=self._run, name="solarwinds-config-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def shutdown(self) -> None:
+        """Stop polling and wait for the poll thread to terminate."""
+        self._stop.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=CONFIG_WATCHER_JOIN_TIMEOUT)
+
+    def check(self) -> bool:
+        """
+        Reload the config file and update the sampler if it changed.
+
+        Returns:
+        bool: True if the sampler was updated.
+        """
+        try:
+            if not self._apm_config.reload_cnf_file():
+                return False
+            self._sampler.update_configuration(
+                SolarWindsApmConfig.to_configuration(self._apm_config)
+            )
+        # pylint: disable=broad-except
+        except Exception as error:
+            logger.warning("Could not reload configuration: %s", error)
+            return False
+        logger.info("Reloaded tracing configuration from config file")
+        return True
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            self.check()
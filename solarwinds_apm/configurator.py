@@ -20,6 +20,7 @@ from opentelemetry.environment_variables import (
     OTEL_PROPAGATORS,
 )
 from opentelemetry.instrumentation.propagators import (
+    get_global_response_propagator,
     set_global_response_propagator,
 )
 from opentelemetry.metrics import set_meter_provider
@@ -61,14 +62,14 @@ from opentelemetry.util._importlib_metadata import entry_points
 from solarwinds_apm import apm_logging, apm_resource
 from solarwinds_apm.apm_config import SolarWindsApmConfig
 from solarwinds_apm.apm_constants import INTL_SWO_DEFAULT_PROPAGATORS
+from solarwinds_apm.config_watcher import ConfigWatcher
+from solarwinds_apm.propagator import SolarWindsPropagator
 from solarwinds_apm.response_propagator import (
     SolarWindsTraceResponsePropagator,
 )
 from solarwinds_apm.sampler import ParentBasedSwSampler
-from solarwinds_apm.trace import (
-    ResponseTimeProcessor,
-    ServiceEntrySpanProcessor,
-)
+from solarwinds_apm.self_profiling import SelfProfiler
+from solarwinds_apm.trace import SolarWindsSpanProcessor
 from solarwinds_apm.tracer_provider import SolarwindsTracerProvider
 
 solarwinds_apm_logger = apm_logging.logger
@@ -87,6 +88,9 @@ class SolarWindsConfigurator(_OTelSDKConfigurator):
         super().__init__()
         detector_resource = apm_resource.create_detector_resource()
         self.apm_config = SolarWindsApmConfig(otel_resource=detector_resource)
+        self.span_processor = None
+        self.propagators = []
+        self.config_watcher = None
 
     def _configure(self, **kwargs: int) -> None:
         """Configure SolarWinds APM and OpenTelemetry components.
@@ -136,13 +140,20 @@ class SolarWindsConfigurator(_OTelSDKConfigurator):
         # As of OTel 1.40.0, auto-instrumentation of Python logging (setup_logging_handler)
         # is handled by opentelemetry-instrumentation-logging via instrumentation, not by the
         # deprecated LoggingHandler in the SDK. So we pass _init_logging false.
-        _init_logging(log_exporters, resource, setup_logging_handler=False)
+        # Without log exporters (e.g. OTEL_LOGS_EXPORTER=none) there is
+        # nothing to export, so skip the LoggerProvider entirely.
+        if log_exporters:
+            _init_logging(log_exporters, resource, setup_logging_handler=False)
+        else:
+            logger.debug("No log exporters configured, skipping init of logs")
+            set_logger_provider(NoOpLoggerProvider())
 
         # Set up additional custom SW components
-        self._configure_service_entry_span_processor()
-        self._configure_response_time_processor()
+        self._configure_span_processor()
         self._configure_propagator()
         self._configure_response_propagator()
+        self._configure_self_profiling()
+        self._configure_config_watcher()
 
     def _custom_init_tracing(
         self,
@@ -241,20 +252,12 @@ class SolarWindsConfigurator(_OTelSDKConfigurator):
         )
         set_meter_provider(provider)
 
-    def _configure_service_entry_span_processor(
-        self,
-    ) -> None:
-        """Configure ServiceEntrySpanProcessor for the tracer provider."""
-        trace.get_tracer_provider().add_span_processor(
-            ServiceEntrySpanProcessor()
-        )
-
-    def _configure_response_time_processor(
+    def _configure_span_processor(
         self,
     ) -> None:
-        """Configure ResponseTimeProcessor if metrics exporters are configured.
+        """Configure SolarWindsSpanProcessor for the tracer provider.
 
-        Only configures if OTEL_METRICS_EXPORTER is set.
+        Records response_time metrics only if OTEL_METRICS_EXPORTER is set.
         """
         # SolarWindsDistro._configure does setdefault before this is called
         environ_exporter = os.environ.get(
@@ -264,13 +267,12 @@ class SolarWindsConfigurator(_OTelSDKConfigurator):
             logger.debug(
                 "No OTEL_METRICS_EXPORTER set, skipping init of metrics processors"
             )
-            return
 
-        trace.get_tracer_provider().add_span_processor(
-            ResponseTimeProcessor(
-                self.apm_config,
-            )
+        self.span_processor = SolarWindsSpanProcessor(
+            self.apm_config,
+            record_response_time=bool(environ_exporter),
         )
+        trace.get_tracer_provider().add_span_processor(self.span_processor)
 
     def _configure_propagator(self) -> None:
         """Configure CompositePropagator with SolarWinds and other propagators.
@@ -308,9 +310,81 @@ class SolarWindsConfigurator(_OTelSDKConfigurator):
             "Setting CompositePropagator with %s",
             environ_propagators_names,
         )
+        self.propagators = propagators
         set_global_textmap(CompositePropagator(propagators))
 
     def _configure_response_propagator(self) -> None:
         """Configure global HTTP response propagator."""
         # Set global HTTP response propagator
-        set_global_response_propagator(SolarWindsTraceResponsePropagator())
+        set_global_response_propagator(
+            SolarWindsTraceResponsePropagator(
+                trigger_trace_only=self.apm_config.get(
+                    "response_headers_trigger_trace_only"
+                )
+                is True,
+            )
+        )
+
+    def _configure_self_profiling(self) -> None:
+        """Profile SolarWinds APM components if self_profiling is enabled.
+
+        Times the sampler, the service entry and response time parts of the
+        span processor, and the SolarWinds propagators, exported as
+        sw.apm.internal.* metrics. Nothing is wrapped when disabled.
+        """
+        if self.apm_config.get("self_profiling") is not True:
+            return
+
+        profiler = SelfProfiler()
+        profiler.profile(
+            "sampler",
+            getattr(trace.get_tracer_provider(), "sampler", None),
+            "should_sample",
+        )
+        if self.span_processor:
+            profiler.profile(
+                "service_entry_processor",
+                self.span_processor.service_entry_processor,
+                "start_entry_span",
+                "finalize_entry_span",
+                "detach_entry_token",
+            )
+            profiler.profile(
+                "response_time_processor",
+                self.span_processor.response_time_processor,
+                "record_response_time",
+            )
+        # Only the SolarWinds propagator, not the others of the composite
+        for propagator in self.propagators:
+            if isinstance(propagator, SolarWindsPropagator):
+                profiler.profile("propagator", propagator, "extract", "inject")
+        profiler.profile(
+            "response_propagator", get_global_response_propagator(), "inject"
+        )
+        logger.debug("Self-profiling of SolarWinds APM components enabled")
+
+    def _configure_config_watcher(self) -> None:
+        """Reload tracing options from the config file if enabled.
+
+        Starts a ConfigWatcher when config_reload_interval is positive, so
+        that tracingMode, triggerTrace and transactionSettings changes apply
+        to the live sampler without a restart.
+        """
+        interval = self.apm_config.get("config_reload_interval")
+        if not interval or interval <= 0:
+            return
+
+        tracer_provider = trace.get_tracer_provider()
+        sampler = getattr(tracer_provider, "sampler", None)
+        if not isinstance(sampler, ParentBasedSwSampler):
+            logger.debug("Config reload needs ParentBasedSwSampler; skipping")
+            return
+
+        self.config_watcher = ConfigWatcher(self.apm_config, sampler, interval)
+        # Stopped with the tracer provider, which holds the sampler
+        if isinstance(tracer_provider, SolarwindsTracerProvider):
+            tracer_provider.config_watcher = self.config_watcher
+        self.config_watcher.start()
+        logger.debug(
+            "Reloading configuration from config file every %ss", interval
+        )
@@ -26,7 +26,11 @@ NAMESPACE_FILE = (
 )
 
 MOUNTINFO_FILE = "/proc/self/mountinfo"
+CGROUP_FILE = "/proc/self/cgroup"
 UID_REGEX = re.compile(r"[0-9a-f]{8}-(?:[0-9a-f]{4}-){3}[0-9a-f]{12}", re.I)
+CGROUP_UID_REGEX = re.compile(
+    r"pod([0-9a-f]{8}[-_](?:[0-9a-f]{4}[-_]){3}[0-9a-f]{12})", re.I
+)
 
 
 def _pod_name() -> str:
@@ -44,28 +48,47 @@ def _pod_name() -> str:
     return os.uname().nodename
 
 
-def _pod_uid(mount_info: str) -> str | None:
+def _pod_uid_from_cgroup(cgroup: str) -> str | None:
     """
-    Get Kubernetes pod UID from environment or mountinfo file.
+    Get Kubernetes pod UID from the cgroup file.
+
+    Only finds the UID on cgroup v1 or without a cgroup namespace, where
+    paths include the kubepods hierarchy.
 
     Parameters:
-    mount_info (str): Path to mountinfo file.
+    cgroup (str): Path to cgroup file.
 
     Returns:
     str | None: The pod UID if found, None otherwise.
     """
-    env = os.getenv(UID_ENV)
-    if env:
-        logger.debug("read pod uid from env")
-        return env
+    with suppress(Exception), open(cgroup, encoding="utf-8") as file:
+        for line in file:
+            if "kubepods" not in line:
+                continue
+            match = CGROUP_UID_REGEX.search(line)
+            if match:
+                # The systemd cgroup driver uses _ instead of -
+                return match.group(1).replace("_", "-")
+    return None
 
-    if os.name == "nt":
-        logger.debug("can't read pod uid on windows")
-        return None
 
+def _pod_uid_from_mountinfo(mount_info: str) -> str | None:
+    """
+    Get Kubernetes pod UID from the mountinfo file.
+
+    Parameters:
+    mount_info (str): Path to mountinfo file.
+
+    Returns:
+    str | None: The pod UID if found, None otherwise.
+    """
     with suppress(Exception), open(mount_info, encoding="utf-8") as file:
         for line in file:
-            fields = line.split(" ")
+            # Most lines are not kubelet mounts, skip them before splitting
+            if "kube" not in line:
+                continue
+
+            fields = line.split(" ", 10)
             if len(fields) < 10:
                 continue
 
@@ -79,11 +102,51 @@ def _pod_uid(mount_info: str) -> str | None:
             match = UID_REGEX.search(root)
             if match:
                 return match.group(0)
-
-    logger.debug("can't read pod uid")
     return None
 
 
+# Pod UID by (cgroup, mountinfo) path, which does not change for the
+# lifetime of the process and is inherited by its forks
+_pod_uid_cache: dict[tuple[str, str], str | None] = {}
+
+
+def _pod_uid(mount_info: str, cgroup: str = CGROUP_FILE) -> str | None:
+    """
+    Get Kubernetes pod UID from environment, cgroup file or mountinfo file.
+
+    Results from the files are memoized.
+
+    Parameters:
+    mount_info (str): Path to mountinfo file.
+    cgroup (str): Path to cgroup file. Defaults to CGROUP_FILE.
+
+    Returns:
+    str | None: The pod UID if found, None otherwise.
+    """
+    env = os.getenv(UID_ENV)
+    if env:
+        logger.debug("read pod uid from env")
+        return env
+
+    if os.name == "nt":
+        logger.debug("can't read pod uid on windows")
+        return None
+
+    key = (cgroup, mount_info)
+    if key in _pod_uid_cache:
+        return _pod_uid_cache[key]
+
+    uid = _pod_uid_from_cgroup(cgroup)
+    if uid:
+        logger.debug("read pod uid from cgroup")
+    else:
+        uid = _pod_uid_from_mountinfo(mount_info)
+        if not uid:
+            logger.debug("can't read pod uid")
+    _pod_uid_cache[key] = uid
+    return uid
+
+
 def _pod_namespace(namespace: str) -> str | None:
     """
     Get Kubernetes namespace from environment or namespace file.
@@ -111,7 +174,10 @@ class K8sResourceDetector(ResourceDetector):
     """Detect Kubernetes resource attributes when running in a Kubernetes environment."""
 
     def __init__(
-        self, namespace: str = NAMESPACE_FILE, mountinfo: str = MOUNTINFO_FILE
+        self,
+        namespace: str = NAMESPACE_FILE,
+        mountinfo: str = MOUNTINFO_FILE,
+        cgroup: str = CGROUP_FILE,
     ) -> None:
         """
         Initialize K8s Resource Detector.
@@ -119,10 +185,12 @@ class K8sResourceDetector(ResourceDetector):
         Parameters:
         namespace (str): Path to namespace file. Defaults to NAMESPACE_FILE.
         mountinfo (str): Path to mountinfo file. Defaults to MOUNTINFO_FILE.
+        cgroup (str): Path to cgroup file. Defaults to CGROUP_FILE.
         """
         super().__init__()
         self._namespace = namespace
         self._mountinfo = mountinfo
+        self._cgroup = cgroup
 
     def detect(self) -> Resource:
         """
@@ -139,7 +207,7 @@ class K8sResourceDetector(ResourceDetector):
         else:
             return Resource.get_empty()
 
-        uid = _pod_uid(self._mountinfo)
+        uid = _pod_uid(self._mountinfo, self._cgroup)
         if uid:
             attributes[ResourceAttributes.K8S_POD_UID] = uid
 
@@ -0,0 +1,46 @@
+# © 2026 SolarWinds Worldwide, LLC. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with the License. You may obtain a copy of the License at:http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
+
+"""Clock shared by sampler components, injectable for deterministic tests."""
+
+from __future__ import annotations
+
+import time
+
+
+class Clock:
+    """
+    Source of monotonic and wall clock time for sampler components.
+
+    Elapsed time, refill and expiry use monotonic so that wall clock jumps
+    do not affect them; wall clock time is only used where it is compared
+    with timestamps from outside the process. Both are vDSO reads on common
+    platforms, so they are read directly rather than cached by a ticker.
+
+    Components take an optional Clock and default to CLOCK; tests inject a
+    subclass with controllable time.
+    """
+
+    def monotonic(self) -> float:
+        """
+        Get monotonic time.
+
+        Returns:
+        float: Monotonic time in seconds.
+        """
+        return time.monotonic()
+
+    def time(self) -> float:
+        """
+        Get wall clock time.
+
+        Returns:
+        float: Seconds since the epoch.
+        """
+        return time.time()
+
+
+CLOCK = Clock()
@@ -67,6 +67,9 @@ class Configuration:
         trigger_trace_enabled: bool,
         transaction_name: Callable[[], str] | None,
         transaction_settings: list[TransactionSetting],
+        tracestate_capture: bool = True,
+        transaction_buckets: int = 0,
+        target_traces_per_second: float = 0.0,
     ):
         """
         Initialize Configuration.
@@ -80,6 +83,9 @@ class Configuration:
         trigger_trace_enabled (bool): Whether trigger tracing is enabled.
         transaction_name (Callable[[], str] | None): Function to get transaction name.
         transaction_settings (list[TransactionSetting]): List of transaction-specific settings.
+        tracestate_capture (bool): Whether to capture remote parent tracestate on entry spans. Defaults to True.
+        transaction_buckets (int): Max number of per-transaction token buckets, including the one shared once they run out, or 0 to share one bucket. Defaults to 0.
+        target_traces_per_second (float): Traces per second the sample rate is adapted to, or 0 to use the remote sample rate. Defaults to 0.0.
         """
         self._enabled = enabled
         self._service = service
@@ -89,6 +95,9 @@ class Configuration:
         self._trigger_trace_enabled = trigger_trace_enabled
         self._transaction_name = transaction_name
         self._transaction_settings = transaction_settings
+        self._tracestate_capture = tracestate_capture
+        self._transaction_buckets = transaction_buckets
+        self._target_traces_per_second = target_traces_per_second
 
     @property
     def enabled(self) -> bool:
@@ -154,5 +163,29 @@ class Configuration:
     def transaction_settings(self, value: list[TransactionSetting]):
         self._transaction_settings = value
 
+    @property
+    def tracestate_capture(self) -> bool:
+        return self._tracestate_capture
+
+    @tracestate_capture.setter
+    def tracestate_capture(self, value: bool):
+        self._tracestate_capture = value
+
+    @property
+    def transaction_buckets(self) -> int:
+        return self._transaction_buckets
+
+    @transaction_buckets.setter
+    def transaction_buckets(self, value: int):
+        self._transaction_buckets = value
+
+    @property
+    def target_traces_per_second(self) -> float:
+        return self._target_traces_per_second
+
+    @target_traces_per_second.setter
+    def target_traces_per_second(self, value: float):
+        self._target_traces_per_second = value
+
     def __str__(self):
-        return f"Configuration(enabled={self._enabled}, service={self._service}, collector={self._collector}, headers={self._headers}, tracing_mode={self._tracing_mode}, trigger_trace_enabled={self._trigger_trace_enabled}, transaction_name={self._transaction_name}, transaction_settings={self._transaction_settings})"
+        return f"Configuration(enabled={self._enabled}, service={self._service}, collector={self._collector}, headers={self._headers}, tracing_mode={self._tracing_mode}, trigger_trace_enabled={self._trigger_trace_enabled}, transaction_name={self._transaction_name}, transaction_settings={self._transaction_settings}, tracestate_capture={self._tracestate_capture}, transaction_buckets={self._transaction_buckets}, target_traces_per_second={self._target_traces_per_second})"
@@ -22,6 +22,7 @@ from opentelemetry.context import (
 )
 from opentelemetry.sdk.metrics import MeterProvider
 
+from solarwinds_apm.oboe.clock import CLOCK, Clock
 from solarwinds_apm.oboe.configuration import Configuration
 from solarwinds_apm.oboe.sampler import Sampler
 
@@ -46,6 +47,7 @@ class HttpSampler(Sampler):
         meter_provider: MeterProvider,
         config: Configuration,
         initial: dict[str, Any] | None,
+        clock: Clock = CLOCK,
     ):
         """
         Initialize the HttpSampler.
@@ -54,11 +56,13 @@ class HttpSampler(Sampler):
         meter_provider (MeterProvider): The OpenTelemetry meter provider for metrics.
         config (Configuration): The APM configuration.
         initial (dict[str, Any] | None): Initial sampling settings, if available.
+        clock (Clock): Clock used for sampling decisions. Defaults to CLOCK.
         """
         super().__init__(
             meter_provider=meter_provider,
             config=config,
             initial=initial,
+            clock=clock,
         )
         self._url = config.collector
         if not self._url.startswith("https://"):
@@ -12,7 +12,6 @@ import json
 import logging
 import os
 import tempfile
-import time
 from collections.abc import Sequence
 
 from opentelemetry.context import Context
@@ -22,6 +21,7 @@ from opentelemetry.sdk.trace.sampling import SamplingResult
 from opentelemetry.trace import Link, SpanKind, TraceState
 from typing_extensions import override
 
+from solarwinds_apm.oboe.clock import CLOCK, Clock
 from solarwinds_apm.oboe.configuration import Configuration
 from solarwinds_apm.oboe.sampler import Sampler
 
@@ -42,6 +42,7 @@ class JsonSampler(Sampler):
         meter_provider: MeterProvider,
         config: Configuration,
         path: str = PATH,
+        clock: Clock = CLOCK,
     ):
         """
         Initialize the JsonSampler.
@@ -50,14 +51,17 @@ class JsonSampler(Sampler):
         meter_provider (MeterProvider): The OpenTelemetry meter provider for metrics.
         config (Configuration): The APM configuration.
         path (str): Path to the JSON settings file. Defaults to PATH.
+        clock (Clock): Clock used for settings expiry. Defaults to CLOCK.
         """
         super().__init__(
             meter_provider=meter_provider,
             config=config,
             initial=None,
+            clock=clock,
         )
         self._path = path
-        self._expiry = time.time()
+        # Monotonic time at which the current settings expire
+        self._expiry = clock.monotonic()
         self._loop()
 
     @override
@@ -92,7 +96,7 @@ class JsonSampler(Sampler):
         Updates settings if within 10 seconds of expiry time.
         """
         # update if we're within 10s of expiry
-        if time.time() + 10 < self._expiry:
+        if self._clock.monotonic() + 10 < self._expiry:
             return
         try:
             unparsed = self._read()
@@ -112,7 +116,12 @@ class JsonSampler(Sampler):
 
         parsed = self.update_settings(unparsed[0])
         if parsed:
-            self._expiry = parsed.timestamp + parsed.ttl
+            self._expiry = (
+                self._clock.monotonic()
+                + parsed.timestamp
+                + parsed.ttl
+                - self._clock.time()
+            )
 
     def _read(self):
         """
@@ -7,7 +7,6 @@ from __future__ import annotations
 
 import logging
 import re
-import time
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
 
@@ -23,8 +22,11 @@ from opentelemetry.trace import Link, SpanKind, TraceFlags, get_current_span
 from opentelemetry.trace.span import Span, TraceState
 from typing_extensions import override
 
+from solarwinds_apm.apm_constants import INTL_SWO_X_OPTIONS_RESPONSE_KEY
+from solarwinds_apm.oboe.clock import CLOCK, Clock
 from solarwinds_apm.oboe.dice import _Dice
 from solarwinds_apm.oboe.metrics import Counters
+from solarwinds_apm.oboe.rate_controller import _RateController
 from solarwinds_apm.oboe.settings import (
     BucketType,
     Flags,
@@ -32,7 +34,7 @@ from solarwinds_apm.oboe.settings import (
     Settings,
     merge,
 )
-from solarwinds_apm.oboe.token_bucket import _TokenBucket
+from solarwinds_apm.oboe.token_bucket import _TokenBucket, _TransactionBuckets
 from solarwinds_apm.oboe.trace_options import (
     Auth,
     RequestHeaders,
@@ -44,7 +46,6 @@ from solarwinds_apm.oboe.trace_options import (
     stringify_trace_options_response,
     validate_signature,
 )
-from solarwinds_apm.w3c_transformer import W3CTransformer
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +71,7 @@ class SampleState:
         trace_state: str | None,
         headers: RequestHeaders,
         trace_options: TraceOptionsWithResponse | None,
+        transaction: str | None = None,
     ):
         self._decision = decision
         self._attributes = attributes
@@ -77,6 +79,7 @@ class SampleState:
         self._trace_state = trace_state
         self._headers = headers
         self._trace_options = trace_options
+        self._transaction = transaction
 
     @property
     def decision(self) -> Decision:
@@ -126,6 +129,14 @@ class SampleState:
     def trace_options(self, value: TraceOptionsWithResponse | None):
         self._trace_options = value
 
+    @property
+    def transaction(self) -> str | None:
+        return self._transaction
+
+    @transaction.setter
+    def transaction(self, value: str | None):
+        self._transaction = value
+
     def __str__(self):
         return (
             f"SampleState{{decision={self.decision}, "
@@ -133,19 +144,48 @@ class SampleState:
             f"settings={self.settings}, "
             f"trace_state={self.trace_state}, "
             f"headers={self.headers}, "
-            f"trace_options={self.trace_options}}}"
+            f"trace_options={self.trace_options}, "
+            f"transaction={self.transaction}}}"
         )
 
 
 class OboeSampler(Sampler, ABC):
-    def __init__(self, meter_provider: MeterProvider):
+    def __init__(self, meter_provider: MeterProvider, clock: Clock = CLOCK):
+        self._clock = clock
         self._counters = Counters(meter_provider=meter_provider)
         self._buckets = {
-            BucketType.DEFAULT: _TokenBucket(),
-            BucketType.TRIGGER_RELAXED: _TokenBucket(),
-            BucketType.TRIGGER_STRICT: _TokenBucket(),
+            BucketType.DEFAULT: _TokenBucket(clock=clock),
+            BucketType.TRIGGER_RELAXED: _TokenBucket(clock=clock),
+            BucketType.TRIGGER_STRICT: _TokenBucket(clock=clock),
         }
         self._settings: Settings | None = None
+        # (remote settings, monotonic expiry deadline, merged settings by
+        # local (tracing_mode, trigger_mode, sample_rate)), replaced when
+        # settings change
+        self._settings_cache: tuple[Settings, float, dict] | None = None
+        # Per-transaction shares of the default bucket, if enabled
+        self._transaction_buckets: _TransactionBuckets | None = None
+        # Controller of the dice rate for target traces per second, if set
+        self._rate_controller: _RateController | None = None
+        self._tracestate_capture = True
+
+    @property
+    def tracestate_capture(self) -> bool:
+        return self._tracestate_capture
+
+    @tracestate_capture.setter
+    def tracestate_capture(self, value: bool):
+        self._tracestate_capture = value
+
+    def capture_tracestate(self, trace_state: TraceState) -> str:
+        """
+        Serialize tracestate for capture, without any xtrace_options_response.
+        """
+        return ",".join(
+            f"{key}={value}"
+            for key, value in trace_state.items()
+            if key != INTL_SWO_X_OPTIONS_RESPONSE_KEY
+        )
 
     @property
     def counters(self):
@@ -163,6 +203,25 @@ class OboeSampler(Sampler, ABC):
     def buckets(self, new_buckets):
         self._buckets = new_buckets
 
+    @property
+    def transaction_buckets(self) -> _TransactionBuckets | None:
+        return self._transaction_buckets
+
+    @transaction_buckets.setter
+    def transaction_buckets(self, value: _TransactionBuckets | None):
+        if value is not None:
+            default = self.buckets[BucketType.DEFAULT]
+            value.update(capacity=default.capacity, rate=default.rate)
+        self._transaction_buckets = value
+
+    @property
+    def rate_controller(self) -> _RateController | None:
+        return self._rate_controller
+
+    @rate_controller.setter
+    def rate_controller(self, value: _RateController | None):
+        self._rate_controller = value
+
     @property
     def settings(self):
         return self._settings
@@ -195,16 +254,18 @@ class OboeSampler(Sampler, ABC):
             parent_span,
         )
 
-        # Capture the tracestate from the parent span and store it in the sample state
-        if (
-            parent_span.get_span_context().is_valid
-            and parent_span.get_span_context().trace_state is not None
-        ):
-            sample_state.attributes[TRACESTATE_CAPTURE_ATTRIBUTE] = (
-                W3CTransformer.remove_response_from_sw(
-                    parent_span.get_span_context().trace_state
-                ).to_header()
-            )
+        # Capture the tracestate from the parent span and store it in the
+        # sample state. ParentBased only calls this sampler for root spans
+        # and remote parents, so only entry spans get here.
+        if self.tracestate_capture:
+            parent_span_context = parent_span.get_span_context()
+            if (
+                parent_span_context.is_valid
+                and parent_span_context.trace_state is not None
+            ):
+                sample_state.attributes[TRACESTATE_CAPTURE_ATTRIBUTE] = (
+                    self.capture_tracestate(parent_span_context.trace_state)
+                )
 
         self.counters.request_count.add(1, {}, parent_context)
 
@@ -303,6 +364,11 @@ class OboeSampler(Sampler, ABC):
                 trace_state,
             ),
             trace_options=None,
+            transaction=(
+                self.transaction_name(name, kind, attributes)
+                if self._transaction_buckets is not None
+                else None
+            ),
         )
 
     def _process_trace_options(
@@ -342,6 +408,7 @@ class OboeSampler(Sampler, ABC):
                     else None
                 ),
                 sample_state.trace_options.timestamp,
+                now=self._clock.time(),
             )
             if sample_state.trace_options.response.auth != Auth.OK:
                 logger.debug(
@@ -503,9 +570,11 @@ class OboeSampler(Sampler, ABC):
         """
         Determine the sampling decision based on a dice roll.
         """
-        dice = _Dice(
-            rate=s.settings.sample_rate if s.settings else 0, scale=DICE_SCALE
-        )
+        rate = s.settings.sample_rate if s.settings else 0
+        rate_controller = self._rate_controller
+        if rate_controller is not None:
+            rate = rate_controller.sample_rate(rate)
+        dice = _Dice(rate=rate, scale=DICE_SCALE)
         s.attributes[SAMPLE_RATE_ATTRIBUTE] = dice.rate
         s.attributes[SAMPLE_SOURCE_ATTRIBUTE] = s.settings.sample_source
         self.counters.sample_count.add(1, {}, parent_context)
@@ -514,10 +583,22 @@ class OboeSampler(Sampler, ABC):
             bucket = self.buckets[BucketType.DEFAULT]
             s.attributes[BUCKET_CAPACITY_ATTRIBUTE] = bucket.capacity
             s.attributes[BUCKET_RATE_ATTRIBUTE] = bucket.rate
-            if bucket.consume():
-                logger.debug("sufficient capacity; record and sample")
-                self.counters.trace_count.add(1, {}, parent_context)
-                return Decision.RECORD_AND_SAMPLE
+            share = None
+            if (
+                self._transaction_buckets is not None
+                and s.transaction is not None
+            ):
+                share = self._transaction_buckets.get(s.transaction)
+            # The transaction's share is checked first so that a transaction
+            # over its share leaves the default bucket to the others, and
+            # refunded if the default bucket then refuses
+            if share is None or share.consume():
+                if bucket.consume():
+                    logger.debug("sufficient capacity; record and sample")
+                    self.counters.trace_count.add(1, {}, parent_context)
+                    return Decision.RECORD_AND_SAMPLE
+                if share is not None:
+                    share.refund()
             logger.debug("insufficient capacity; record only")
             self.counters.token_bucket_exhaustion_count.add(
                 1, {}, parent_context
@@ -559,6 +640,11 @@ class OboeSampler(Sampler, ABC):
                         ].capacity,
                         new_rate=self.settings.buckets[bucket_type].rate,
                     )
+            if self._transaction_buckets is not None:
+                default = self.buckets[BucketType.DEFAULT]
+                self._transaction_buckets.update(
+                    capacity=default.capacity, rate=default.rate
+                )
 
     def get_settings(
         self,
@@ -573,24 +659,43 @@ class OboeSampler(Sampler, ABC):
         """
         Get the settings within the ttl if available.
         """
-        if self.settings is None:
+        settings = self.settings
+        if settings is None:
             return None
-        if time.time() > self.settings.timestamp + self.settings.ttl:
+        cache = self._settings_cache
+        if cache is None or cache[0] is not settings:
+            # Convert the wall clock expiry to a monotonic deadline once per
+            # remote settings so the per-span check needs no wall clock
+            deadline = (
+                self._clock.monotonic()
+                + settings.timestamp
+                + settings.ttl
+                - self._clock.time()
+            )
+            cache = (settings, deadline, {})
+            self._settings_cache = cache
+        if self._clock.monotonic() > cache[1]:
             logger.debug("settings expired; removing")
             self.settings = None
             return None
-        return merge(
-            self.settings,
-            self.local_settings(
-                parent_context,
-                trace_id,
-                name,
-                kind,
-                attributes,
-                links,
-                trace_state,
-            ),
+        local = self.local_settings(
+            parent_context,
+            trace_id,
+            name,
+            kind,
+            attributes,
+            links,
+            trace_state,
         )
+        if local is None:
+            return settings
+        merged_by_local = cache[2]
+        key = (local.tracing_mode, local.trigger_mode, local.sample_rate)
+        merged = merged_by_local.get(key)
+        if merged is None:
+            merged = merge(settings, local)
+            merged_by_local[key] = merged
+        return merged
 
     @abstractmethod
     def local_settings(
@@ -607,6 +712,19 @@ class OboeSampler(Sampler, ABC):
         Interface for inherited class to override
         """
 
+    def transaction_name(
+        self,
+        name: str,
+        kind: SpanKind | None = None,
+        attributes: Attributes = None,
+    ) -> str:
+        """
+        Name of the transaction whose bucket limits a span's sampling.
+
+        Inherited classes may override this to group transactions.
+        """
+        return f"{SpanKind(kind or SpanKind.INTERNAL).name}:{name}"
+
     @abstractmethod
     def request_headers(
         self,
@@ -0,0 +1,117 @@
+# © 2026 SolarWinds Worldwide, LLC. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with the License. You may obtain a copy of the License at:http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
+
+"""Adaptive sample rate targeting a rate of traces per second."""
+
+from __future__ import annotations
+
+import math
+import os
+import threading
+import weakref
+
+from solarwinds_apm.oboe.clock import CLOCK, Clock
+
+RATE_CONTROLLER_INTERVAL = 1.0
+RATE_CONTROLLER_TIME_CONSTANT = 10.0
+
+
+class _RateController:
+    """
+    Feedback controller of the dice rate for a target of traces per second.
+
+    Counts the requests that reach the dice roll and keeps an exponentially
+    weighted moving average (EWMA) of their rate per second. The controlled
+    rate samples target / average of them, so the trace rate follows the
+    target as traffic rises and falls instead of being clipped by the token
+    bucket at peaks. The remote sample rate is the ceiling, so the
+    controller only ever lowers it.
+    """
+
+    def __init__(
+        self,
+        target: float,
+        scale: int,
+        interval: float = RATE_CONTROLLER_INTERVAL,
+        time_constant: float = RATE_CONTROLLER_TIME_CONSTANT,
+        clock: Clock = CLOCK,
+    ):
+        """
+        Initialize the _RateController.
+
+        Parameters:
+        target (float): The target traces per second.
+        scale (int): The dice scale of a sample rate of 100%.
+        interval (float): Seconds between updates of the average. Defaults to RATE_CONTROLLER_INTERVAL.
+        time_constant (float): Seconds for the average to move 63% of the way to a new request rate. Defaults to RATE_CONTROLLER_TIME_CONSTANT.
+        clock (Clock): Clock used for the request rate. Defaults to CLOCK.
+        """
+        self._target = target
+        self._scale = scale
+        self._interval = interval
+        self._time_constant = time_constant
+        self._clock = clock
+        self._count = 0
+        self._window_start = clock.monotonic()
+        # Average requests per second, None until the first interval ends
+        self._average: float | None = None
+        self._rate = scale
+        self._lock = threading.Lock()
+        if hasattr(os, "register_at_fork"):
+            weak_reinit = weakref.WeakMethod(self._at_fork_reinit)
+            # pylint: disable=unnecessary-lambda
+            os.register_at_fork(after_in_child=lambda: weak_reinit()())
+
+    @property
+    def target(self) -> float:
+        return self._target
+
+    @property
+    def average(self) -> float | None:
+        return self._average
+
+    def _at_fork_reinit(self):
+        self._lock = threading.Lock()
+        self._count = 0
+        self._window_start = self._clock.monotonic()
+
+    def _update(self, now: float):
+        """
+        Fold the ending interval into the average; caller holds the lock.
+        """
+        elapsed = now - self._window_start
+        observed = self._count / elapsed
+        if self._average is None:
+            self._average = observed
+        else:
+            # Weight by elapsed time so idle gaps decay the average as if
+            # every interval in them had been observed
+            weight = 1 - math.exp(-elapsed / self._time_constant)
+            self._average += weight * (observed - self._average)
+        self._count = 0
+        self._window_start = now
+        if self._average <= self._target:
+            self._rate = self._scale
+        else:
+            self._rate = int(self._scale * self._target / self._average)
+
+    def sample_rate(self, ceiling: int) -> int:
+        """
+        Count one request and get the controlled sample rate for it.
+
+        Parameters:
+        ceiling (int): The sample rate of the remote settings.
+
+        Returns:
+        int: The controlled sample rate, at most the ceiling.
+        """
+        with self._lock:
+            now = self._clock.monotonic()
+            if now - self._window_start >= self._interval:
+                self._update(now)
+            self._count += 1
+            rate = self._rate
+        return min(ceiling, rate)
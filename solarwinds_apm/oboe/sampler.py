@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 import logging
+import re
 import threading
 from collections.abc import Sequence
 from typing import Any
@@ -42,22 +43,33 @@ from solarwinds_apm.apm_constants import (
     INTL_SWO_X_OPTIONS_KEY,
     INTL_SWO_X_OPTIONS_RESPONSE_KEY,
 )
+from solarwinds_apm.oboe.clock import CLOCK, Clock
 from solarwinds_apm.oboe.configuration import Configuration
-from solarwinds_apm.oboe.oboe_sampler import OboeSampler
+from solarwinds_apm.oboe.oboe_sampler import DICE_SCALE, OboeSampler
+from solarwinds_apm.oboe.rate_controller import _RateController
 from solarwinds_apm.oboe.settings import (
     BucketSettings,
     BucketType,
     Flags,
     LocalSettings,
+    RemoteTransactionSetting,
     SampleSource,
     Settings,
     TracingMode,
 )
+from solarwinds_apm.oboe.token_bucket import _TransactionBuckets
 from solarwinds_apm.oboe.trace_options import RequestHeaders, ResponseHeaders
+from solarwinds_apm.oboe.transaction_name_calculator import (
+    resolve_transaction_name,
+)
 from solarwinds_apm.traceoptions import XTraceOptions
 
 logger = logging.getLogger(__name__)
 
+# Max transaction identifiers whose local settings are cached per settings
+TRANSACTION_CACHE_MAX = 1024
+MAX_SAMPLE_RATE = 1_000_000
+
 
 def http_span_metadata(kind: SpanKind, attributes: Attributes):
     """
@@ -99,6 +111,55 @@ def http_span_metadata(kind: SpanKind, attributes: Attributes):
     }
 
 
+def parse_transaction_settings(
+    unparsed: Any,
+) -> list[RemoteTransactionSetting]:
+    """
+    Parses and compiles per-transaction overrides of the settings payload.
+
+    Each entry has a "regex" and a "tracing" of "enabled" or "disabled", a
+    sample rate "value" from 0 to 1000000, or both. Invalid entries are
+    skipped.
+    """
+    if not isinstance(unparsed, list):
+        return []
+    transaction_settings = []
+    for entry in unparsed:
+        if not isinstance(entry, dict) or not isinstance(
+            entry.get("regex"), str
+        ):
+            logger.debug("invalid transaction setting %s", entry)
+            continue
+        tracing = {"enabled": True, "disabled": False}.get(
+            entry.get("tracing")
+        )
+        sample_rate = entry.get("value")
+        if sample_rate is not None:
+            try:
+                sample_rate = int(sample_rate)
+            except (TypeError, ValueError):
+                sample_rate = None
+            if sample_rate is None or not (
+                0 <= sample_rate <= MAX_SAMPLE_RATE
+            ):
+                logger.debug("invalid transaction setting %s", entry)
+                continue
+        if tracing is None and sample_rate is None:
+            logger.debug("invalid transaction setting %s", entry)
+            continue
+        try:
+            regex = re.compile(entry["regex"])
+        except re.error:
+            logger.debug("invalid transaction setting %s", entry)
+            continue
+        transaction_settings.append(
+            RemoteTransactionSetting(
+                regex=regex, tracing=tracing, sample_rate=sample_rate
+            )
+        )
+    return transaction_settings
+
+
 def parse_settings(unparsed: Any) -> tuple[Settings, str | None] | None:
     """
     Parses settings.
@@ -159,47 +220,179 @@ def parse_settings(unparsed: Any) -> tuple[Settings, str | None] | None:
             ttl=ttl,
             buckets=buckets,
             signature_key=signature_key,
+            transaction_settings=parse_transaction_settings(
+                unparsed.get("transactionSettings")
+            ),
         ),
         warning,
     )
 
 
+class _LocalState:
+    """
+    Local tracing configuration of a Sampler, replaced as a whole.
+    """
+
+    __slots__ = (
+        "tracing_mode",
+        "trigger_mode",
+        "transaction_settings",
+        "default_local_settings",
+        "transaction_local_settings",
+    )
+
+    def __init__(self, config: Configuration):
+        if config.tracing_mode is not None:
+            self.tracing_mode = (
+                TracingMode.ALWAYS
+                if config.tracing_mode
+                else TracingMode.NEVER
+            )
+        else:
+            self.tracing_mode = None
+        self.trigger_mode = config.trigger_trace_enabled
+        self.transaction_settings = config.transaction_settings
+        # Local settings are static, so share one instance per outcome
+        self.default_local_settings = LocalSettings(
+            tracing_mode=self.tracing_mode, trigger_mode=self.trigger_mode
+        )
+        self.transaction_local_settings = {
+            tracing: LocalSettings(
+                tracing_mode=(
+                    TracingMode.ALWAYS if tracing else TracingMode.NEVER
+                ),
+                trigger_mode=self.trigger_mode,
+            )
+            for tracing in (True, False)
+        }
+
+
 class Sampler(OboeSampler):
     def __init__(
         self,
         meter_provider: MeterProvider,
         config: Configuration,
         initial: Any,
+        clock: Clock = CLOCK,
     ):
-        super().__init__(meter_provider=meter_provider)
-        if config.tracing_mode is not None:
-            self._tracing_mode = (
-                TracingMode.ALWAYS
-                if config.tracing_mode
-                else TracingMode.NEVER
-            )
-        else:
-            self._tracing_mode = None
-        self._trigger_mode = config.trigger_trace_enabled
-        self._transaction_settings = config.transaction_settings
+        super().__init__(meter_provider=meter_provider, clock=clock)
+        # (local state, remote settings, local settings by transaction)
+        self._transaction_cache: (
+            tuple[_LocalState, Settings | None, dict[str, LocalSettings]]
+            | None
+        ) = None
+        # Route group transaction names by HTTP path
+        self._transaction_names: dict[str, str] = {}
+        self.update_configuration(config)
         self._ready = threading.Event()
         if initial:
             self.update_settings(initial)
 
     def __str__(self) -> str:
-        return f"Sampler{self._tracing_mode}({self._trigger_mode}) {super().__str__(self)}"
+        return f"Sampler{self.tracing_mode}({self.trigger_mode}) {super().__str__(self)}"
 
     @property
     def tracing_mode(self):
-        return self._tracing_mode
+        return self._local.tracing_mode
 
     @property
     def trigger_mode(self):
-        return self._trigger_mode
+        return self._local.trigger_mode
 
     @property
     def transaction_settings(self):
-        return self._transaction_settings
+        return self._local.transaction_settings
+
+    def update_configuration(self, config: Configuration) -> None:
+        """
+        Applies the local tracing configuration, e.g. after a config reload.
+
+        The new state replaces the old one in a single assignment, so
+        concurrent sampling decisions see either the old or the new
+        configuration, never a mix.
+        """
+        self._local = _LocalState(config)
+        self.tracestate_capture = config.tracestate_capture
+        max_count = config.transaction_buckets
+        if max_count <= 0:
+            self.transaction_buckets = None
+        elif (
+            self.transaction_buckets is None
+            or self.transaction_buckets.max_count != max_count
+        ):
+            self.transaction_buckets = _TransactionBuckets(
+                max_count=max_count, clock=self._clock
+            )
+        target = config.target_traces_per_second
+        if not target > 0:
+            self.rate_controller = None
+        elif (
+            self.rate_controller is None
+            or self.rate_controller.target != target
+        ):
+            self.rate_controller = _RateController(
+                target=target, scale=DICE_SCALE, clock=self._clock
+            )
+
+    @override
+    def transaction_name(
+        self,
+        name: str,
+        kind: SpanKind | None = None,
+        attributes: Attributes = None,
+    ) -> str:
+        """
+        Groups HTTP server spans by the first two segments of their path, as
+        in their transaction names, and other spans by kind and name.
+        """
+        meta = http_span_metadata(kind, attributes or {})
+        if not meta["http"]:
+            return super().transaction_name(name, kind, attributes)
+        path = meta["path"]
+        transaction = self._transaction_names.get(path)
+        if transaction is None:
+            transaction = resolve_transaction_name(path)
+            if len(self._transaction_names) >= TRANSACTION_CACHE_MAX:
+                self._transaction_names.clear()
+            self._transaction_names[path] = transaction
+        return transaction
+
+    def _transaction_local_settings(
+        self,
+        local: _LocalState,
+        settings: Settings | None,
+        identifier: str,
+    ) -> LocalSettings:
+        """
+        Matches a transaction against local and remote transaction settings.
+        """
+        local_settings = local.default_local_settings
+        for transaction_setting in local.transaction_settings or ():
+            if transaction_setting.matcher and transaction_setting.matcher(
+                identifier
+            ):
+                local_settings = local.transaction_local_settings[
+                    bool(transaction_setting.tracing)
+                ]
+                break
+        if settings is None:
+            return local_settings
+        # Remote overrides take precedence over local transaction settings
+        for remote_setting in settings.transaction_settings:
+            if remote_setting.regex.match(identifier):
+                tracing_mode = local_settings.tracing_mode
+                if remote_setting.tracing is not None:
+                    tracing_mode = (
+                        TracingMode.ALWAYS
+                        if remote_setting.tracing
+                        else TracingMode.NEVER
+                    )
+                return LocalSettings(
+                    tracing_mode=tracing_mode,
+                    trigger_mode=local_settings.trigger_mode,
+                    sample_rate=remote_setting.sample_rate,
+                )
+        return local_settings
 
     def wait_until_ready(self, timeout: int) -> bool:
         """
@@ -221,29 +414,32 @@ class Sampler(OboeSampler):
         """
         Returns local settings.
         """
-        settings = LocalSettings(
-            tracing_mode=self.tracing_mode, trigger_mode=self.trigger_mode
-        )
-        if (
-            self.transaction_settings is None
-            or len(self.transaction_settings) == 0
+        local = self._local
+        settings = self.settings
+        if not local.transaction_settings and (
+            settings is None or not settings.transaction_settings
         ):
-            return settings
+            return local.default_local_settings
         meta = http_span_metadata(kind, attributes)
         identifier = (
             meta["url"] if meta["http"] else f"{SpanKind(kind).name}:{name}"
         )
-        for transaction_setting in self.transaction_settings:
-            if transaction_setting.matcher and transaction_setting.matcher(
-                identifier
-            ):
-                settings.tracing_mode = (
-                    TracingMode.ALWAYS
-                    if transaction_setting.tracing
-                    else TracingMode.NEVER
-                )
-                break
-        return settings
+        # Matches are cached per local configuration and remote settings, so
+        # known transactions run no matchers until either changes
+        cache = self._transaction_cache
+        if cache is None or cache[0] is not local or cache[1] is not settings:
+            cache = (local, settings, {})
+            self._transaction_cache = cache
+        by_identifier = cache[2]
+        local_settings = by_identifier.get(identifier)
+        if local_settings is None:
+            local_settings = self._transaction_local_settings(
+                local, settings, identifier
+            )
+            if len(by_identifier) >= TRANSACTION_CACHE_MAX:
+                by_identifier.clear()
+            by_identifier[identifier] = local_settings
+        return local_settings
 
     @override
     def request_headers(
@@ -5,6 +5,7 @@
 # Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
 from __future__ import annotations
 
+import re
 from enum import Enum, IntEnum
 
 
@@ -63,6 +64,46 @@ class BucketSettings:
         return f"BucketSettings(capacity={self._capacity}, rate={self._rate})"
 
 
+class RemoteTransactionSetting:
+    """
+    Per-transaction override pushed in the settings payload.
+    """
+
+    def __init__(
+        self,
+        regex: re.Pattern,
+        tracing: bool | None = None,
+        sample_rate: int | None = None,
+    ):
+        self._regex = regex
+        self._tracing = tracing
+        self._sample_rate = sample_rate
+
+    @property
+    def regex(self):
+        return self._regex
+
+    @property
+    def tracing(self):
+        return self._tracing
+
+    @property
+    def sample_rate(self):
+        return self._sample_rate
+
+    def __eq__(self, other):
+        if not isinstance(other, RemoteTransactionSetting):
+            return NotImplemented
+        return (
+            self._regex == other._regex
+            and self._tracing == other._tracing
+            and self._sample_rate == other._sample_rate
+        )
+
+    def __str__(self):
+        return f"RemoteTransactionSetting(regex={self._regex.pattern}, tracing={self._tracing}, sample_rate={self._sample_rate})"
+
+
 class Settings:
     def __init__(
         self,
@@ -73,6 +114,7 @@ class Settings:
         signature_key: str | None,
         timestamp: int,
         ttl: int,
+        transaction_settings: list[RemoteTransactionSetting] | None = None,
     ):
         self._sample_rate = sample_rate
         self._sample_source = sample_source
@@ -81,6 +123,7 @@ class Settings:
         self._signature_key = signature_key
         self._timestamp = timestamp
         self._ttl = ttl
+        self._transaction_settings = transaction_settings or []
 
     @property
     def sample_rate(self):
@@ -138,6 +181,14 @@ class Settings:
     def ttl(self, new_ttl):
         self._ttl = new_ttl
 
+    @property
+    def transaction_settings(self):
+        return self._transaction_settings
+
+    @transaction_settings.setter
+    def transaction_settings(self, new_transaction_settings):
+        self._transaction_settings = new_transaction_settings
+
     def __eq__(self, other):
         if not isinstance(other, Settings):
             return NotImplemented
@@ -149,6 +200,7 @@ class Settings:
             and self._signature_key == other._signature_key
             and self._timestamp == other._timestamp
             and self._ttl == other._ttl
+            and self._transaction_settings == other._transaction_settings
         )
 
     def __str__(self):
@@ -159,9 +211,15 @@ class Settings:
 
 
 class LocalSettings:
-    def __init__(self, tracing_mode: TracingMode | None, trigger_mode: bool):
+    def __init__(
+        self,
+        tracing_mode: TracingMode | None,
+        trigger_mode: bool,
+        sample_rate: int | None = None,
+    ):
         self._tracing_mode = tracing_mode
         self._trigger_mode = trigger_mode
+        self._sample_rate = sample_rate
 
     @property
     def tracing_mode(self):
@@ -179,16 +237,25 @@ class LocalSettings:
     def trigger_mode(self, new_trigger_mode):
         self._trigger_mode = new_trigger_mode
 
+    @property
+    def sample_rate(self):
+        return self._sample_rate
+
+    @sample_rate.setter
+    def sample_rate(self, new_sample_rate):
+        self._sample_rate = new_sample_rate
+
     def __eq__(self, other):
         if not isinstance(other, LocalSettings):
             return NotImplemented
         return (
             self._tracing_mode == other._tracing_mode
             and self._trigger_mode == other._trigger_mode
+            and self._sample_rate == other._sample_rate
         )
 
     def __str__(self):
-        return f"LocalSettings(tracing_mode={self._tracing_mode}, trigger_mode={self._trigger_mode})"
+        return f"LocalSettings(tracing_mode={self._tracing_mode}, trigger_mode={self._trigger_mode}, sample_rate={self._sample_rate})"
 
 
 def merge(
@@ -222,11 +289,16 @@ def _merge(remote: Settings, local: LocalSettings) -> Settings:
         flags |= Flags.OVERRIDE
 
     return Settings(
-        sample_rate=remote.sample_rate,
+        sample_rate=(
+            local.sample_rate
+            if local.sample_rate is not None
+            else remote.sample_rate
+        ),
         sample_source=remote.sample_source,
         flags=flags,
         buckets=remote.buckets,
         signature_key=remote.signature_key,
         timestamp=remote.timestamp,
         ttl=remote.ttl,
+        transaction_settings=remote.transaction_settings,
     )
@@ -8,9 +8,10 @@
 
 import os
 import threading
-import time
 import weakref
 
+from solarwinds_apm.oboe.clock import CLOCK, Clock
+
 
 class _TokenBucket:
     """
@@ -20,18 +21,25 @@ class _TokenBucket:
     handles process forking correctly.
     """
 
-    def __init__(self, capacity: float = 0, rate: float = 0):
+    def __init__(
+        self,
+        capacity: float = 0,
+        rate: float = 0,
+        clock: Clock = CLOCK,
+    ):
         """
         Initialize the TokenBucket.
 
         Parameters:
         capacity (float): The maximum number of tokens the bucket can hold. Defaults to 0.
         rate (float): The rate at which tokens are added per second. Defaults to 0.
+        clock (Clock): Clock used for refill. Defaults to CLOCK.
         """
         self._capacity = capacity
         self._rate = rate
         self._tokens = capacity
-        self._last_used = time.time()
+        self._clock = clock
+        self._last_used = clock.monotonic()
         self._lock = threading.Lock()
         self._pid = os.getpid()
         # Register fork handler to reinitialize lock in child processes.
@@ -64,7 +72,7 @@ class _TokenBucket:
 
         Updates tokens based on the rate and time elapsed since last use.
         """
-        now = time.time()
+        now = self._clock.monotonic()
         elapsed = now - self._last_used
         self._last_used = now
         self._tokens += elapsed * self._rate
@@ -80,7 +88,7 @@ class _TokenBucket:
         """
         self._lock = threading.Lock()
         self._tokens = self._capacity
-        self._last_used = time.time()
+        self._last_used = self._clock.monotonic()
         self._pid = os.getpid()
 
     def update(self, new_capacity=None, new_rate=None):
@@ -121,5 +129,119 @@ class _TokenBucket:
                 return True
             return False
 
+    def refund(self, tokens=1):
+        """
+        Return consumed tokens to the bucket, up to its capacity.
+
+        Parameters:
+        tokens (int): The number of tokens to return. Defaults to 1.
+        """
+        with self._lock:
+            self._calculate_tokens()
+            self._tokens = min(self._tokens + tokens, self._capacity)
+
     def __str__(self):
         return f"_TokenBucket(capacity={self._capacity}, rate={self._rate})"
+
+
+TRANSACTION_BUCKETS_OTHER = "other"
+
+
+class _TransactionBuckets:
+    """
+    Per-transaction token buckets sharing the default bucket's budget.
+
+    Buckets are created on first use of a transaction. Each of the N active
+    transactions gets 1/N of the budget's rate and capacity, so one busy
+    transaction cannot use up the tokens of the others. At most max_count
+    buckets exist: once max_count - 1 transactions have their own bucket,
+    further transactions share the last one. Transactions unused between
+    two budget updates are dropped at the second update.
+    """
+
+    def __init__(self, max_count: int, clock: Clock = CLOCK):
+        """
+        Initialize the _TransactionBuckets.
+
+        Parameters:
+        max_count (int): The maximum number of buckets, including the shared one.
+        clock (Clock): Clock used for refill. Defaults to CLOCK.
+        """
+        self._max_count = max_count
+        self._clock = clock
+        self._capacity = 0.0
+        self._rate = 0.0
+        self._buckets: dict[str, _TokenBucket] = {}
+        self._used: set[str] = set()
+        self._lock = threading.Lock()
+        if hasattr(os, "register_at_fork"):
+            weak_reinit = weakref.WeakMethod(self._at_fork_reinit)
+            # pylint: disable=unnecessary-lambda
+            os.register_at_fork(after_in_child=lambda: weak_reinit()())
+
+    @property
+    def max_count(self) -> int:
+        return self._max_count
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def _at_fork_reinit(self):
+        self._lock = threading.Lock()
+
+    def _rescale(self):
+        """
+        Share the budget equally between the buckets; caller holds the lock.
+        """
+        count = max(1, len(self._buckets))
+        # A bucket needs one token to sample, so keep each share at least
+        # one token deep; the default bucket still caps the total
+        capacity = max(1.0, self._capacity / count) if self._capacity else 0
+        for bucket in self._buckets.values():
+            bucket.update(new_capacity=capacity, new_rate=self._rate / count)
+
+    def get(self, transaction: str) -> _TokenBucket:
+        """
+        Get the bucket of a transaction, creating it on first use.
+
+        Parameters:
+        transaction (str): The transaction name.
+
+        Returns:
+        _TokenBucket: The bucket of the transaction.
+        """
+        # Lookup and marking as used are one critical section with update,
+        # so a bucket returned here is not dropped by a concurrent update
+        with self._lock:
+            bucket = self._buckets.get(transaction)
+            if bucket is None:
+                # Keep a slot for the shared bucket within max_count
+                named = len(self._buckets) - (
+                    TRANSACTION_BUCKETS_OTHER in self._buckets
+                )
+                if named >= self._max_count - 1:
+                    transaction = TRANSACTION_BUCKETS_OTHER
+                    bucket = self._buckets.get(transaction)
+                if bucket is None:
+                    bucket = _TokenBucket(clock=self._clock)
+                    self._buckets[transaction] = bucket
+                    self._rescale()
+            self._used.add(transaction)
+        return bucket
+
+    def update(self, capacity: float, rate: float):
+        """
+        Update the shared budget and drop buckets unused since the last one.
+
+        Parameters:
+        capacity (float): The total capacity shared by the buckets.
+        rate (float): The total rate shared by the buckets.
+        """
+        with self._lock:
+            used, self._used = self._used, set()
+            for transaction in list(self._buckets):
+                if transaction not in used:
+                    del self._buckets[transaction]
+            self._capacity = capacity
+            self._rate = rate
+            self._rescale()
@@ -368,13 +368,18 @@ def stringify_trace_options_response(
     return ";".join(f"{k}={v}" for k, v in kvs.items() if v is not None)
 
 
-def validate_signature(header, signature, key, timestamp):
+def validate_signature(header, signature, key, timestamp, now=None):
     """
     Validate the signature of the trace options header using sha1 algorithm.
+
+    The timestamp must be within 5 minutes of now, in seconds since the
+    epoch, which defaults to the current wall clock time.
     """
     if key is None:
         return Auth.NO_SIGNATURE_KEY
-    if timestamp is None or abs(int(time.time()) - timestamp) > 5 * 60:
+    if now is None:
+        now = time.time()
+    if timestamp is None or abs(int(now) - timestamp) > 5 * 60:
         return Auth.BAD_TIMESTAMP
     try:
         digest = hmac.new(
@@ -1,9 +1,10 @@
 """Transaction name pool with TTL-based expiration using a min-heap."""
 
 import heapq
-import time
 from functools import total_ordering
 
+from solarwinds_apm.oboe.clock import CLOCK, Clock
+
 
 @total_ordering
 class NameItem:
@@ -67,6 +68,7 @@ class TransactionNamePool:
         ttl: int = TRANSACTION_NAME_POOL_TTL,
         max_length: int = TRANSACTION_NAME_MAX_LENGTH,
         default: str = TRANSACTION_NAME_DEFAULT,
+        clock: Clock = CLOCK,
     ):
         """
         Initialize the TransactionNamePool.
@@ -76,6 +78,7 @@ class TransactionNamePool:
         ttl (int): Time-to-live in seconds for each name. Defaults to TRANSACTION_NAME_POOL_TTL.
         max_length (int): Maximum length for transaction names. Defaults to TRANSACTION_NAME_MAX_LENGTH.
         default (str): Default name to return when pool is full. Defaults to TRANSACTION_NAME_DEFAULT.
+        clock (Clock): Clock used for TTL expiration. Defaults to CLOCK.
         """
         self._min_heap: list[NameItem] = []
         self._pool: dict[str, NameItem] = {}
@@ -83,6 +86,7 @@ class TransactionNamePool:
         self._ttl = ttl
         self._max_length = max_length
         self._default = default
+        self._clock = clock
 
     def _housekeep(self):
         """
@@ -90,7 +94,7 @@ class TransactionNamePool:
 
         Checks the heap and removes names that have exceeded their TTL.
         """
-        now = int(time.time())
+        now = int(self._clock.monotonic())
         while (
             len(self._min_heap) > 0
             and self._min_heap[0].timestamp + self._ttl < now
@@ -118,12 +122,12 @@ class TransactionNamePool:
         if name in self._pool:
             # update timestamp and heapify
             item = self._pool[name]
-            item.timestamp = int(time.time())
+            item.timestamp = int(self._clock.monotonic())
             heapq.heapify(self._min_heap)
             return name
         if len(self._pool) >= self._max_size:
             return self._default
-        item = NameItem(name=name, timestamp=int(time.time()))
+        item = NameItem(name=name, timestamp=int(self._clock.monotonic()))
         self._pool[name] = item
         heapq.heappush(self._min_heap, item)
         return name
@@ -22,21 +22,45 @@ from opentelemetry.trace.span import TraceState
 from solarwinds_apm.apm_constants import (
     INTL_SWO_TRACESTATE_KEY,
     INTL_SWO_X_OPTIONS_KEY,
+    INTL_SWO_X_OPTIONS_RESPONSE_KEY,
 )
 from solarwinds_apm.traceoptions import XTraceOptions
 from solarwinds_apm.w3c_transformer import W3CTransformer
 
 logger = logging.getLogger(__name__)
 
+TRACESTATE_SUFFIX_CACHE_MAX = 1024
+
+# Shared XTraceOptions of requests without x-trace-options or signature
+# headers. Read-only: consumers must not modify it.
+EMPTY_XTRACEOPTIONS = XTraceOptions()
+
 
 class SolarWindsPropagator(TraceContextTextMapPropagator):
     """Extract and inject SolarWinds headers and W3C trace context for trace propagation."""
 
     _INVALID_SPAN_ID = 0x0000000000000000
+    _INVALID_SPAN_ID_HEX = "0" * 16
+    _INVALID_TRACE_ID_HEX = "0" * 32
     _TRACEPARENT_HEADER_NAME = "traceparent"
     _TRACESTATE_HEADER_NAME = "tracestate"
     _XTRACEOPTIONS_HEADER_NAME = "x-trace-options"
     _XTRACEOPTIONS_SIGNATURE_HEADER_NAME = "x-trace-options-signature"
+    _TRACESTATE_MAX_MEMBERS = 32
+
+    def __init__(
+        self,
+        tracestate_cache_max: int = TRACESTATE_SUFFIX_CACHE_MAX,
+    ) -> None:
+        """Initialize the SolarWindsPropagator.
+
+        Parameters:
+        tracestate_cache_max (int): Max cached tracestate suffixes. Defaults to TRACESTATE_SUFFIX_CACHE_MAX.
+        """
+        super().__init__()
+        # id(TraceState) -> (TraceState, suffix, sw_allowed)
+        self._tracestate_suffix_cache = {}
+        self._tracestate_cache_max = tracestate_cache_max
 
     def extract(
         self,
@@ -54,22 +78,87 @@ class SolarWindsPropagator(TraceContextTextMapPropagator):
         Returns:
         Context: Updated context with extracted trace information.
         """
-        context = super().extract(carrier, context, getter)
-
+        # Each header is read from the carrier exactly once
+        traceparent_header = getter.get(carrier, self._TRACEPARENT_HEADER_NAME)
+        tracestate_header = getter.get(carrier, self._TRACESTATE_HEADER_NAME)
         xtraceoptions_header = getter.get(
             carrier, self._XTRACEOPTIONS_HEADER_NAME
-        ) or [""]
+        )
         signature_header = getter.get(
             carrier, self._XTRACEOPTIONS_SIGNATURE_HEADER_NAME
-        ) or [""]
-        xtraceoptions = XTraceOptions(
-            xtraceoptions_header[0],
-            signature_header[0],
         )
 
+        if context is None:
+            context = Context()
+        span_context = self._span_context_from_headers(
+            traceparent_header,
+            tracestate_header,
+        )
+        if span_context is not None:
+            context = trace.set_span_in_context(
+                trace.NonRecordingSpan(span_context), context
+            )
+
+        if xtraceoptions_header or signature_header:
+            xtraceoptions = XTraceOptions(
+                (xtraceoptions_header or [""])[0],
+                (signature_header or [""])[0],
+            )
+        else:
+            # Most requests have neither header, so share one empty instance
+            xtraceoptions = EMPTY_XTRACEOPTIONS
+
         context = set_value(INTL_SWO_X_OPTIONS_KEY, xtraceoptions, context)
         return context
 
+    def _span_context_from_headers(
+        self,
+        traceparent_header: typing.Sequence[str] | None,
+        tracestate_header: typing.Sequence[str] | None,
+    ) -> trace.SpanContext | None:
+        """Parse remote span context from traceparent and tracestate header values.
+
+        Follows TraceContextTextMapPropagator.extract validation of traceparent.
+
+        Parameters:
+        traceparent_header (Sequence[str] | None): traceparent header values, if any.
+        tracestate_header (Sequence[str] | None): tracestate header values, if any.
+
+        Returns:
+        SpanContext | None: The remote span context, or None if traceparent missing or invalid.
+        """
+        if not traceparent_header:
+            return None
+
+        match = self._TRACEPARENT_HEADER_FORMAT_RE.search(
+            traceparent_header[0]
+        )
+        if not match:
+            return None
+
+        version, trace_id, span_id, trace_flags = match.group(1, 2, 3, 4)
+        if trace_id == self._INVALID_TRACE_ID_HEX:
+            return None
+        if span_id == self._INVALID_SPAN_ID_HEX:
+            return None
+        if version == "00" and match.group(5):
+            return None
+        if version == "ff":
+            return None
+
+        if tracestate_header is None:
+            tracestate = None
+        else:
+            tracestate = TraceState.from_header(tracestate_header)
+
+        return trace.SpanContext(
+            trace_id=int(trace_id, 16),
+            span_id=int(span_id, 16),
+            is_remote=True,
+            trace_flags=trace.TraceFlags(int(trace_flags, 16)),
+            trace_state=tracestate,
+        )
+
     def inject(
         self,
         carrier: textmap.CarrierT,
@@ -100,37 +189,66 @@ class SolarWindsPropagator(TraceContextTextMapPropagator):
 
         # Read existing tracestate directly from span_context (not from carrier)
         # https://opentelemetry.io/docs/specs/otel/context/api-propagators/
-        existing_trace_state = span_context.trace_state
-        if not existing_trace_state:
-            logger.debug(
-                "Creating new trace state for injection with %s",
-                sw_value,
-            )
-            trace_state = TraceState([(INTL_SWO_TRACESTATE_KEY, sw_value)])
-        elif INTL_SWO_TRACESTATE_KEY in existing_trace_state:
-            # If so, modify current span_id and trace_flags, and move to beginning of list
+        # sw is added or updated as first member, followed by all other
+        # existing members except any xtrace_options_response stored for
+        # ResponsePropagator
+        suffix, sw_allowed = self._tracestate_suffix(span_context.trace_state)
+        if not sw_allowed:
             logger.debug(
-                "Updating trace state for injection with %s",
+                "Cannot add %s to trace state with maximum members for injection",
                 sw_value,
             )
-            trace_state = existing_trace_state.update(
-                INTL_SWO_TRACESTATE_KEY, sw_value
+            trace_state_header = suffix
+        elif suffix:
+            trace_state_header = (
+                f"{INTL_SWO_TRACESTATE_KEY}={sw_value},{suffix}"
             )
         else:
-            # If not, add sw KV to beginning of list
-            logger.debug(
-                "Adding KV to trace state for injection with %s",
-                sw_value,
-            )
-            trace_state = existing_trace_state.add(
-                INTL_SWO_TRACESTATE_KEY, sw_value
-            )
+            trace_state_header = f"{INTL_SWO_TRACESTATE_KEY}={sw_value}"
+        setter.set(carrier, self._TRACESTATE_HEADER_NAME, trace_state_header)
+
+    def _tracestate_suffix(
+        self,
+        trace_state: TraceState | None,
+    ) -> tuple[str, bool]:
+        """Serialize tracestate members that follow sw in injected tracestate.
+
+        Results are cached by TraceState identity, which is safe because
+        TraceState is immutable and each cache entry holds a reference to
+        its TraceState.
+
+        Parameters:
+        trace_state (TraceState | None): The existing tracestate of the span context.
+
+        Returns:
+        tuple[str, bool]: Header of members other than sw and xtrace_options_response,
+            and whether sw can be added without exceeding the W3C member limit.
+        """
+        if not trace_state:
+            return "", True
+        cached = self._tracestate_suffix_cache.get(id(trace_state))
+        if cached is not None and cached[0] is trace_state:
+            return cached[1], cached[2]
 
-        # Remove any xtrace_options_response stored for ResponsePropagator
-        trace_state = W3CTransformer.remove_response_from_sw(trace_state)
-        setter.set(
-            carrier, self._TRACESTATE_HEADER_NAME, trace_state.to_header()
+        suffix = ",".join(
+            f"{key}={value}"
+            for key, value in trace_state.items()
+            if key
+            not in (INTL_SWO_TRACESTATE_KEY, INTL_SWO_X_OPTIONS_RESPONSE_KEY)
+        )
+        # Same limit as TraceState.add, which would otherwise drop sw
+        sw_allowed = (
+            INTL_SWO_TRACESTATE_KEY in trace_state
+            or len(trace_state) < self._TRACESTATE_MAX_MEMBERS
+        )
+        if len(self._tracestate_suffix_cache) >= self._tracestate_cache_max:
+            self._tracestate_suffix_cache.clear()
+        self._tracestate_suffix_cache[id(trace_state)] = (
+            trace_state,
+            suffix,
+            sw_allowed,
         )
+        return suffix, sw_allowed
 
     # Note: this inherits deprecated `typing` use by OTel,
     #       for compatibility with Python3.8 else TypeError
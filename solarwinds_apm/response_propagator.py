@@ -8,8 +8,10 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 
 from opentelemetry import trace
+from opentelemetry.context import get_value
 from opentelemetry.context.context import Context
 from opentelemetry.instrumentation.propagators import ResponsePropagator
 from opentelemetry.propagators import textmap
@@ -20,6 +22,7 @@ from solarwinds_apm.apm_constants import (
     INTL_SWO_COMMA_W3C_SANITIZED,
     INTL_SWO_EQUALS,
     INTL_SWO_EQUALS_W3C_SANITIZED,
+    INTL_SWO_X_OPTIONS_KEY,
     INTL_SWO_X_OPTIONS_RESPONSE_KEY,
 )
 from solarwinds_apm.w3c_transformer import W3CTransformer
@@ -27,6 +30,13 @@ from solarwinds_apm.w3c_transformer import W3CTransformer
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _recover_response(sanitized: str) -> str:
+    return sanitized.replace(
+        INTL_SWO_EQUALS_W3C_SANITIZED, INTL_SWO_EQUALS
+    ).replace(INTL_SWO_COMMA_W3C_SANITIZED, INTL_SWO_COMMA)
+
+
 class SolarWindsTraceResponsePropagator(ResponsePropagator):
     """Inject SolarWinds trace values into HTTP responses."""
 
@@ -35,6 +45,19 @@ class SolarWindsTraceResponsePropagator(ResponsePropagator):
     )
     _XTRACE_HEADER_NAME = "x-trace"
     _XTRACEOPTIONS_RESPONSE_HEADER_NAME = "x-trace-options-response"
+    _EXPOSE_HEADERS_XTRACE = _XTRACE_HEADER_NAME
+    _EXPOSE_HEADERS_XTRACE_AND_RESPONSE = (
+        f"{_XTRACE_HEADER_NAME},{_XTRACEOPTIONS_RESPONSE_HEADER_NAME}"
+    )
+
+    def __init__(self, trigger_trace_only: bool = False) -> None:
+        """Initialize the SolarWindsTraceResponsePropagator.
+
+        Parameters:
+        trigger_trace_only (bool): Only inject into responses to requests with x-trace-options. Defaults to False.
+        """
+        super().__init__()
+        self.trigger_trace_only = trigger_trace_only
 
     def inject(
         self,
@@ -49,38 +72,44 @@ class SolarWindsTraceResponsePropagator(ResponsePropagator):
         context (Context | None): Optional context to inject from. Defaults to None.
         setter (textmap.Setter): Setter for injecting headers into carrier. Defaults to default_setter.
         """
+        if self.trigger_trace_only:
+            # Set by SolarWindsPropagator.extract for the inbound request
+            xtraceoptions = get_value(INTL_SWO_X_OPTIONS_KEY, context)
+            if not getattr(xtraceoptions, "include_response", False):
+                return
+
         span = trace.get_current_span(context)
         span_context = span.get_span_context()
         if span_context == trace.INVALID_SPAN_CONTEXT:
             return
 
-        x_trace = W3CTransformer.traceparent_from_context(span_context)
+        # Formatted once per span context by W3CTransformer
         setter.set(
             carrier,
             self._XTRACE_HEADER_NAME,
-            x_trace,
+            W3CTransformer.traceparent_from_context(span_context),
         )
-        exposed_headers = [self._XTRACE_HEADER_NAME]
-
         xtraceoptions_response = self.recover_response_from_tracestate(
             span_context.trace_state
         )
         if xtraceoptions_response:
-            exposed_headers.append(
-                f"{self._XTRACEOPTIONS_RESPONSE_HEADER_NAME}"
-            )
             setter.set(
                 carrier,
                 self._XTRACEOPTIONS_RESPONSE_HEADER_NAME,
                 xtraceoptions_response,
             )
+            exposed_headers = self._EXPOSE_HEADERS_XTRACE_AND_RESPONSE
+        else:
+            exposed_headers = self._EXPOSE_HEADERS_XTRACE
         setter.set(
             carrier,
             self._HTTP_HEADER_ACCESS_CONTROL_EXPOSE_HEADERS,
-            ",".join(exposed_headers),
+            exposed_headers,
         )
 
-    def recover_response_from_tracestate(self, tracestate: TraceState) -> str:
+    def recover_response_from_tracestate(
+        self, tracestate: TraceState | None
+    ) -> str:
         """
         Recover xtraceoptions response from tracestate by converting delimiters.
 
@@ -89,14 +118,14 @@ class SolarWindsTraceResponsePropagator(ResponsePropagator):
         COMMA_W3C_SANITIZED becomes COMMA
 
         Parameters:
-        tracestate (TraceState): The tracestate to extract response from.
+        tracestate (TraceState | None): The tracestate to extract response from.
 
         Returns:
         str: The recovered xtraceoptions response string.
         """
+        if not tracestate:
+            return ""
         sanitized = tracestate.get(INTL_SWO_X_OPTIONS_RESPONSE_KEY, None)
         if not sanitized:
             return ""
-        return sanitized.replace(
-            INTL_SWO_EQUALS_W3C_SANITIZED, INTL_SWO_EQUALS
-        ).replace(INTL_SWO_COMMA_W3C_SANITIZED, INTL_SWO_COMMA)
+        return _recover_response(sanitized)
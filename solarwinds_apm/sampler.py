@@ -16,8 +16,7 @@ from opentelemetry.metrics import get_meter_provider
 from opentelemetry.sdk.trace.sampling import ParentBased
 
 from solarwinds_apm.apm_config import SolarWindsApmConfig
-from solarwinds_apm.oboe.http_sampler import HttpSampler
-from solarwinds_apm.oboe.json_sampler import JsonSampler
+from solarwinds_apm.oboe.configuration import Configuration
 
 
 class ParentBasedSwSampler(ParentBased):
@@ -43,11 +42,18 @@ class ParentBasedSwSampler(ParentBased):
         """
         configuration = SolarWindsApmConfig.to_configuration(apm_config)
         self.sampler = None
+        # Import only the sampler in use: HttpSampler pulls in requests,
+        # which Lambda does not need
+        # pylint: disable=import-outside-toplevel
         if apm_config.is_lambda:
+            from solarwinds_apm.oboe.json_sampler import JsonSampler
+
             self.sampler = JsonSampler(
                 meter_provider=get_meter_provider(), config=configuration
             )
         else:
+            from solarwinds_apm.oboe.http_sampler import HttpSampler
+
             self.sampler = HttpSampler(
                 meter_provider=get_meter_provider(),
                 config=configuration,
@@ -71,3 +77,11 @@ class ParentBasedSwSampler(ParentBased):
         bool: True if sampler is ready, False if timeout occurred.
         """
         return self.sampler.wait_until_ready(timeout)
+
+    def update_configuration(self, configuration: Configuration) -> None:
+        """Apply reloaded local tracing configuration to the sampler.
+
+        Parameters:
+        configuration (Configuration): The reloaded configuration.
+        """
+        self.sampler.update_configuration(configuration)
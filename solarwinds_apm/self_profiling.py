@@ -0,0 +1,176 @@
+# © 2026 SolarWinds Worldwide, LLC. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with the License. You may obtain a copy of the License at:http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
+
+"""Opt-in timing of SolarWinds APM components, exported as internal metrics."""
+
+from __future__ import annotations
+
+import functools
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
+
+from opentelemetry.metrics import Observation, get_meter_provider
+
+if TYPE_CHECKING:
+    from opentelemetry.metrics import CallbackOptions, MeterProvider
+
+logger = logging.getLogger(__name__)
+
+SELF_PROFILING_ATTR_COMPONENT = "component"
+
+
+class SelfProfiler:
+    """
+    Per-component call counts, total time and max time of profiled methods.
+
+    Methods are profiled by replacing them on the component instance with a
+    timing wrapper, so components that are not profiled run unchanged and
+    profiling costs nothing when it is not enabled. Counters are exported
+    by the meter "sw.apm.internal.metrics" as:
+
+    - sw.apm.internal.calls: calls per component
+    - sw.apm.internal.time: total ns spent per component
+    - sw.apm.internal.max_time: max ns of one call per component since
+      profiling started
+
+    Each component has its own lock, so profiling does not serialize the
+    components against each other. The max time is not reset when it is
+    collected, so that every metric reader sees the same value.
+    """
+
+    def __init__(self, meter_provider: MeterProvider | None = None) -> None:
+        """
+        Initialize the SelfProfiler and its observable instruments.
+
+        Parameters:
+        meter_provider (MeterProvider | None): Meter provider for the internal metrics. Defaults to the global meter provider.
+        """
+        # component -> ([calls, total_ns, max_ns], lock of the counters)
+        self._stats: dict[str, tuple[list[int], threading.Lock]] = {}
+        self._lock = threading.Lock()
+        if meter_provider is None:
+            meter_provider = get_meter_provider()
+        meter = meter_provider.get_meter("sw.apm.internal.metrics")
+        meter.create_observable_counter(
+            name="sw.apm.internal.calls",
+            callbacks=[self._observe_calls],
+            description="Count of calls of profiled SolarWinds APM components.",
+            unit="{call}",
+        )
+        meter.create_observable_counter(
+            name="sw.apm.internal.time",
+            callbacks=[self._observe_time],
+            description="Time spent in profiled SolarWinds APM components.",
+            unit="ns",
+        )
+        meter.create_observable_gauge(
+            name="sw.apm.internal.max_time",
+            callbacks=[self._observe_max_time],
+            description="Max time of one call of profiled SolarWinds APM components.",
+            unit="ns",
+        )
+
+    def wrap(self, component: str, func: Callable) -> Callable:
+        """
+        Wrap a callable so that its calls are counted and timed.
+
+        Parameters:
+        component (str): Component name the calls are attributed to.
+        func (Callable): The callable to wrap.
+
+        Returns:
+        Callable: The timing wrapper.
+        """
+        with self._lock:
+            stats, lock = self._stats.setdefault(
+                component, ([0, 0, 0], threading.Lock())
+            )
+        perf_counter_ns = time.perf_counter_ns
+
+        @functools.wraps(func)
+        def profiled(*args: Any, **kwargs: Any) -> Any:
+            start = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = perf_counter_ns() - start
+                with lock:
+                    stats[0] += 1
+                    stats[1] += elapsed
+                    if elapsed > stats[2]:
+                        stats[2] = elapsed
+
+        return profiled
+
+    def profile(self, component: str, obj: Any, *methods: str) -> None:
+        """
+        Profile methods of an object by replacing them on the instance.
+
+        Methods the object does not have are skipped.
+
+        Parameters:
+        component (str): Component name the calls are attributed to.
+        obj (Any): The component instance.
+        *methods (str): Names of the methods to profile.
+        """
+        if obj is None:
+            return
+        for method in methods:
+            func = getattr(obj, method, None)
+            if func is None:
+                continue
+            setattr(obj, method, self.wrap(component, func))
+            logger.debug(
+                "Profiling %s.%s as %s",
+                type(obj).__name__,
+                method,
+                component,
+            )
+
+    def snapshot(self) -> dict[str, tuple[int, int, int]]:
+        """
+        Get the current counters.
+
+        Returns:
+        dict[str, tuple[int, int, int]]: Calls, total ns and max ns by component.
+        """
+        with self._lock:
+            components = list(self._stats.items())
+        snapshot = {}
+        for component, (stats, lock) in components:
+            with lock:
+                snapshot[component] = tuple(stats)
+        return snapshot
+
+    def _observe(self, index: int) -> list[Observation]:
+        return [
+            Observation(
+                stats[index],
+                {SELF_PROFILING_ATTR_COMPONENT: component},
+            )
+            for component, stats in self.snapshot().items()
+        ]
+
+    def _observe_calls(
+        self,
+        options: CallbackOptions | None = None,
+    ) -> Iterable[Observation]:
+        return self._observe(0)
+
+    def _observe_time(
+        self,
+        options: CallbackOptions | None = None,
+    ) -> Iterable[Observation]:
+        return self._observe(1)
+
+    def _observe_max_time(
+        self,
+        options: CallbackOptions | None = None,
+    ) -> Iterable[Observation]:
+        return self._observe(2)
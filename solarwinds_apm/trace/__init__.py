@@ -2,8 +2,10 @@
 
 from .response_time_processor import ResponseTimeProcessor
 from .serviceentry_processor import ServiceEntrySpanProcessor
+from .solarwinds_processor import SolarWindsSpanProcessor
 
 __all__ = [
     "ServiceEntrySpanProcessor",
     "ResponseTimeProcessor",
+    "SolarWindsSpanProcessor",
 ]
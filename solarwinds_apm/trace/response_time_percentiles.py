@@ -0,0 +1,212 @@
+# © 2026 SolarWinds Worldwide, LLC. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with the License. You may obtain a copy of the License at:http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
+
+"""Sliding-window response time percentiles per transaction."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Iterable
+
+from opentelemetry.util._once import Once
+
+logger = logging.getLogger(__name__)
+
+PERCENTILES_WINDOW = 60  # seconds
+PERCENTILES_WINDOW_SLOTS = 6
+PERCENTILES_TRANSACTIONS_MAX = 201  # transaction name pool max + default
+# Values below 2 ** (PERCENTILES_SUB_BUCKET_BITS + 1) ms are exact; above,
+# bucket width is at most 1 / 2 ** PERCENTILES_SUB_BUCKET_BITS of the value
+PERCENTILES_SUB_BUCKET_BITS = 5
+PERCENTILES_DEFAULT = (0.5, 0.95, 0.99)
+
+
+class ResponseTimePercentiles:
+    """
+    Sliding-window response time percentile store keyed by transaction name.
+
+    Each transaction keeps a ring of time slots covering the window. Each slot
+    holds sparse counts of log-linear (HDR-style) buckets of integer
+    milliseconds, so record is O(1) and relative error is bounded by the
+    sub-bucket resolution. Slots are reset lazily when their time comes round
+    again; queries merge the slots that are still inside the window.
+    """
+
+    def __init__(
+        self,
+        window: int = PERCENTILES_WINDOW,
+        slots: int = PERCENTILES_WINDOW_SLOTS,
+        max_transactions: int = PERCENTILES_TRANSACTIONS_MAX,
+        sub_bucket_bits: int = PERCENTILES_SUB_BUCKET_BITS,
+    ) -> None:
+        """
+        Initialize the ResponseTimePercentiles store.
+
+        Parameters:
+        window (int): Sliding window length in seconds. Defaults to PERCENTILES_WINDOW.
+        slots (int): Number of slots the window is divided into. Defaults to PERCENTILES_WINDOW_SLOTS.
+        max_transactions (int): Max transactions tracked. Defaults to PERCENTILES_TRANSACTIONS_MAX.
+        sub_bucket_bits (int): Bits of resolution per power of two. Defaults to PERCENTILES_SUB_BUCKET_BITS.
+        """
+        self.slots = slots
+        self.slot_seconds = window / slots
+        self.max_transactions = max_transactions
+        self._sub_bucket_bits = sub_bucket_bits
+        self._sub_buckets = 1 << sub_bucket_bits
+        # transaction -> ring of [slot_epoch, {bucket_index: count}]
+        self._rings = {}
+        self._lock = threading.Lock()
+
+    def _bucket_index(self, value: int) -> int:
+        """Return the log-linear bucket index of a non-negative value."""
+        shift = value.bit_length() - self._sub_bucket_bits - 1
+        if shift <= 0:
+            return value
+        return (shift << self._sub_bucket_bits) + (value >> shift)
+
+    def _bucket_value(self, index: int) -> float:
+        """Return the midpoint of the values in a bucket."""
+        shift = (index >> self._sub_bucket_bits) - 1
+        if shift <= 0:
+            return float(index)
+        lower = (index - (shift << self._sub_bucket_bits)) << shift
+        return lower + ((1 << shift) - 1) / 2
+
+    def record(
+        self,
+        transaction: str,
+        value: float,
+        now: float | None = None,
+    ) -> None:
+        """
+        Record a response time for a transaction.
+
+        Parameters:
+        transaction (str): The transaction name.
+        value (float): The response time in milliseconds.
+        now (float | None): Monotonic time in seconds. Defaults to current time.
+        """
+        if now is None:
+            now = time.monotonic()
+        epoch = int(now // self.slot_seconds)
+        index = self._bucket_index(int(value) if value > 0 else 0)
+        with self._lock:
+            ring = self._rings.get(transaction)
+            if ring is None:
+                if len(self._rings) >= self.max_transactions:
+                    self._sweep(epoch)
+                    if len(self._rings) >= self.max_transactions:
+                        return
+                ring = [[epoch, {}] for _ in range(self.slots)]
+                self._rings[transaction] = ring
+            slot = ring[epoch % self.slots]
+            if slot[0] != epoch:
+                slot[0] = epoch
+                slot[1] = {}
+            counts = slot[1]
+            counts[index] = counts.get(index, 0) + 1
+
+    def _sweep(self, epoch: int) -> None:
+        """Remove transactions with no recordings inside the window. Caller holds lock."""
+        oldest = epoch - self.slots + 1
+        stale = [
+            transaction
+            for transaction, ring in self._rings.items()
+            if all(slot[0] < oldest or not slot[1] for slot in ring)
+        ]
+        for transaction in stale:
+            del self._rings[transaction]
+
+    def percentiles(
+        self,
+        transaction: str,
+        quantiles: Iterable[float] = PERCENTILES_DEFAULT,
+        now: float | None = None,
+    ) -> dict[float, float]:
+        """
+        Get response time percentiles of a transaction over the sliding window.
+
+        Parameters:
+        transaction (str): The transaction name.
+        quantiles (Iterable[float]): Quantiles between 0 and 1. Defaults to PERCENTILES_DEFAULT.
+        now (float | None): Monotonic time in seconds. Defaults to current time.
+
+        Returns:
+        dict[float, float]: Response time in milliseconds by quantile, or empty if no recordings in window.
+        """
+        if now is None:
+            now = time.monotonic()
+        oldest = int(now // self.slot_seconds) - self.slots + 1
+        merged = {}
+        with self._lock:
+            ring = self._rings.get(transaction)
+            if ring is None:
+                return {}
+            for slot_epoch, counts in ring:
+                if slot_epoch < oldest:
+                    continue
+                for index, count in counts.items():
+                    merged[index] = merged.get(index, 0) + count
+        total = sum(merged.values())
+        if not total:
+            return {}
+
+        buckets = sorted(merged.items())
+        result = {}
+        for quantile in sorted(quantiles):
+            rank = max(1, min(total, int(quantile * total + 0.5)))
+            seen = 0
+            for index, count in buckets:
+                seen += count
+                if seen >= rank:
+                    result[quantile] = self._bucket_value(index)
+                    break
+        return result
+
+    def transactions(self) -> list[str]:
+        """
+        Get the names of tracked transactions.
+
+        Returns:
+        list[str]: The tracked transaction names.
+        """
+        with self._lock:
+            return list(self._rings)
+
+
+_RESPONSE_TIME_PERCENTILES_SET_ONCE = Once()
+_response_time_percentiles: ResponseTimePercentiles | None = None
+
+
+def _set_response_time_percentiles(
+    response_time_percentiles: ResponseTimePercentiles,
+) -> None:
+    """
+    Set the global response time percentiles store.
+
+    This function ensures the store is set only once using the Once mechanism.
+
+    Parameters:
+    response_time_percentiles (ResponseTimePercentiles): The store to set globally.
+    """
+
+    def set_rtp() -> None:
+        global _response_time_percentiles  # pylint: disable=global-statement
+        _response_time_percentiles = response_time_percentiles
+
+    _RESPONSE_TIME_PERCENTILES_SET_ONCE.do_once(set_rtp)
+
+
+def get_response_time_percentiles() -> ResponseTimePercentiles | None:
+    """
+    Get the global response time percentiles store.
+
+    Returns:
+    ResponseTimePercentiles | None: The global store, or None if not enabled.
+    """
+    return _response_time_percentiles
@@ -7,7 +7,9 @@
 """Response time span processor for recording trace metrics."""
 
 import logging
-from typing import TYPE_CHECKING
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 from opentelemetry.metrics import get_meter
 from opentelemetry.sdk.trace import SpanProcessor
@@ -17,6 +19,12 @@ from opentelemetry.trace import SpanKind, StatusCode
 from solarwinds_apm.apm_constants import (
     INTL_SWO_TRANSACTION_ATTR_KEY,
 )
+from solarwinds_apm.trace.response_time_percentiles import (
+    ResponseTimePercentiles,
+    _set_response_time_percentiles,
+    get_response_time_percentiles,
+)
+from solarwinds_apm.trace.serviceentry_processor import is_entry_span
 
 if TYPE_CHECKING:
     from opentelemetry.sdk.trace import ReadableSpan
@@ -26,6 +34,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Max distinct metrics attribute sets interned per processor
+METER_ATTRS_CACHE_MAX = 2000
+
 
 class ResponseTimeProcessor(SpanProcessor):
     """
@@ -51,12 +62,14 @@ class ResponseTimeProcessor(SpanProcessor):
     def __init__(
         self,
         apm_config: "SolarWindsApmConfig",
+        meter_attrs_cache_max: int = METER_ATTRS_CACHE_MAX,
     ) -> None:
         """
         Initialize the ResponseTimeProcessor.
 
         Parameters:
         apm_config (SolarWindsApmConfig): The APM configuration object.
+        meter_attrs_cache_max (int): Max interned metrics attribute sets. Defaults to METER_ATTRS_CACHE_MAX.
         """
         super().__init__()
         self.service_name = apm_config.service_name
@@ -70,6 +83,16 @@ class ResponseTimeProcessor(SpanProcessor):
             description="Duration of each entry span for the service, typically meaning the time taken to process an inbound request.",
             unit="ms",
         )
+        # (trans_name, is_error, status_code, request_method) -> attributes
+        self._meter_attrs_cache = {}
+        self._meter_attrs_cache_max = meter_attrs_cache_max
+
+        # SW_APM_RESPONSE_TIME_PERCENTILES: local per-transaction percentiles
+        # queryable with solarwinds_apm.api.get_transaction_percentiles
+        self.response_time_percentiles = None
+        if apm_config.get("response_time_percentiles") is True:
+            _set_response_time_percentiles(ResponseTimePercentiles())
+            self.response_time_percentiles = get_response_time_percentiles()
 
     def is_span_http(self, span: "ReadableSpan") -> bool:
         """
@@ -128,6 +151,108 @@ class ResponseTimeProcessor(SpanProcessor):
         ms_end_time = int(end_time // time_conversion)
         return ms_end_time - ms_start_time
 
+    def valid_status_code(self, status_code: Any) -> int | None:
+        """
+        Convert an HTTP status code span attribute value to a positive int.
+
+        Parameters:
+        status_code (Any): The span attribute value, if any.
+
+        Returns:
+        int | None: The status code, or None if missing or invalid.
+        """
+        # Fast path for compliant int values
+        if type(status_code) is int:
+            return status_code if status_code > 0 else None
+        if status_code is None:
+            return None
+        # Convert to int (compliant) if str (non-compliant but can happen)
+        # RFC 9110: status-code should be 3-digit (integer)
+        try:
+            status_code_int = int(status_code)
+        except (ValueError, TypeError):
+            logger.debug(
+                "Expected HTTP status code as int (RFC 9110), but got %s. Ignoring invalid value.",
+                type(status_code).__name__,
+            )
+            return None
+        return status_code_int if status_code_int > 0 else None
+
+    def http_status_and_method(
+        self, span: "ReadableSpan"
+    ) -> tuple[int, str | None]:
+        """
+        Get metrics status code and request method values from HTTP span attributes.
+
+        Current span attributes take precedence over deprecated attributes.
+        Status code is unavailable (0) if neither is valid. Request method
+        is None if neither is present.
+
+        Parameters:
+        span (ReadableSpan): The span to extract HTTP attributes from.
+
+        Returns:
+        tuple[int, str | None]: The status code and request method.
+        """
+        attributes = span.attributes
+        status_code = self.valid_status_code(
+            attributes.get(self._HTTP_RESPONSE_STATUS_CODE, None)
+        )
+        # Fall back to deprecated attribute if new attribute was invalid/missing
+        if status_code is None:
+            status_code = self.valid_status_code(
+                attributes.get(self._HTTP_STATUS_CODE, None)
+            )
+        if status_code is None:
+            # Something went wrong in OTel or instrumented service crashed early
+            # if no status_code, current nor deprecated, in attributes of HTTP span
+            status_code = self._HTTP_SPAN_STATUS_UNAVAILABLE
+
+        request_method = attributes.get(
+            self._HTTP_REQUEST_METHOD, None
+        ) or attributes.get(self._HTTP_METHOD, None)
+        return status_code, str(request_method) if request_method else None
+
+    def get_meter_attrs(
+        self,
+        trans_name: Any,
+        is_error: bool,
+        status_code: int | None = None,
+        request_method: str | None = None,
+    ) -> Mapping[str, Any]:
+        """
+        Get the interned, read-only metrics attributes for a response_time measurement.
+
+        Attribute sets repeat across spans, so each is built once and reused
+        until the cache is full. status_code None means non-HTTP span.
+
+        Parameters:
+        trans_name (Any): The transaction name.
+        is_error (bool): Whether the span has error status.
+        status_code (int | None): HTTP status code, or None if not HTTP span.
+        request_method (str | None): HTTP request method, if any.
+
+        Returns:
+        Mapping[str, Any]: The metrics attributes.
+        """
+        key = (trans_name, is_error, status_code, request_method)
+        meter_attrs = self._meter_attrs_cache.get(key)
+        if meter_attrs is not None:
+            return meter_attrs
+
+        attrs = {
+            "sw.is_error": is_error,
+            INTL_SWO_TRANSACTION_ATTR_KEY: trans_name,
+        }
+        if status_code is not None:
+            attrs[self._HTTP_RESPONSE_STATUS_CODE] = status_code
+            if request_method:
+                attrs[self._HTTP_REQUEST_METHOD] = request_method
+        meter_attrs = MappingProxyType(attrs)
+        if len(self._meter_attrs_cache) < self._meter_attrs_cache_max:
+            self._meter_attrs_cache[key] = meter_attrs
+        return meter_attrs
+
     def enhance_meter_attrs_with_http_span_attrs(
         self, span: "ReadableSpan", meter_attrs: dict
     ) -> dict:
@@ -148,60 +273,10 @@ class ResponseTimeProcessor(SpanProcessor):
         Returns:
         dict: The enhanced metrics attributes dictionary.
         """
-        status_code_new = span.attributes.get(
-            self._HTTP_RESPONSE_STATUS_CODE, None
-        )
-        status_code_old = span.attributes.get(self._HTTP_STATUS_CODE, None)
-
-        # Convert to int (compliant) if str (non-compliant but can happen)
-        # RFC 9110: status-code should be 3-digit (integer)
-        status_code = None
-        if status_code_new is not None:
-            try:
-                status_code = int(status_code_new)
-                if status_code <= 0:
-                    status_code = None
-            except (ValueError, TypeError):
-                logger.debug(
-                    "Expected HTTP status code as int (RFC 9110), but got %s. Ignoring invalid value.",
-                    type(status_code_new).__name__,
-                )
-
-        # Fall back to deprecated attribute if new attribute was invalid/missing
-        if status_code is None and status_code_old is not None:
-            try:
-                status_code = int(status_code_old)
-                if status_code <= 0:
-                    status_code = None
-            except (ValueError, TypeError):
-                logger.debug(
-                    "Expected HTTP status code as int (RFC 9110), but got %s. Ignoring invalid value.",
-                    type(status_code_old).__name__,
-                )
-
-        if status_code is not None and status_code > 0:
-            meter_attrs.update({self._HTTP_RESPONSE_STATUS_CODE: status_code})
-        else:
-            # Something went wrong in OTel or instrumented service crashed early
-            # if no status_code, current nor deprecated, in attributes of HTTP span
-            meter_attrs.update(
-                {
-                    self._HTTP_RESPONSE_STATUS_CODE: self._HTTP_SPAN_STATUS_UNAVAILABLE
-                }
-            )
-
-        request_method_new = span.attributes.get(
-            self._HTTP_REQUEST_METHOD, None
-        )
-        request_method_old = span.attributes.get(self._HTTP_METHOD, None)
-        if request_method_new:
-            meter_attrs.update(
-                {self._HTTP_REQUEST_METHOD: str(request_method_new)}
-            )
-        elif request_method_old:
-            meter_attrs.update(
-                {self._HTTP_REQUEST_METHOD: str(request_method_old)}
-            )
+        status_code, request_method = self.http_status_and_method(span)
+        meter_attrs.update({self._HTTP_RESPONSE_STATUS_CODE: status_code})
+        if request_method:
+            meter_attrs.update({self._HTTP_REQUEST_METHOD: request_method})
 
         return meter_attrs
 
@@ -215,37 +290,37 @@ class ResponseTimeProcessor(SpanProcessor):
         span (ReadableSpan): The span that has ended.
         """
         # Only calculate OTLP metrics for service entry spans
-        parent_span_context = span.parent
-        if (
-            parent_span_context
-            and parent_span_context.is_valid
-            and not parent_span_context.is_remote
-        ):
+        if not is_entry_span(span):
             return
+        self.record_response_time(span)
 
-        trans_name = span.attributes.get(INTL_SWO_TRANSACTION_ATTR_KEY, None)
+    def record_response_time(self, span: "ReadableSpan") -> None:
+        """
+        Record response_time histogram measurement for an entry span.
 
-        meter_attrs = {}
+        Assumes the caller has already checked that span is a service entry span.
+
+        Parameters:
+        span (ReadableSpan): The entry span that has ended.
+        """
+        trans_name = span.attributes.get(INTL_SWO_TRANSACTION_ATTR_KEY, None)
         has_error = self.has_error(span)
-        if has_error:
-            meter_attrs.update({"sw.is_error": True})
+        if self.is_span_http(span):
+            status_code, request_method = self.http_status_and_method(span)
+            meter_attrs = self.get_meter_attrs(
+                trans_name, has_error, status_code, request_method
+            )
         else:
-            meter_attrs.update({"sw.is_error": False})
+            meter_attrs = self.get_meter_attrs(trans_name, has_error)
 
-        is_span_http = self.is_span_http(span)
         # convert from ns to milliseconds
         span_time = self.calculate_span_time(
             span.start_time,
             span.end_time,
             1e6,
         )
-
-        meter_attrs.update({INTL_SWO_TRANSACTION_ATTR_KEY: trans_name})
-        if is_span_http:
-            meter_attrs = self.enhance_meter_attrs_with_http_span_attrs(
-                span, meter_attrs
-            )
-
+        if self.response_time_percentiles is not None:
+            self.response_time_percentiles.record(trans_name, span_time)
         self.response_time.record(
             amount=span_time,
             attributes=meter_attrs,
@@ -11,6 +11,8 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
+import time
 from typing import TYPE_CHECKING
 
 from opentelemetry import context
@@ -32,9 +34,35 @@ from solarwinds_apm.w3c_transformer import W3CTransformer
 
 if TYPE_CHECKING:
     from opentelemetry.sdk.trace import ReadableSpan
+    from opentelemetry.trace import SpanContext
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on cached entry span context tokens, and the age after which
+# a token is considered leaked (its span never ended) and swept
+CONTEXT_TOKENS_MAX = 10000
+CONTEXT_TOKENS_TTL = 3600  # 1 hour
+
+
+def is_entry_span(span: ReadableSpan) -> bool:
+    """
+    Check if a span is a service entry span.
+
+    A service entry span has no parent, an invalid parent, or a remote parent.
+
+    Parameters:
+    span (ReadableSpan): The span to check.
+
+    Returns:
+    bool: True if the span is a service entry span, False otherwise.
+    """
+    parent_span_context = span.parent
+    return not (
+        parent_span_context
+        and parent_span_context.is_valid
+        and not parent_span_context.is_remote
+    )
+
 
 class ServiceEntrySpanProcessor(SpanProcessor):
     """
@@ -44,11 +72,79 @@ class ServiceEntrySpanProcessor(SpanProcessor):
     which are spans without valid local parents.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_tokens: int = CONTEXT_TOKENS_MAX,
+        token_ttl: float = CONTEXT_TOKENS_TTL,
+    ) -> None:
         """
         Initialize the ServiceEntrySpanProcessor.
+
+        Parameters:
+        max_tokens (int): Maximum number of context tokens to cache. Defaults to CONTEXT_TOKENS_MAX.
+        token_ttl (float): Seconds after which an unended entry span's token is swept. Defaults to CONTEXT_TOKENS_TTL.
         """
+        # Keyed by integer (trace_id, span_id) of entry span, with values
+        # of (token, expiry). Insertion order is start order, so the
+        # oldest token is always first.
         self.context_tokens = {}
+        self._max_tokens = max_tokens
+        self._token_ttl = token_ttl
+        self._lock = threading.Lock()
+        self._logged_tokens_full = False
+
+    def _store_token(
+        self,
+        key: tuple[int, int],
+        token: object,
+    ) -> bool:
+        """
+        Cache a context token, sweeping expired tokens.
+
+        Tokens of entry spans that never end would otherwise leak. Because
+        the cache is ordered by insertion, sweeping only inspects the oldest
+        entries and stops at the first live one. Live tokens are never
+        evicted: if the cache is still full, the new token is not stored.
+
+        Parameters:
+        key (tuple[int, int]): The entry span trace_id and span_id.
+        token (object): The context token returned by attach.
+
+        Returns:
+        bool: True if the token was stored, False if the cache is full.
+        """
+        now = time.monotonic()
+        with self._lock:
+            while self.context_tokens:
+                oldest_key = next(iter(self.context_tokens))
+                _, expiry = self.context_tokens[oldest_key]
+                if expiry > now:
+                    break
+                logger.debug(
+                    "Sweeping context token for entry trace/span id %s that did not end",
+                    oldest_key,
+                )
+                del self.context_tokens[oldest_key]
+            if len(self.context_tokens) >= self._max_tokens:
+                full = True
+            else:
+                full = False
+                self.context_tokens[key] = (token, now + self._token_ttl)
+        if full:
+            if not self._logged_tokens_full:
+                logger.warning(
+                    "Entry span context cache is full (%s); not tracking entry span context",
+                    self._max_tokens,
+                )
+                self._logged_tokens_full = True
+            else:
+                logger.debug(
+                    "Entry span context cache is full; not tracking trace/span id %s",
+                    key,
+                )
+            return False
+        self._logged_tokens_full = False
+        return True
 
     def set_default_transaction_name(
         self,
@@ -99,14 +195,19 @@ class ServiceEntrySpanProcessor(SpanProcessor):
         parent_context (context.Context | None): The parent context, if any. Defaults to None.
         """
         # Only caches for service entry spans
-        parent_span_context = span.parent
-        if (
-            parent_span_context
-            and parent_span_context.is_valid
-            and not parent_span_context.is_remote
-        ):
+        if not is_entry_span(span):
             return
+        self.start_entry_span(span)
+
+    def start_entry_span(self, span: Span) -> None:
+        """
+        Set default transaction name and attach entry span to context.
 
+        Assumes the caller has already checked that span is a service entry span.
+
+        Parameters:
+        span (Span): The entry span that is starting.
+        """
         # Calculate non-custom txn name for entry span if we can retrieve the URL
         # or serverless name. Otherwise, use the span's name
         sw_apm_txn_name = os.environ.get("SW_APM_TRANSACTION_NAME", None)
@@ -132,27 +233,26 @@ class ServiceEntrySpanProcessor(SpanProcessor):
 
         # Cache the entry span in current context to use upstream-managed
         # execution scope and handle async tracing, for custom naming
-        entry_trace_span_id = W3CTransformer.trace_and_span_id_from_context(
-            span.context
-        )
-        logger.debug(
-            "Attaching context with key %s as entry span with name: %s, trace/span id: %s",
-            INTL_SWO_OTEL_CONTEXT_ENTRY_SPAN,
-            span.name,
-            entry_trace_span_id,
-        )
+        span_context = span.context
+        entry_key = (span_context.trace_id, span_context.span_id)
         token = context.attach(
             context.set_value(
                 INTL_SWO_OTEL_CONTEXT_ENTRY_SPAN,
                 span,
             )
         )
-        logger.debug(
-            "Storing token %s for trace/span id %s",
-            token,
-            entry_trace_span_id,
-        )
-        self.context_tokens[entry_trace_span_id] = token
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Attached context with key %s as entry span with name: %s, trace/span id: %s, token: %s",
+                INTL_SWO_OTEL_CONTEXT_ENTRY_SPAN,
+                span.name,
+                W3CTransformer.trace_and_span_id_from_context(span_context),
+                token,
+            )
+        if not self._store_token(entry_key, token):
+            # Untracked, so on_end could not detach it: restore the context
+            # now instead of leaving the entry span attached on this thread
+            context.detach(token)
 
     def _on_ending(self, span: Span) -> None:
         """
@@ -169,14 +269,19 @@ class ServiceEntrySpanProcessor(SpanProcessor):
         span (Span): The span that is ending (still mutable).
         """
         # Only process entry spans
-        parent_span_context = span.parent
-        if (
-            parent_span_context
-            and parent_span_context.is_valid
-            and not parent_span_context.is_remote
-        ):
+        if not is_entry_span(span):
             return
+        self.finalize_entry_span(span)
+
+    def finalize_entry_span(self, span: Span) -> None:
+        """
+        Register entry span transaction name with the pool.
 
+        Assumes the caller has already checked that span is a service entry span.
+
+        Parameters:
+        span (Span): The entry span that is ending (still mutable).
+        """
         # Read whatever transaction name is set (initial OR user-set)
         txn_name = span.attributes.get(INTL_SWO_TRANSACTION_ATTR_KEY)
         if txn_name:
@@ -204,29 +309,55 @@ class ServiceEntrySpanProcessor(SpanProcessor):
         span (ReadableSpan): The span that has ended.
         """
         # Only attempt for service entry spans
-        parent_span_context = span.parent
-        if (
-            parent_span_context
-            and parent_span_context.is_valid
-            and not parent_span_context.is_remote
-        ):
+        if not is_entry_span(span):
             return
 
-        entry_trace_span_id = W3CTransformer.trace_and_span_id_from_context(
-            span.context
-        )
-        # Retrieve the token corresponding to this trace/span id,
-        # reset its context (detach), and removes token from APM's cache
-        token = self.context_tokens.pop(entry_trace_span_id, None)
+        span_context = span.context
+        token = self.pop_entry_token(span_context)
         if token is None:
             logger.debug(
                 "No token found for entry trace/span id: %s",
-                entry_trace_span_id,
+                W3CTransformer.trace_and_span_id_from_context(span_context),
             )
             return
-        logger.debug(
-            "Detaching from context using token %s from trace/span id: %s",
-            token,
-            entry_trace_span_id,
-        )
+        self.detach_entry_token(span_context, token)
+
+    def pop_entry_token(self, span_context: SpanContext) -> object | None:
+        """
+        Remove and return the context token cached for the span context.
+
+        Parameters:
+        span_context (SpanContext): The span context to look up.
+
+        Returns:
+        object | None: The context token, or None if not cached.
+        """
+        # Retrieve the token corresponding to this trace/span id
+        # and remove token from APM's cache
+        with self._lock:
+            cached = self.context_tokens.pop(
+                (span_context.trace_id, span_context.span_id), None
+            )
+        if cached is None:
+            return None
+        return cached[0]
+
+    def detach_entry_token(
+        self,
+        span_context: SpanContext,
+        token: object,
+    ) -> None:
+        """
+        Reset the context attached at entry span start.
+
+        Parameters:
+        span_context (SpanContext): The entry span context, for logging.
+        token (object): The context token returned by attach.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Detaching from context using token %s from trace/span id: %s",
+                token,
+                W3CTransformer.trace_and_span_id_from_context(span_context),
+            )
         context.detach(token)
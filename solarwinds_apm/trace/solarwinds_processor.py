@@ -0,0 +1,104 @@
+# © 2026 SolarWinds Worldwide, LLC. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with the License. You may obtain a copy of the License at:http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
+
+"""Fused SolarWinds span processor for transaction naming, context and metrics."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from opentelemetry import context
+from opentelemetry.sdk.trace import Span, SpanProcessor
+
+from solarwinds_apm.trace.response_time_processor import ResponseTimeProcessor
+from solarwinds_apm.trace.serviceentry_processor import (
+    ServiceEntrySpanProcessor,
+    is_entry_span,
+)
+
+if TYPE_CHECKING:
+    from opentelemetry.sdk.trace import ReadableSpan
+
+    from solarwinds_apm.apm_config import SolarWindsApmConfig
+
+logger = logging.getLogger(__name__)
+
+
+class SolarWindsSpanProcessor(SpanProcessor):
+    """
+    Span processor combining ServiceEntrySpanProcessor and ResponseTimeProcessor.
+
+    Registered as a single processor so that the SDK makes one processor call
+    per span hook. Each hook classifies the span with is_entry_span, which
+    reads only the span's parent and takes no lock, so a non-entry span
+    returns without touching the shared token cache. Only entry spans pop
+    their context token; an entry span whose token was swept as leaked
+    (see CONTEXT_TOKENS_TTL) still gets its name finalized and its
+    response time recorded.
+    """
+
+    def __init__(
+        self,
+        apm_config: SolarWindsApmConfig,
+        record_response_time: bool = True,
+    ) -> None:
+        """
+        Initialize the SolarWindsSpanProcessor.
+
+        Parameters:
+        apm_config (SolarWindsApmConfig): The APM configuration object.
+        record_response_time (bool): Whether to record response_time metrics. Defaults to True.
+        """
+        self.service_entry_processor = ServiceEntrySpanProcessor()
+        self.response_time_processor = None
+        if record_response_time:
+            self.response_time_processor = ResponseTimeProcessor(apm_config)
+
+    def on_start(
+        self,
+        span: Span,
+        parent_context: context.Context | None = None,
+    ) -> None:
+        """
+        Classify span and, if entry span, set transaction name and attach context.
+
+        Parameters:
+        span (Span): The span that is starting.
+        parent_context (context.Context | None): The parent context, if any. Defaults to None.
+        """
+        if not is_entry_span(span):
+            return
+        self.service_entry_processor.start_entry_span(span)
+
+    def _on_ending(self, span: Span) -> None:
+        """
+        Finalize transaction name of entry spans.
+
+        Parameters:
+        span (Span): The span that is ending (still mutable).
+        """
+        if not is_entry_span(span):
+            return
+        self.service_entry_processor.finalize_entry_span(span)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        """
+        Detach context and record response_time metrics of entry spans.
+
+        Parameters:
+        span (ReadableSpan): The span that has ended.
+        """
+        if not is_entry_span(span):
+            return
+        span_context = span.context
+        token = self.service_entry_processor.pop_entry_token(span_context)
+        if token is not None:
+            self.service_entry_processor.detach_entry_token(
+                span_context, token
+            )
+        if self.response_time_processor:
+            self.response_time_processor.record_response_time(span)
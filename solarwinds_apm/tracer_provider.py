@@ -6,25 +6,43 @@
 
 """SolarWinds TracerProvider with custom shutdown behavior."""
 
+import sys
+from typing import TYPE_CHECKING
+
 from opentelemetry.sdk.trace import TracerProvider
 from typing_extensions import override
 
-from solarwinds_apm.oboe.http_sampler import HttpSampler
+if TYPE_CHECKING:
+    from solarwinds_apm.config_watcher import ConfigWatcher
+
+# Not imported here: it pulls in requests, which Lambda does not need
+_HTTP_SAMPLER_MODULE = "solarwinds_apm.oboe.http_sampler"
 
 
 class SolarwindsTracerProvider(TracerProvider):
     """Provide custom TracerProvider with HttpSampler shutdown support.
 
-    Extends OpenTelemetry TracerProvider to properly shutdown HttpSampler.
+    Extends OpenTelemetry TracerProvider to properly shutdown HttpSampler
+    and the ConfigWatcher polling the config file for its sampler.
     """
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.config_watcher: ConfigWatcher | None = None
+
     @override
     def shutdown(self) -> None:
         """
         Shutdown the tracer provider and its sampler.
 
-        Ensures HttpSampler daemon thread is properly terminated before parent shutdown.
+        Ensures HttpSampler and ConfigWatcher daemon threads are properly terminated before parent shutdown.
         """
-        if isinstance(self.sampler, HttpSampler):
+        if self.config_watcher is not None:
+            self.config_watcher.shutdown()
+        # An HttpSampler can only exist if its module was imported
+        http_sampler = sys.modules.get(_HTTP_SAMPLER_MODULE)
+        if http_sampler is not None and isinstance(
+            self.sampler, http_sampler.HttpSampler
+        ):
             self.sampler.shutdown()
         super().shutdown()
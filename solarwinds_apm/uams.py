@@ -6,6 +6,7 @@
 
 import logging
 import os
+import threading
 
 import requests
 from opentelemetry.context import (
@@ -14,7 +15,11 @@ from opentelemetry.context import (
     detach,
     set_value,
 )
-from opentelemetry.sdk.resources import Resource, ResourceDetector
+from opentelemetry.sdk.resources import (
+    OTELResourceDetector,
+    Resource,
+    ResourceDetector,
+)
 from opentelemetry.semconv.resource import ResourceAttributes
 
 logger = logging.getLogger(__name__)
@@ -30,6 +35,13 @@ UAMS_CLIENT_PATH = (
 UAMS_CLIENT_URL = "http://127.0.0.1:2113/info/uamsclient"
 UAMS_CLIENT_ID_FIELD = "uamsclient_id"
 
+# Look up the client id from the API in the background instead of during
+# resource detection. Read from the environment because detection runs
+# before SolarWindsApmConfig exists.
+UAMS_BACKGROUND_ENV = "SW_APM_UAMS_BACKGROUND"
+# Seconds to wait for the background lookup before building the providers
+UAMS_BACKGROUND_WAIT = 0.25
+
 
 def _read_from_file(uams_file: str) -> dict:
     """
@@ -82,6 +94,85 @@ def _read_from_api() -> dict:
         return {}
 
 
+class _BackgroundLookup:
+    """UAMS client id API lookup running while the rest of startup proceeds.
+
+    The resource of the providers is immutable once built, so the result is
+    only used if the lookup completes before the providers are created; see
+    background_attributes.
+    """
+
+    def __init__(self) -> None:
+        self._done = threading.Event()
+        self._attributes: dict = {}
+
+    def start(self) -> None:
+        """Start the lookup on a daemon thread."""
+        threading.Thread(
+            target=self._run, name="solarwinds-uams", daemon=True
+        ).start()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Wait for the lookup to complete.
+
+        Parameters:
+        timeout (float | None): Seconds to wait. Defaults to None, no limit.
+
+        Returns:
+        bool: True if the lookup completed.
+        """
+        return self._done.wait(timeout)
+
+    @property
+    def attributes(self) -> dict:
+        return self._attributes
+
+    def _run(self) -> None:
+        self._attributes = _read_from_api()
+        self._done.set()
+        if self._attributes:
+            logger.debug("UAMS client id found in background")
+
+
+_background_lookup: _BackgroundLookup | None = None
+
+
+def background_attributes(timeout: float = UAMS_BACKGROUND_WAIT) -> dict:
+    """
+    Get the UAMS attributes of a background lookup for the final resource.
+
+    Waits at most timeout for the lookup, which started at detection and
+    ran during the rest of startup. If it has not completed by then, the
+    attributes are left off until restart. Attributes set through
+    OTEL_RESOURCE_ATTRIBUTES or OTEL_SERVICE_NAME still take precedence,
+    as they do in detection.
+
+    Parameters:
+    timeout (float): Seconds to wait for the lookup. Defaults to UAMS_BACKGROUND_WAIT.
+
+    Returns:
+    dict: UAMS attributes to add to the resource, or empty dict.
+    """
+    if _background_lookup is None:
+        return {}
+    if not _background_lookup.wait(timeout):
+        logger.info(
+            "UAMS client id lookup did not complete during startup; "
+            "resource will not include it until restart"
+        )
+        return {}
+    attributes = _background_lookup.attributes
+    if not attributes:
+        return {}
+    configured = OTELResourceDetector().detect().attributes
+    return {
+        key: value
+        for key, value in attributes.items()
+        if key not in configured
+    }
+
+
 class UamsResourceDetector(ResourceDetector):
     """Detect UAMS client attributes for SolarWinds APM resource identification."""
 
@@ -94,13 +185,26 @@ class UamsResourceDetector(ResourceDetector):
         """
         super().__init__()
         self._uams = uams
+        self.deferred = False
 
     def detect(self) -> Resource:
         """
         Detect UAMS resource attributes.
 
+        If the client id file is missing and SW_APM_UAMS_BACKGROUND is true,
+        returns without the attributes and looks up the API in the
+        background instead; see background_attributes.
+
         Returns:
         Resource: Resource with UAMS client ID and host ID attributes if available.
         """
-        attributes = _read_from_file(self._uams) or _read_from_api() or {}
-        return Resource(attributes)
+        attributes = _read_from_file(self._uams)
+        if attributes:
+            return Resource(attributes)
+        if os.environ.get(UAMS_BACKGROUND_ENV, "").lower() == "true":
+            global _background_lookup  # pylint: disable=global-statement
+            _background_lookup = _BackgroundLookup()
+            _background_lookup.start()
+            self.deferred = True
+            return Resource.get_empty()
+        return Resource(_read_from_api())
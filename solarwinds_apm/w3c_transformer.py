@@ -6,20 +6,46 @@
 
 """Provides functionality to transform OpenTelemetry Data to SolarWinds Observability data."""
 
+from functools import lru_cache
+
 from opentelemetry.sdk.trace import SpanContext
 from opentelemetry.trace.span import INVALID_SPAN_ID, TraceState
 
 from solarwinds_apm.apm_constants import INTL_SWO_X_OPTIONS_RESPONSE_KEY
 
+# Formatted values are cached by the integer IDs they are built from, so
+# each is formatted once per span however many headers or logs use it
+W3C_FORMAT_CACHE_MAX = 4096
+
+
+@lru_cache(maxsize=W3C_FORMAT_CACHE_MAX)
+def _traceparent(trace_id: int, span_id: int, trace_flags: int) -> str:
+    return f"00-{trace_id:032x}-{span_id:016x}-{trace_flags:02x}"
+
+
+@lru_cache(maxsize=W3C_FORMAT_CACHE_MAX)
+def _sw(span_id: int, trace_flags: int) -> str:
+    return f"{span_id:016x}-{trace_flags:02x}"
+
+
+@lru_cache(maxsize=W3C_FORMAT_CACHE_MAX)
+def _trace_and_span_id(trace_id: int, span_id: int) -> str:
+    return f"{trace_id:032x}-{span_id:016x}"
+
+
+@lru_cache(maxsize=W3C_FORMAT_CACHE_MAX)
+def _span_id(span_id: int) -> str:
+    return f"{span_id:016x}"
+
+
+_TRACE_FLAGS = tuple(f"{trace_flags:02x}" for trace_flags in range(256))
+
 
 class W3CTransformer:
     """Transform inputs to W3C-compliant data for SolarWinds context propagation."""
 
-    _DECISION = "{}"
     _SPAN_ID_HEX = "{:016x}"
     _TRACE_FLAGS_HEX = "{:02x}"
-    _TRACE_ID_HEX = "{:032x}"
-    _VERSION = "00"
 
     @classmethod
     def span_id_from_int(cls, span_id: int) -> str:
@@ -32,7 +58,7 @@ class W3CTransformer:
         Returns:
         str: The span ID formatted as 16-character hexadecimal string.
         """
-        return cls._SPAN_ID_HEX.format(span_id)
+        return _span_id(span_id)
 
     @classmethod
     def span_id_from_sw(cls, sw_val: str) -> str:
@@ -62,6 +88,8 @@ class W3CTransformer:
         Returns:
         str: The trace flags formatted as 2-character hexadecimal string.
         """
+        if 0 <= trace_flags < 256:
+            return _TRACE_FLAGS[trace_flags]
         return cls._TRACE_FLAGS_HEX.format(trace_flags)
 
     @classmethod
@@ -75,20 +103,11 @@ class W3CTransformer:
         Returns:
         str: W3C traceparent header value (format: "00-<trace_id>-<span_id>-<flags>").
         """
-        template = "-".join(
-            [
-                cls._VERSION,
-                cls._TRACE_ID_HEX,
-                cls._SPAN_ID_HEX,
-                cls._TRACE_FLAGS_HEX,
-            ]
-        )
-        xtr = template.format(
+        return _traceparent(
             span_context.trace_id,
             span_context.span_id,
             span_context.trace_flags,
         )
-        return xtr
 
     @classmethod
     def sw_from_context(cls, span_context: SpanContext) -> str:
@@ -103,8 +122,7 @@ class W3CTransformer:
         Returns:
         str: SW tracestate value (format: "<span_id>-<flags>", e.g., "1a2b3c4d5e6f7g8h-01").
         """
-        sw = "-".join([cls._SPAN_ID_HEX, cls._TRACE_FLAGS_HEX])
-        return sw.format(span_context.span_id, span_context.trace_flags)
+        return _sw(span_context.span_id, span_context.trace_flags)
 
     @classmethod
     def trace_and_span_id_from_context(cls, span_context: SpanContext) -> str:
@@ -117,8 +135,7 @@ class W3CTransformer:
         Returns:
         str: Trace and span IDs (format: "<32-byte-trace-id>-<16-byte-span-id>").
         """
-        trace_span = "-".join([cls._TRACE_ID_HEX, cls._SPAN_ID_HEX])
-        return trace_span.format(span_context.trace_id, span_context.span_id)
+        return _trace_and_span_id(span_context.trace_id, span_context.span_id)
 
     @classmethod
     def sw_from_span_and_decision(cls, span_id: int, decision: str) -> str:
@@ -134,8 +151,7 @@ class W3CTransformer:
         Returns:
         str: SW tracestate value (format: "<span_id>-<decision>", e.g., "1a2b3c4d5e6f7g8h-01").
         """
-        sw = "-".join([cls._SPAN_ID_HEX, cls._DECISION])
-        return sw.format(span_id, decision)
+        return f"{_span_id(span_id)}-{decision}"
 
     @classmethod
     def remove_response_from_sw(cls, trace_state: TraceState) -> TraceState:
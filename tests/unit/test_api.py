@@ -8,6 +8,7 @@ from opentelemetry.sdk.trace.sampling import ParentBased
 from opentelemetry.trace import NoOpTracerProvider
 
 from solarwinds_apm.api import (
+    get_transaction_percentiles,
     set_transaction_name,
     solarwinds_ready,
 )
@@ -96,7 +97,7 @@ class TestSolarWindsReady:
             wait_until_ready=mocker.Mock(return_value=True)
         )
         mocker.patch(
-            "solarwinds_apm.sampler.HttpSampler",
+            "solarwinds_apm.oboe.http_sampler.HttpSampler",
             return_value=mock_http_sampler,
         )
         mock_sampler = ParentBasedSwSampler(mock_apmconfig)
@@ -129,7 +130,7 @@ class TestSolarWindsReady:
             wait_until_ready=mocker.Mock(return_value=False)
         )
         mocker.patch(
-            "solarwinds_apm.sampler.HttpSampler",
+            "solarwinds_apm.oboe.http_sampler.HttpSampler",
             return_value=mock_http_sampler,
         )
         mock_sampler = ParentBasedSwSampler(mock_apmconfig)
@@ -210,3 +211,22 @@ class TestSolarWindsReady:
             return_value=mock_tracer_provider,
         )
         assert not solarwinds_ready()
+
+
+class TestGetTransactionPercentiles:
+    def test_not_enabled(self, mocker):
+        mocker.patch(
+            "solarwinds_apm.api.get_response_time_percentiles",
+            return_value=None,
+        )
+        assert get_transaction_percentiles("foo") == {}
+
+    def test_enabled(self, mocker):
+        mock_store = mocker.Mock()
+        mock_store.percentiles.return_value = {0.99: 123.0}
+        mocker.patch(
+            "solarwinds_apm.api.get_response_time_percentiles",
+            return_value=mock_store,
+        )
+        assert get_transaction_percentiles("foo", (0.99,)) == {0.99: 123.0}
+        mock_store.percentiles.assert_called_once_with("foo", (0.99,))
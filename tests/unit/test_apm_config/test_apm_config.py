@@ -597,6 +597,48 @@ class TestSolarWindsApmConfig:
         assert test_config.get("export_metrics_enabled")
         assert "Ignore config option" in caplog.text
 
+    def test_set_config_value_default_response_time_percentiles(
+        self,
+    ):
+        test_config = apm_config.SolarWindsApmConfig()
+        assert test_config.get("response_time_percentiles") is False
+
+    def test_set_config_value_default_response_headers_trigger_trace_only(
+        self,
+    ):
+        test_config = apm_config.SolarWindsApmConfig()
+        assert test_config.get("response_headers_trigger_trace_only") is False
+
+    def test_set_config_value_default_tracestate_capture(
+        self,
+    ):
+        test_config = apm_config.SolarWindsApmConfig()
+        assert test_config.get("tracestate_capture") is True
+
+    def test_set_config_value_default_self_profiling(
+        self,
+    ):
+        test_config = apm_config.SolarWindsApmConfig()
+        assert test_config.get("self_profiling") is False
+
+    def test_set_config_value_default_config_reload_interval(
+        self,
+    ):
+        test_config = apm_config.SolarWindsApmConfig()
+        assert test_config.get("config_reload_interval") == 0
+
+    def test_set_config_value_default_transaction_buckets(
+        self,
+    ):
+        test_config = apm_config.SolarWindsApmConfig()
+        assert test_config.get("transaction_buckets") == 0
+
+    def test_set_config_value_default_target_traces_per_second(
+        self,
+    ):
+        test_config = apm_config.SolarWindsApmConfig()
+        assert test_config.get("target_traces_per_second") == 0.0
+
     def test_set_config_value_set_export_metrics_enabled_false(
         self,
         caplog,
@@ -837,6 +879,9 @@ def test_to_configuration_default(apm):
     assert config.trigger_trace_enabled == (apm.get("trigger_trace") == 1)
     assert config.transaction_name == apm.get("transaction_name")
     assert isinstance(config.transaction_settings, list)
+    assert config.tracestate_capture is True
+    assert config.transaction_buckets == 0
+    assert config.target_traces_per_second == 0.0
 
 
 def test_to_configuration_with_service_key(apm):
@@ -867,6 +912,24 @@ def test_to_configuration_with_disabled_trigger_trace(apm):
     assert config.trigger_trace_enabled is False
 
 
+def test_to_configuration_with_disabled_tracestate_capture(apm):
+    apm._set_config_value("tracestate_capture", "false")
+    config = apm_config.SolarWindsApmConfig.to_configuration(apm_config=apm)
+    assert config.tracestate_capture is False
+
+
+def test_to_configuration_with_transaction_buckets(apm):
+    apm._set_config_value("transaction_buckets", "50")
+    config = apm_config.SolarWindsApmConfig.to_configuration(apm_config=apm)
+    assert config.transaction_buckets == 50
+
+
+def test_to_configuration_with_target_traces_per_second(apm):
+    apm._set_config_value("target_traces_per_second", "2.5")
+    config = apm_config.SolarWindsApmConfig.to_configuration(apm_config=apm)
+    assert config.target_traces_per_second == 2.5
+
+
 def test_to_configuration_with_empty_transaction_filters(apm):
     apm._set_config_value("transaction_filters", [])
     config = apm_config.SolarWindsApmConfig.to_configuration(apm_config=apm)
@@ -371,3 +371,264 @@ class TestSolarWindsApmConfigCnfFile:
         # Should only appear once
         assert len(log_messages) == 1
         assert "./solarwinds-apm-config.json" in log_messages[0]
+
+    def test_get_cnf_dict_parses_file_once(
+        self,
+        mocker,
+        tmp_path,
+    ):
+        cnf_path = tmp_path / "solarwinds-apm-config.json"
+        cnf_path.write_text('{"collector": "foo-bar"}', encoding="utf-8")
+        mocker.patch.dict(os.environ, {"SW_APM_CONFIG_FILE": str(cnf_path)})
+        mocker.patch.object(apm_config.SolarWindsApmConfig, "_cnf_cache", None)
+        mock_loads = mocker.patch(
+            "solarwinds_apm.apm_config.json.loads",
+            wraps=apm_config.json.loads,
+        )
+
+        result1 = apm_config.SolarWindsApmConfig.get_cnf_dict()
+        assert apm_config.SolarWindsApmConfig.calculate_collector() == (
+            "foo-bar"
+        )
+        result2 = apm_config.SolarWindsApmConfig.get_cnf_dict()
+        assert result1 == {"collector": "foo-bar"}
+        assert result2 is result1
+        mock_loads.assert_called_once()
+
+    def test_get_cnf_dict_reloads_changed_file(
+        self,
+        mocker,
+        tmp_path,
+    ):
+        cnf_path = tmp_path / "solarwinds-apm-config.json"
+        cnf_path.write_text('{"collector": "foo"}', encoding="utf-8")
+        mocker.patch.dict(os.environ, {"SW_APM_CONFIG_FILE": str(cnf_path)})
+        mocker.patch.object(apm_config.SolarWindsApmConfig, "_cnf_cache", None)
+
+        assert apm_config.SolarWindsApmConfig.get_cnf_dict() == {
+            "collector": "foo"
+        }
+        cnf_path.write_text('{"collector": "foo-bar"}', encoding="utf-8")
+        assert apm_config.SolarWindsApmConfig.get_cnf_dict() == {
+            "collector": "foo-bar"
+        }
+
+    def test_get_cnf_dict_caches_invalid_json(
+        self,
+        mocker,
+        tmp_path,
+        caplog,
+    ):
+        cnf_path = tmp_path / "solarwinds-apm-config.json"
+        cnf_path.write_text("invalid-foo", encoding="utf-8")
+        mocker.patch.dict(os.environ, {"SW_APM_CONFIG_FILE": str(cnf_path)})
+        mocker.patch.object(apm_config.SolarWindsApmConfig, "_cnf_cache", None)
+
+        assert apm_config.SolarWindsApmConfig.get_cnf_dict() is None
+        assert apm_config.SolarWindsApmConfig.get_cnf_dict() is None
+        errors = [
+            record
+            for record in caplog.records
+            if "Invalid config file" in record.message
+        ]
+        assert len(errors) == 1
+
+    def test_update_with_env_var_ignores_other_case(
+        self,
+        mocker,
+        mock_env_vars,
+    ):
+        mocker.patch.dict(
+            os.environ,
+            {
+                "SW_APM_TRACING_MODE": "disabled",
+                "SW_APM_Trigger_Trace": "disabled",
+                "SW_APM_NOT_A_CONFIG_KEY": "foo",
+            },
+        )
+        resulting_config = apm_config.SolarWindsApmConfig()
+        assert resulting_config.get("tracing_mode") == 0
+        assert resulting_config.get("trigger_trace") == 1
+        assert resulting_config.get("not_a_config_key") is None
+
+    def test_reload_cnf_file_unchanged(
+        self,
+        mocker,
+        tmp_path,
+        mock_env_vars,
+    ):
+        cnf_path = tmp_path / "solarwinds-apm-config.json"
+        cnf_path.write_text('{"tracingMode": "disabled"}', encoding="utf-8")
+        mocker.patch.dict(os.environ, {"SW_APM_CONFIG_FILE": str(cnf_path)})
+        mocker.patch.object(apm_config.SolarWindsApmConfig, "_cnf_cache", None)
+        resulting_config = apm_config.SolarWindsApmConfig()
+        assert resulting_config.get("tracing_mode") == 0
+        assert resulting_config.reload_cnf_file() is False
+
+    def test_reload_cnf_file_changed(
+        self,
+        mocker,
+        tmp_path,
+        mock_env_vars,
+    ):
+        cnf_path = tmp_path / "solarwinds-apm-config.json"
+        cnf_path.write_text(
+            '{"tracingMode": "disabled", "collector": "foo-bar"}',
+            encoding="utf-8",
+        )
+        mocker.patch.dict(os.environ, {"SW_APM_CONFIG_FILE": str(cnf_path)})
+        mocker.patch.object(apm_config.SolarWindsApmConfig, "_cnf_cache", None)
+        resulting_config = apm_config.SolarWindsApmConfig()
+        configuration = apm_config.SolarWindsApmConfig.to_configuration(
+            resulting_config
+        )
+        assert resulting_config.get("tracing_mode") == 0
+
+        cnf_path.write_text(
+            '{"triggerTrace": "disabled", "collector": "changed",'
+            ' "transactionSettings": [{"regex": "/health", "tracing": "disabled"}]}',
+            encoding="utf-8",
+        )
+        assert resulting_config.reload_cnf_file() is True
+        assert resulting_config.get("tracing_mode") == -1
+        assert resulting_config.get("trigger_trace") == 0
+        filters = resulting_config.get("transaction_filters")
+        assert len(filters) == 1
+        assert filters[0]["regex"].pattern == "/health"
+        assert filters[0]["tracing_mode"] == 0
+        # Only tracing options are reloaded
+        assert resulting_config.get("collector") == "foo-bar"
+        # Configuration built before the reload is unchanged
+        assert configuration.transaction_settings == []
+
+    def test_reload_cnf_file_invalid_keeps_options(
+        self,
+        mocker,
+        tmp_path,
+        mock_env_vars,
+    ):
+        cnf_path = tmp_path / "solarwinds-apm-config.json"
+        cnf_path.write_text(
+            '{"tracingMode": "disabled",'
+            ' "transactionSettings": [{"regex": "/health", "tracing": "disabled"}]}',
+            encoding="utf-8",
+        )
+        mocker.patch.dict(os.environ, {"SW_APM_CONFIG_FILE": str(cnf_path)})
+        mocker.patch.object(apm_config.SolarWindsApmConfig, "_cnf_cache", None)
+        resulting_config = apm_config.SolarWindsApmConfig()
+        assert resulting_config.get("tracing_mode") == 0
+
+        # Half-written file
+        cnf_path.write_text('{"tracingMode": "ena', encoding="utf-8")
+        assert resulting_config.reload_cnf_file() is False
+        assert resulting_config.get("tracing_mode") == 0
+        assert len(resulting_config.get("transaction_filters")) == 1
+
+        cnf_path.write_text('{"tracingMode": "enabled"}', encoding="utf-8")
+        assert resulting_config.reload_cnf_file() is True
+        assert resulting_config.get("tracing_mode") == 1
+        assert resulting_config.get("transaction_filters") == []
+
+    def test_reload_cnf_file_invalid_warns_once(
+        self,
+        mocker,
+        tmp_path,
+        mock_env_vars,
+        caplog,
+    ):
+        cnf_path = tmp_path / "solarwinds-apm-config.json"
+        cnf_path.write_text('{"tracingMode": "disabled"}', encoding="utf-8")
+        mocker.patch.dict(os.environ, {"SW_APM_CONFIG_FILE": str(cnf_path)})
+        mocker.patch.object(apm_config.SolarWindsApmConfig, "_cnf_cache", None)
+        resulting_config = apm_config.SolarWindsApmConfig()
+
+        def warnings():
+            return [
+                record
+                for record in caplog.records
+                if record.levelno >= logging.WARNING
+                and "could not be loaded" in record.message
+            ]
+
+        cnf_path.write_text("invalid-foo", encoding="utf-8")
+        for _ in range(3):
+            assert resulting_config.reload_cnf_file() is False
+        assert len(warnings()) == 1
+
+        cnf_path.write_text('{"tracingMode": "enabled"}', encoding="utf-8")
+        assert resulting_config.reload_cnf_file() is True
+        cnf_path.write_text("invalid-bar", encoding="utf-8")
+        assert resulting_config.reload_cnf_file() is False
+        assert len(warnings()) == 2
+
+    def test_reload_cnf_file_missing_logs_once(
+        self,
+        mocker,
+        tmp_path,
+        mock_env_vars,
+        caplog,
+    ):
+        cnf_path = tmp_path / "solarwinds-apm-config.json"
+        cnf_path.write_text('{"tracingMode": "disabled"}', encoding="utf-8")
+        mocker.patch.dict(os.environ, {"SW_APM_CONFIG_FILE": str(cnf_path)})
+        mocker.patch.object(apm_config.SolarWindsApmConfig, "_cnf_cache", None)
+        resulting_config = apm_config.SolarWindsApmConfig()
+
+        cnf_path.unlink()
+        for _ in range(3):
+            assert resulting_config.reload_cnf_file() is False
+        errors = [
+            record
+            for record in caplog.records
+            if record.levelno >= logging.WARNING
+            and "Invalid config file path" in record.message
+        ]
+        assert len(errors) == 1
+
+    def test_reload_cnf_file_same_size_and_mtime(
+        self,
+        mocker,
+        tmp_path,
+        mock_env_vars,
+    ):
+        cnf_path = tmp_path / "solarwinds-apm-config.json"
+        cnf_path.write_text('{"tracingMode": "disabled"}', encoding="utf-8")
+        mocker.patch.dict(os.environ, {"SW_APM_CONFIG_FILE": str(cnf_path)})
+        mocker.patch.object(apm_config.SolarWindsApmConfig, "_cnf_cache", None)
+        resulting_config = apm_config.SolarWindsApmConfig()
+        assert resulting_config.get("tracing_mode") == 0
+        mtime_ns = cnf_path.stat().st_mtime_ns
+
+        # Same size, written within the same timestamp tick
+        cnf_path.write_text('{"tracingMode": "enabled" }', encoding="utf-8")
+        os.utime(cnf_path, ns=(mtime_ns, mtime_ns))
+        assert resulting_config.reload_cnf_file() is True
+        assert resulting_config.get("tracing_mode") == 1
+        assert resulting_config.reload_cnf_file() is False
+
+    def test_reload_cnf_file_keeps_env_var_precedence(
+        self,
+        mocker,
+        tmp_path,
+        mock_env_vars,
+    ):
+        cnf_path = tmp_path / "solarwinds-apm-config.json"
+        cnf_path.write_text('{"tracingMode": "enabled"}', encoding="utf-8")
+        mocker.patch.dict(
+            os.environ,
+            {
+                "SW_APM_CONFIG_FILE": str(cnf_path),
+                "SW_APM_TRACING_MODE": "disabled",
+            },
+        )
+        mocker.patch.object(apm_config.SolarWindsApmConfig, "_cnf_cache", None)
+        resulting_config = apm_config.SolarWindsApmConfig()
+        assert resulting_config.get("tracing_mode") == 0
+
+        cnf_path.write_text(
+            '{"tracingMode": "enabled", "triggerTrace": "disabled"}',
+            encoding="utf-8",
+        )
+        assert resulting_config.reload_cnf_file() is True
+        assert resulting_config.get("tracing_mode") == 0
+        assert resulting_config.get("trigger_trace") == 0
@@ -4,28 +4,48 @@
 #
 # Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
 
-from opentelemetry.sdk.resources import Resource
+import os
+import time
+
+import pytest
+from opentelemetry.sdk.resources import Resource, ResourceDetector
 
 from solarwinds_apm import apm_resource
 from solarwinds_apm.version import __version__
 
 
-class TestCreateDetectorResource:
-    def test_create_detector_resource_calls_resource_create(self, mocker):
-        mock_resource = Resource.create({"test.attr": "test-value"})
-        mock_resource_create = mocker.patch(
-            "solarwinds_apm.apm_resource.Resource.create",
-            return_value=mock_resource,
-        )
-        result = apm_resource.create_detector_resource()
-        mock_resource_create.assert_called_once_with()
-        assert result == mock_resource
+class _Detector(ResourceDetector):
+    def __init__(self, attributes=None, delay=0.0, error=None, **kwargs):
+        super().__init__(**kwargs)
+        self.attributes = attributes or {}
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    def detect(self):
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return Resource(self.attributes)
 
+
+class TestCreateDetectorResource:
     def test_create_detector_resource_returns_resource(self):
         result = apm_resource.create_detector_resource()
         assert isinstance(result, Resource)
         assert hasattr(result, "attributes")
 
+    def test_create_detector_resource_matches_resource_create(self):
+        result = apm_resource.create_detector_resource()
+        expected = Resource.create()
+        assert set(result.attributes) == set(expected.attributes)
+        assert (
+            result.attributes["service.name"]
+            == (expected.attributes["service.name"])
+        )
+
     def test_create_detector_resource_includes_detector_attributes(
         self, mocker
     ):
@@ -34,18 +54,232 @@ class TestCreateDetectorResource:
             "process.executable.name": "python",
             "host.name": "test-host",
         }
-        mock_resource = Resource.create(detector_attrs)
         mocker.patch(
-            "solarwinds_apm.apm_resource.Resource.create",
-            return_value=mock_resource,
+            "solarwinds_apm.apm_resource._build_resource_detectors",
+            return_value=[_Detector(detector_attrs)],
         )
         result = apm_resource.create_detector_resource()
         assert result.attributes["process.pid"] == 12345
         assert result.attributes["process.executable.name"] == "python"
         assert result.attributes["host.name"] == "test-host"
+        assert result.attributes["telemetry.sdk.language"] == "python"
+        assert result.attributes["service.name"] == "unknown_service:python"
+
+    def test_create_detector_resource_merges_in_configured_order(self, mocker):
+        # The first detector finishes last but is still overridden
+        mocker.patch(
+            "solarwinds_apm.apm_resource._build_resource_detectors",
+            return_value=[
+                _Detector({"host.name": "first", "a": 1}, delay=0.05),
+                _Detector({"host.name": "second", "b": 2}),
+            ],
+        )
+        result = apm_resource.create_detector_resource()
+        assert result.attributes["host.name"] == "second"
+        assert result.attributes["a"] == 1
+        assert result.attributes["b"] == 2
+
+    def test_create_detector_resource_runs_detectors_concurrently(
+        self, mocker
+    ):
+        mocker.patch(
+            "solarwinds_apm.apm_resource._build_resource_detectors",
+            return_value=[_Detector({"n": i}, delay=0.2) for i in range(5)],
+        )
+        start = time.monotonic()
+        apm_resource.create_detector_resource()
+        assert time.monotonic() - start < 0.8
+
+    def test_create_detector_resource_skips_detectors_past_deadline(
+        self, mocker
+    ):
+        mocker.patch(
+            "solarwinds_apm.apm_resource._build_resource_detectors",
+            return_value=[
+                _Detector({"slow": True}, delay=2.0),
+                _Detector({"fast": True}),
+            ],
+        )
+        start = time.monotonic()
+        result = apm_resource.create_detector_resource(timeout=0.1)
+        assert time.monotonic() - start < 1.0
+        assert "slow" not in result.attributes
+        assert result.attributes["fast"] is True
+
+    def test_create_detector_resource_skips_failed_detectors(self, mocker):
+        mocker.patch(
+            "solarwinds_apm.apm_resource._build_resource_detectors",
+            return_value=[
+                _Detector(error=ValueError("no metadata")),
+                _Detector({"ok": True}),
+            ],
+        )
+        result = apm_resource.create_detector_resource()
+        assert result.attributes["ok"] is True
+
+    def test_create_detector_resource_raise_on_error(self, mocker):
+        mocker.patch(
+            "solarwinds_apm.apm_resource._build_resource_detectors",
+            return_value=[
+                _Detector(error=ValueError("no metadata"), raise_on_error=True)
+            ],
+        )
+        with pytest.raises(ValueError):
+            apm_resource.create_detector_resource()
+
+    def test_create_detector_resource_raise_on_error_timeout(self, mocker):
+        mocker.patch(
+            "solarwinds_apm.apm_resource._build_resource_detectors",
+            return_value=[_Detector(delay=2.0, raise_on_error=True)],
+        )
+        with pytest.raises(TimeoutError):
+            apm_resource.create_detector_resource(timeout=0.05)
+
+
+class TestResourceCache:
+    @pytest.fixture(autouse=True)
+    def cache_env(self, mocker, tmp_path):
+        cache_dir = tmp_path / "cache"
+        mocker.patch.dict(
+            os.environ,
+            {
+                "SW_APM_RESOURCE_CACHE": "true",
+                "SW_APM_RESOURCE_CACHE_DIR": str(cache_dir),
+            },
+        )
+        mocker.patch(
+            "solarwinds_apm.apm_resource._CACHED_DETECTORS",
+            frozenset((f"{__name__}._Detector",)),
+        )
+        return cache_dir
+
+    def detect_with(self, mocker, *detectors):
+        mocker.patch(
+            "solarwinds_apm.apm_resource._build_resource_detectors",
+            return_value=list(detectors),
+        )
+        return apm_resource.create_detector_resource()
+
+    def test_second_start_uses_cached_attributes(self, mocker, cache_env):
+        first = _Detector({"cloud.provider": "aws"})
+        self.detect_with(mocker, first)
+        assert first.calls == 1
+        assert len(list(cache_env.glob("resource-*.json"))) == 1
+
+        second = _Detector({"cloud.provider": "changed"})
+        result = self.detect_with(mocker, second)
+        assert second.calls == 0
+        assert result.attributes["cloud.provider"] == "aws"
+
+    def test_disabled_by_default(self, mocker, cache_env):
+        mocker.patch.dict(os.environ, {"SW_APM_RESOURCE_CACHE": ""})
+        self.detect_with(mocker, _Detector({"cloud.provider": "aws"}))
+        detector = _Detector({"cloud.provider": "aws"})
+        self.detect_with(mocker, detector)
+        assert detector.calls == 1
+        assert not cache_env.exists()
+
+    def test_expired_cache_detects_again(self, mocker):
+        mocker.patch.dict(os.environ, {"SW_APM_RESOURCE_CACHE_TTL": "0"})
+        self.detect_with(mocker, _Detector({"cloud.provider": "aws"}))
+        detector = _Detector({"cloud.provider": "gcp"})
+        result = self.detect_with(mocker, detector)
+        assert detector.calls == 1
+        assert result.attributes["cloud.provider"] == "gcp"
+
+    def test_different_key_detects_again(self, mocker):
+        mocker.patch(
+            "solarwinds_apm.apm_resource._resource_cache_key",
+            return_value="a" * 64,
+        )
+        self.detect_with(mocker, _Detector({"cloud.provider": "aws"}))
+        mocker.patch(
+            "solarwinds_apm.apm_resource._resource_cache_key",
+            return_value="a" * 32 + "b" * 32,
+        )
+        detector = _Detector({"cloud.provider": "gcp"})
+        result = self.detect_with(mocker, detector)
+        assert detector.calls == 1
+        assert result.attributes["cloud.provider"] == "gcp"
+
+    def test_uncached_detectors_always_run(self, mocker):
+        mocker.patch(
+            "solarwinds_apm.apm_resource._CACHED_DETECTORS", frozenset()
+        )
+        self.detect_with(mocker, _Detector({"process.pid": 1}))
+        detector = _Detector({"process.pid": 2})
+        result = self.detect_with(mocker, detector)
+        assert detector.calls == 1
+        assert result.attributes["process.pid"] == 2
+
+    def test_failed_detectors_are_not_cached(self, mocker):
+        self.detect_with(mocker, _Detector(error=ValueError("no metadata")))
+        detector = _Detector({"cloud.provider": "aws"})
+        result = self.detect_with(mocker, detector)
+        assert detector.calls == 1
+        assert result.attributes["cloud.provider"] == "aws"
+
+    def test_deferred_detectors_are_not_cached(self, mocker):
+        deferred = _Detector()
+        deferred.deferred = True
+        self.detect_with(mocker, deferred)
+        detector = _Detector({"sw.uams.client.id": "id"})
+        result = self.detect_with(mocker, detector)
+        assert detector.calls == 1
+        assert result.attributes["sw.uams.client.id"] == "id"
+
+    def test_creates_private_directory(self, mocker, cache_env):
+        self.detect_with(mocker, _Detector({"cloud.provider": "aws"}))
+        assert cache_env.stat().st_mode & 0o777 == 0o700
+
+    def test_shared_directory_is_not_used(self, mocker, cache_env):
+        cache_env.mkdir(mode=0o777)
+        cache_env.chmod(0o777)
+        self.detect_with(mocker, _Detector({"cloud.provider": "aws"}))
+        assert not list(cache_env.iterdir())
+
+    def test_directory_of_other_user_is_not_used(self, mocker, cache_env):
+        cache_env.mkdir(mode=0o700)
+        mocker.patch(
+            "solarwinds_apm.apm_resource.os.getuid",
+            return_value=os.getuid() + 1,
+        )
+        self.detect_with(mocker, _Detector({"cloud.provider": "aws"}))
+        assert not list(cache_env.iterdir())
+
+    def test_default_directory_is_per_user(self, mocker, tmp_path):
+        mocker.patch.dict(os.environ, {"SW_APM_RESOURCE_CACHE_DIR": ""})
+        mocker.patch(
+            "solarwinds_apm.apm_resource.tempfile.gettempdir",
+            return_value=str(tmp_path),
+        )
+        assert apm_resource._resource_cache_dir() == str(
+            tmp_path / f"solarwinds-apm-{os.getuid()}"
+        )
+
+    def test_corrupt_cache_detects_again(self, mocker, cache_env):
+        self.detect_with(mocker, _Detector({"cloud.provider": "aws"}))
+        for path in cache_env.glob("resource-*.json"):
+            path.write_text("not json", encoding="utf-8")
+        detector = _Detector({"cloud.provider": "aws"})
+        result = self.detect_with(mocker, detector)
+        assert detector.calls == 1
+        assert result.attributes["cloud.provider"] == "aws"
 
 
 class TestCreateApmResource:
+    def test_create_apm_resource_adds_uams_background_attributes(self, mocker):
+        mocker.patch(
+            "solarwinds_apm.uams.background_attributes",
+            return_value={"sw.uams.client.id": "foo-id", "host.id": "foo-id"},
+        )
+        result = apm_resource.create_apm_resource(
+            Resource({"host.id": "ec2-id", "service.name": "bar"}), "foo"
+        )
+        assert result.attributes["sw.uams.client.id"] == "foo-id"
+        assert result.attributes["host.id"] == "foo-id"
+        assert result.attributes["service.name"] == "foo"
+
     def test_create_apm_resource_adds_sw_attributes(self):
         detector_resource = Resource.create({"host.name": "test-host"})
         service_name = "test-service"
@@ -0,0 +1,56 @@
+# © 2026 SolarWinds Worldwide, LLC. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with the License. You may obtain a copy of the License at:http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
+
+import threading
+
+from solarwinds_apm.config_watcher import ConfigWatcher
+
+
+class TestConfigWatcher:
+    def test_check_unchanged(self, mocker):
+        apm_config = mocker.Mock()
+        apm_config.reload_cnf_file.return_value = False
+        sampler = mocker.Mock()
+        watcher = ConfigWatcher(apm_config, sampler, 1)
+        assert watcher.check() is False
+        sampler.update_configuration.assert_not_called()
+
+    def test_check_changed(self, mocker):
+        apm_config = mocker.Mock()
+        apm_config.reload_cnf_file.return_value = True
+        configuration = mocker.Mock()
+        mock_to_configuration = mocker.patch(
+            "solarwinds_apm.config_watcher.SolarWindsApmConfig.to_configuration",
+            return_value=configuration,
+        )
+        sampler = mocker.Mock()
+        watcher = ConfigWatcher(apm_config, sampler, 1)
+        assert watcher.check() is True
+        mock_to_configuration.assert_called_once_with(apm_config)
+        sampler.update_configuration.assert_called_once_with(configuration)
+
+    def test_check_error(self, mocker):
+        apm_config = mocker.Mock()
+        apm_config.reload_cnf_file.side_effect = ValueError("foo")
+        sampler = mocker.Mock()
+        watcher = ConfigWatcher(apm_config, sampler, 1)
+        assert watcher.check() is False
+        sampler.update_configuration.assert_not_called()
+
+    def test_polls_until_shutdown(self, mocker):
+        checked = threading.Event()
+        apm_config = mocker.Mock()
+        apm_config.reload_cnf_file.side_effect = lambda: checked.set()
+        watcher = ConfigWatcher(apm_config, mocker.Mock(), 0.01)
+        watcher.start()
+        assert checked.wait(5)
+        watcher.shutdown()
+        assert not watcher._thread.is_alive()
+
+    def test_shutdown_before_start(self, mocker):
+        watcher = ConfigWatcher(mocker.Mock(), mocker.Mock(), 1)
+        watcher.shutdown()
+        assert watcher._thread is None
@@ -249,17 +249,10 @@ def mock_fw_versions(mocker):
     )
 
 
-@pytest.fixture(name="mock_config_serviceentry_processor")
-def mock_config_serviceentry_processor(mocker):
+@pytest.fixture(name="mock_config_span_processor")
+def mock_config_span_processor(mocker):
     return mocker.patch(
-        "solarwinds_apm.configurator.SolarWindsConfigurator._configure_service_entry_span_processor"
-    )
-
-
-@pytest.fixture(name="mock_response_time_processor")
-def mock_response_time_processor(mocker):
-    return mocker.patch(
-        "solarwinds_apm.configurator.SolarWindsConfigurator._configure_response_time_processor"
+        "solarwinds_apm.configurator.SolarWindsConfigurator._configure_span_processor"
     )
 
 
@@ -296,6 +289,20 @@ def mock_config_response_propagator(mocker):
     )
 
 
+@pytest.fixture(name="mock_config_self_profiling")
+def mock_config_self_profiling(mocker):
+    return mocker.patch(
+        "solarwinds_apm.configurator.SolarWindsConfigurator._configure_self_profiling"
+    )
+
+
+@pytest.fixture(name="mock_config_config_watcher")
+def mock_config_config_watcher(mocker):
+    return mocker.patch(
+        "solarwinds_apm.configurator.SolarWindsConfigurator._configure_config_watcher"
+    )
+
+
 @pytest.fixture(name="mock_init_sw_reporter")
 def mock_init_sw_reporter(mocker):
     return mocker.patch(
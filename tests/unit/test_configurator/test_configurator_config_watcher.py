@@ -0,0 +1,84 @@
+# © 2026 SolarWinds Worldwide, LLC. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with the License. You may obtain a copy of the License at:http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
+
+import os
+
+from solarwinds_apm import configurator
+from solarwinds_apm.sampler import ParentBasedSwSampler
+from solarwinds_apm.tracer_provider import SolarwindsTracerProvider
+
+
+class TestConfiguratorConfigWatcher:
+    def test_configure_config_watcher_disabled(
+        self,
+        mocker,
+    ):
+        mock_watcher = mocker.patch(
+            "solarwinds_apm.configurator.ConfigWatcher",
+        )
+        test_configurator = configurator.SolarWindsConfigurator()
+        test_configurator._configure_config_watcher()
+        mock_watcher.assert_not_called()
+        assert test_configurator.config_watcher is None
+
+    def test_configure_config_watcher_enabled(
+        self,
+        mocker,
+    ):
+        mocker.patch.dict(os.environ, {"SW_APM_CONFIG_RELOAD_INTERVAL": "30"})
+        mock_watcher = mocker.patch(
+            "solarwinds_apm.configurator.ConfigWatcher",
+        )
+        mock_tracerprovider = mocker.Mock()
+        mock_tracerprovider.sampler = mocker.Mock(spec=ParentBasedSwSampler)
+        mocker.patch(
+            "solarwinds_apm.configurator.trace.get_tracer_provider",
+            return_value=mock_tracerprovider,
+        )
+        test_configurator = configurator.SolarWindsConfigurator()
+        test_configurator._configure_config_watcher()
+        mock_watcher.assert_called_once_with(
+            test_configurator.apm_config, mock_tracerprovider.sampler, 30
+        )
+        mock_watcher.return_value.start.assert_called_once_with()
+        assert test_configurator.config_watcher is mock_watcher.return_value
+
+    def test_configure_config_watcher_stops_with_tracer_provider(
+        self,
+        mocker,
+    ):
+        mocker.patch.dict(os.environ, {"SW_APM_CONFIG_RELOAD_INTERVAL": "30"})
+        mock_watcher = mocker.patch(
+            "solarwinds_apm.configurator.ConfigWatcher",
+        )
+        tracer_provider = SolarwindsTracerProvider(
+            sampler=mocker.Mock(spec=ParentBasedSwSampler)
+        )
+        mocker.patch(
+            "solarwinds_apm.configurator.trace.get_tracer_provider",
+            return_value=tracer_provider,
+        )
+        test_configurator = configurator.SolarWindsConfigurator()
+        test_configurator._configure_config_watcher()
+        assert tracer_provider.config_watcher is mock_watcher.return_value
+        tracer_provider.shutdown()
+        mock_watcher.return_value.shutdown.assert_called_once_with()
+
+    def test_configure_config_watcher_other_sampler(
+        self,
+        mocker,
+    ):
+        mocker.patch.dict(os.environ, {"SW_APM_CONFIG_RELOAD_INTERVAL": "30"})
+        mock_watcher = mocker.patch(
+            "solarwinds_apm.configurator.ConfigWatcher",
+        )
+        mocker.patch(
+            "solarwinds_apm.configurator.trace.get_tracer_provider",
+            return_value=mocker.Mock(),
+        )
+        test_configurator = configurator.SolarWindsConfigurator()
+        test_configurator._configure_config_watcher()
+        mock_watcher.assert_not_called()
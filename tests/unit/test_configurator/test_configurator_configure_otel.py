@@ -22,13 +22,14 @@ class TestConfiguratorConfigureOtelComponents:
         self,
         mocker,
         mock_apmconfig_enabled,
-        mock_config_serviceentry_processor,
-        mock_response_time_processor,
+        mock_config_span_processor,
         mock_custom_init_tracing,
         mock_custom_init_metrics,
         mock_init_logging,
         mock_config_propagator,
         mock_config_response_propagator,
+        mock_config_self_profiling,
+        mock_config_config_watcher,
     ):
         mock_resource = mocker.Mock()
         mock_apmconfig_enabled.resource = mock_resource
@@ -49,8 +50,7 @@ class TestConfiguratorConfigureOtelComponents:
         test_configurator = configurator.SolarWindsConfigurator()
         test_configurator._configure()
 
-        mock_config_serviceentry_processor.assert_called_once()
-        mock_response_time_processor.assert_called_once_with()
+        mock_config_span_processor.assert_called_once_with()
         mock_custom_init_tracing.assert_called_once_with(
             exporters={},
             id_generator=None,
@@ -61,27 +61,72 @@ class TestConfiguratorConfigureOtelComponents:
             exporters_or_readers={},
             resource=mock_resource,
         )
+        # No log exporters configured, so the logs stack is skipped
+        mock_init_logging.assert_not_called()
+        mock_config_propagator.assert_called_once()
+        mock_config_response_propagator.assert_called_once()
+        mock_config_self_profiling.assert_called_once_with()
+        mock_config_config_watcher.assert_called_once_with()
+
+    def test_configure_otel_components_log_exporters(
+        self,
+        mocker,
+        mock_apmconfig_enabled,
+        mock_config_span_processor,
+        mock_custom_init_tracing,
+        mock_custom_init_metrics,
+        mock_init_logging,
+        mock_config_propagator,
+        mock_config_response_propagator,
+        mock_config_self_profiling,
+        mock_config_config_watcher,
+    ):
+        mock_resource = mocker.Mock()
+        mock_apmconfig_enabled.resource = mock_resource
+        mocker.patch(
+            "solarwinds_apm.apm_resource.create_detector_resource",
+            return_value=mocker.Mock(),
+        )
+        mocker.patch(
+            "solarwinds_apm.configurator.SolarWindsApmConfig",
+            return_value=mock_apmconfig_enabled,
+        )
+        mocker.patch(
+            "solarwinds_apm.configurator.ParentBasedSwSampler",
+            return_value=mocker.Mock(),
+        )
+        mock_log_exporter = mocker.Mock()
+        mocker.patch(
+            "solarwinds_apm.configurator._import_exporters",
+            return_value=({}, {}, {"otlp": mock_log_exporter}),
+        )
+        mock_set_logger_provider = mocker.patch(
+            "solarwinds_apm.configurator.set_logger_provider"
+        )
+        test_configurator = configurator.SolarWindsConfigurator()
+        test_configurator._configure()
+
         # Always passes False since logging auto-instrumentation is now handled by
         # opentelemetry-instrumentation-logging via the distro
         mock_init_logging.assert_called_once_with(
-            {},
+            {"otlp": mock_log_exporter},
             mock_resource,
             setup_logging_handler=False,
         )
-        mock_config_propagator.assert_called_once()
-        mock_config_response_propagator.assert_called_once()
+        mock_set_logger_provider.assert_not_called()
 
     def test_configure_otel_components_agent_disabled(
         self,
         mocker,
         mock_apmconfig_disabled,
-        mock_config_serviceentry_processor,
-        mock_response_time_processor,
+        mock_config_span_processor,
         mock_custom_init_tracing,
         mock_custom_init_metrics,
         mock_init_logging,
         mock_config_propagator,
         mock_config_response_propagator,
+        mock_config_self_profiling,
+        mock_config_config_watcher,
     ):
         mock_detector_resource = mocker.Mock()
         mocker.patch(
@@ -101,10 +146,11 @@ class TestConfiguratorConfigureOtelComponents:
         test_configurator._configure()
 
         mock_apm_sampler.assert_not_called()
-        mock_config_serviceentry_processor.assert_not_called()
-        mock_response_time_processor.assert_not_called()
+        mock_config_span_processor.assert_not_called()
         mock_custom_init_tracing.assert_not_called()
         mock_custom_init_metrics.assert_not_called()
         mock_init_logging.assert_not_called()
         mock_config_propagator.assert_not_called()
         mock_config_response_propagator.assert_not_called()
+        mock_config_self_profiling.assert_not_called()
+        mock_config_config_watcher.assert_not_called()
@@ -120,6 +120,9 @@ class TestConfiguratorPropagators:
         )
         mock_composite_propagator.assert_called_once()
         mock_set_global_textmap.assert_called_once()
+        assert test_configurator.propagators == [
+            mock_propagator_class.return_value.return_value
+        ]
 
         # Restore old PROPAGATOR
         if old_propagators:
@@ -290,5 +293,23 @@ class TestConfiguratorPropagators:
         test_configurator = configurator.SolarWindsConfigurator()
         test_configurator._configure_response_propagator()
 
-        mock_resp_propagator.assert_called_once()
+        mock_resp_propagator.assert_called_once_with(trigger_trace_only=False)
+        mock_set_global_response_propagator.assert_called_once()
+
+    def test_configure_response_propagator_trigger_trace_only(
+        self,
+        mocker,
+        mock_set_global_response_propagator,
+    ):
+        mocker.patch.dict(
+            os.environ,
+            {"SW_APM_RESPONSE_HEADERS_TRIGGER_TRACE_ONLY": "true"},
+        )
+        mock_resp_propagator = mocker.patch(
+            "solarwinds_apm.configurator.SolarWindsTraceResponsePropagator"
+        )
+        test_configurator = configurator.SolarWindsConfigurator()
+        test_configurator._configure_response_propagator()
+
+        mock_resp_propagator.assert_called_once_with(trigger_trace_only=True)
         mock_set_global_response_propagator.assert_called_once()
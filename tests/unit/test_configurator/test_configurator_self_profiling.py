@@ -0,0 +1,73 @@
+# © 2026 SolarWinds Worldwide, LLC. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with the License. You may obtain a copy of the License at:http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
+
+import os
+
+from solarwinds_apm import configurator
+from solarwinds_apm.propagator import SolarWindsPropagator
+
+
+class TestConfiguratorSelfProfiling:
+    def test_configure_self_profiling_disabled(
+        self,
+        mocker,
+    ):
+        mock_profiler = mocker.patch(
+            "solarwinds_apm.configurator.SelfProfiler",
+        )
+        test_configurator = configurator.SolarWindsConfigurator()
+        test_configurator._configure_self_profiling()
+        mock_profiler.assert_not_called()
+
+    def test_configure_self_profiling_enabled(
+        self,
+        mocker,
+    ):
+        mocker.patch.dict(os.environ, {"SW_APM_SELF_PROFILING": "true"})
+        mock_profiler_instance = mocker.Mock()
+        mocker.patch(
+            "solarwinds_apm.configurator.SelfProfiler",
+            return_value=mock_profiler_instance,
+        )
+        mock_tracerprovider = mocker.Mock()
+        mocker.patch(
+            "solarwinds_apm.configurator.trace.get_tracer_provider",
+            return_value=mock_tracerprovider,
+        )
+        sw_propagator = SolarWindsPropagator()
+        mock_response_propagator = mocker.Mock()
+        mocker.patch(
+            "solarwinds_apm.configurator.get_global_response_propagator",
+            return_value=mock_response_propagator,
+        )
+        test_configurator = configurator.SolarWindsConfigurator()
+        test_configurator.span_processor = mocker.Mock()
+        test_configurator.propagators = [mocker.Mock(), sw_propagator]
+        test_configurator._configure_self_profiling()
+
+        mock_profiler_instance.profile.assert_has_calls(
+            [
+                mocker.call(
+                    "sampler", mock_tracerprovider.sampler, "should_sample"
+                ),
+                mocker.call(
+                    "service_entry_processor",
+                    test_configurator.span_processor.service_entry_processor,
+                    "start_entry_span",
+                    "finalize_entry_span",
+                    "detach_entry_token",
+                ),
+                mocker.call(
+                    "response_time_processor",
+                    test_configurator.span_processor.response_time_processor,
+                    "record_response_time",
+                ),
+                mocker.call("propagator", sw_propagator, "extract", "inject"),
+                mocker.call(
+                    "response_propagator", mock_response_propagator, "inject"
+                ),
+            ]
+        )
@@ -10,23 +10,7 @@ from solarwinds_apm import configurator
 
 
 class TestConfiguratorSpanProcessors:
-    def test_configure_service_entry_span_processor(
-        self,
-        mocker,
-    ):
-        mock_tracerprovider = mocker.Mock()
-        mock_get_tracer_provider = mocker.patch(
-            "solarwinds_apm.configurator.trace.get_tracer_provider",
-            return_value=mock_tracerprovider,
-        )
-        mocker.patch("solarwinds_apm.configurator.ServiceEntrySpanProcessor")
-
-        test_configurator = configurator.SolarWindsConfigurator()
-        test_configurator._configure_service_entry_span_processor()
-        mock_get_tracer_provider.assert_called_once()
-        mock_tracerprovider.add_span_processor.assert_called_once()
-
-    def test_configure_response_time_processor_exporters_not_set(
+    def test_configure_span_processor_exporters_not_set(
         self,
         mocker,
         mock_apmconfig_enabled,
@@ -48,22 +32,27 @@ class TestConfiguratorSpanProcessors:
             return_value=mock_tracerprovider,
         )
         mock_processor_instance = mocker.Mock()
-        mock_rt_processor = mocker.patch(
-            "solarwinds_apm.configurator.ResponseTimeProcessor",
+        mock_sw_processor = mocker.patch(
+            "solarwinds_apm.configurator.SolarWindsSpanProcessor",
             return_value=mock_processor_instance,
         )
 
         test_configurator = configurator.SolarWindsConfigurator()
-        test_configurator._configure_response_time_processor()
-        mock_get_tracer_provider.assert_not_called()
-        mock_tracerprovider.add_span_processor.assert_not_called()
-        mock_rt_processor.assert_not_called()
+        test_configurator._configure_span_processor()
+        mock_get_tracer_provider.assert_called_once()
+        mock_tracerprovider.add_span_processor.assert_called_once_with(
+            mock_processor_instance,
+        )
+        mock_sw_processor.assert_called_once_with(
+            test_configurator.apm_config,
+            record_response_time=False,
+        )
 
         # Restore the os exporters
         if old_exporter:
             os.environ["OTEL_METRICS_EXPORTER"] = old_exporter
 
-    def test_configure_response_time_processor_exporters_set(
+    def test_configure_span_processor_exporters_set(
         self,
         mocker,
         mock_apmconfig_enabled,
@@ -85,18 +74,21 @@ class TestConfiguratorSpanProcessors:
             return_value=mock_tracerprovider,
         )
         mock_processor_instance = mocker.Mock()
-        mock_rt_processor = mocker.patch(
-            "solarwinds_apm.configurator.ResponseTimeProcessor",
+        mock_sw_processor = mocker.patch(
+            "solarwinds_apm.configurator.SolarWindsSpanProcessor",
             return_value=mock_processor_instance,
         )
 
         test_configurator = configurator.SolarWindsConfigurator()
-        test_configurator._configure_response_time_processor()
+        test_configurator._configure_span_processor()
         mock_get_tracer_provider.assert_called_once()
         mock_tracerprovider.add_span_processor.assert_called_once_with(
             mock_processor_instance,
         )
-        mock_rt_processor.assert_called_once()
+        mock_sw_processor.assert_called_once_with(
+            test_configurator.apm_config,
+            record_response_time=True,
+        )
 
         # Restore the os exporters
         if old_exporter:
@@ -15,7 +15,8 @@ from contextlib import suppress
 import pytest
 from opentelemetry.semconv.resource import ResourceAttributes
 
-from solarwinds_apm.k8s import K8sResourceDetector
+from solarwinds_apm import k8s
+from solarwinds_apm.k8s import K8sResourceDetector, _pod_uid
 
 NAMESPACE_FILE = os.path.join(
     tempfile.gettempdir(), "solarwinds-apm-k8s-namespace"
@@ -23,6 +24,7 @@ NAMESPACE_FILE = os.path.join(
 MOUNTINFO_FILE = os.path.join(
     tempfile.gettempdir(), "solarwinds-apm-mountinfo"
 )
+CGROUP_FILE = os.path.join(tempfile.gettempdir(), "solarwinds-apm-cgroup")
 
 ENV_NAMESPACE = "".join(random.choices(string.hexdigits, k=16))
 FILE_NAMESPACE = "".join(random.choices(string.hexdigits, k=16))
@@ -33,12 +35,17 @@ FILE_UID = str(uuid.uuid4())
 ENV_NAME = "".join(random.choices(string.hexdigits, k=8))
 
 
+CGROUP_UID = str(uuid.uuid4())
+
+
 @pytest.fixture(autouse=True)
 def cleanup():
+    k8s._pod_uid_cache.clear()
     yield
-    with suppress(FileNotFoundError):
-        os.remove(NAMESPACE_FILE)
-        os.remove(MOUNTINFO_FILE)
+    k8s._pod_uid_cache.clear()
+    for path in (NAMESPACE_FILE, MOUNTINFO_FILE, CGROUP_FILE):
+        with suppress(FileNotFoundError):
+            os.remove(path)
 
 
 def file_namespace():
@@ -88,7 +95,9 @@ def test_detects_attributes_from_env(mocker):
         },
     )
 
-    k8s_detector = K8sResourceDetector(NAMESPACE_FILE, MOUNTINFO_FILE)
+    k8s_detector = K8sResourceDetector(
+        NAMESPACE_FILE, MOUNTINFO_FILE, CGROUP_FILE
+    )
     resource = k8s_detector.detect()
 
     assert resource.attributes == {
@@ -102,7 +111,9 @@ def test_detects_attributes_from_files():
     file_namespace()
     file_uid()
 
-    k8s_detector = K8sResourceDetector(NAMESPACE_FILE, MOUNTINFO_FILE)
+    k8s_detector = K8sResourceDetector(
+        NAMESPACE_FILE, MOUNTINFO_FILE, CGROUP_FILE
+    )
     resource = k8s_detector.detect()
 
     expected_attributes = {
@@ -127,7 +138,9 @@ def test_prefers_env_over_files(mocker):
     file_namespace()
     file_uid()
 
-    k8s_detector = K8sResourceDetector(NAMESPACE_FILE, MOUNTINFO_FILE)
+    k8s_detector = K8sResourceDetector(
+        NAMESPACE_FILE, MOUNTINFO_FILE, CGROUP_FILE
+    )
     resource = k8s_detector.detect()
 
     assert resource.attributes == {
@@ -147,7 +160,65 @@ def test_doesnt_detect_uid_or_name_without_namespace(mocker):
     )
     file_uid()
 
-    k8s_detector = K8sResourceDetector(NAMESPACE_FILE, MOUNTINFO_FILE)
+    k8s_detector = K8sResourceDetector(
+        NAMESPACE_FILE, MOUNTINFO_FILE, CGROUP_FILE
+    )
     resource = k8s_detector.detect()
 
     assert resource.attributes == {}
+
+
+def file_cgroup(content):
+    with open(CGROUP_FILE, "w") as f:
+        f.write(content)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="pod uid not read on windows")
+def test_reads_uid_from_cgroup_before_mountinfo():
+    file_uid()
+    file_cgroup(
+        "12:pids:/kubepods/burstable/pod"
+        f"{CGROUP_UID}/0123456789abcdef0123456789abcdef\n"
+    )
+    assert _pod_uid(MOUNTINFO_FILE, CGROUP_FILE) == CGROUP_UID
+
+
+@pytest.mark.skipif(os.name == "nt", reason="pod uid not read on windows")
+def test_reads_uid_from_systemd_cgroup():
+    systemd_uid = CGROUP_UID.replace("-", "_")
+    file_cgroup(
+        "0::/kubepods.slice/kubepods-besteffort.slice/"
+        f"kubepods-besteffort-pod{systemd_uid}.slice/cri-containerd-0123.scope\n"
+    )
+    assert _pod_uid(MOUNTINFO_FILE, CGROUP_FILE) == CGROUP_UID
+
+
+@pytest.mark.skipif(os.name == "nt", reason="pod uid not read on windows")
+def test_falls_back_to_mountinfo_with_cgroup_namespace():
+    file_uid()
+    file_cgroup("0::/\n")
+    assert _pod_uid(MOUNTINFO_FILE, CGROUP_FILE) == FILE_UID
+
+
+@pytest.mark.skipif(os.name == "nt", reason="pod uid not read on windows")
+def test_memoizes_uid_from_files():
+    file_uid()
+    assert _pod_uid(MOUNTINFO_FILE, CGROUP_FILE) == FILE_UID
+    os.remove(MOUNTINFO_FILE)
+    assert _pod_uid(MOUNTINFO_FILE, CGROUP_FILE) == FILE_UID
+
+
+@pytest.mark.skipif(os.name == "nt", reason="pod uid not read on windows")
+def test_memoizes_missing_uid():
+    assert _pod_uid(MOUNTINFO_FILE, CGROUP_FILE) is None
+    file_uid()
+    assert _pod_uid(MOUNTINFO_FILE, CGROUP_FILE) is None
+
+
+def test_env_uid_is_not_memoized(mocker):
+    file_uid()
+    mocker.patch.dict(os.environ, {"SW_K8S_POD_UID": ENV_UID})
+    assert _pod_uid(MOUNTINFO_FILE, CGROUP_FILE) == ENV_UID
+    mocker.patch.dict(os.environ, {"SW_K8S_POD_UID": ""})
+    expected = None if os.name == "nt" else FILE_UID
+    assert _pod_uid(MOUNTINFO_FILE, CGROUP_FILE) == expected
@@ -0,0 +1,31 @@
+"""Pytest configuration and fixtures for test_oboe tests."""
+
+import pytest
+
+from solarwinds_apm.oboe.clock import Clock
+
+
+class ManualClock(Clock):
+    """Clock that only moves when advanced."""
+
+    def __init__(self, monotonic: float = 1000.0, wall: float = 1.7e9):
+        self._monotonic = monotonic
+        self._wall = wall
+
+    def monotonic(self) -> float:
+        return self._monotonic
+
+    def time(self) -> float:
+        return self._wall
+
+    def advance(self, seconds: float) -> None:
+        self._monotonic += seconds
+        self._wall += seconds
+
+    def jump_wall(self, seconds: float) -> None:
+        self._wall += seconds
+
+
+@pytest.fixture(name="clock")
+def fixture_clock():
+    return ManualClock()
@@ -624,6 +624,66 @@ class TestEntrySpan:
             TRACESTATE_CAPTURE_ATTRIBUTE
         )
 
+    def _sample_tracestate_capture(self, sampler):
+        ctxt = sampler._create_parent(
+            trace_flags=TraceFlags.SAMPLED,
+            is_remote=True,
+            sw=True,
+            other_trace_state=True,
+        )
+        return sampler.should_sample(
+            ctxt,
+            get_current_span(ctxt).get_span_context().trace_id,
+            "tracestate_capture",
+        )
+
+    def _tracestate_capture_sampler(self):
+        return MockSampler(
+            MockSamplerOptions(
+                settings=Settings(
+                    sample_rate=0,
+                    sample_source=SampleSource.LOCAL_DEFAULT,
+                    flags=Flags.SAMPLE_START,
+                    buckets={},
+                    signature_key=None,
+                    timestamp=int(time.time()),
+                    ttl=10,
+                ),
+                local_settings=LocalSettings(
+                    trigger_mode=False, tracing_mode=None
+                ),
+                request_headers=make_request_headers(MakeRequestHeaders()),
+            )
+        )
+
+    def test_tracestate_not_captured_when_disabled(self):
+        sampler = self._tracestate_capture_sampler()
+        sampler.tracestate_capture = False
+        sample = self._sample_tracestate_capture(sampler)
+        assert TRACESTATE_CAPTURE_ATTRIBUTE not in sample.attributes
+
+    def test_capture_tracestate(self):
+        sampler = self._tracestate_capture_sampler()
+        members = [("sw", "0000000000000001-01"), ("vendor1", "value1")]
+        assert (
+            sampler.capture_tracestate(TraceState(members))
+            == "sw=0000000000000001-01,vendor1=value1"
+        )
+
+    def test_capture_tracestate_matches_header_without_response(self):
+        sampler = self._tracestate_capture_sampler()
+        trace_state = TraceState(
+            [
+                ("sw", "0000000000000001-01"),
+                (INTL_SWO_X_OPTIONS_RESPONSE_KEY, "trigger-trace####ok"),
+                ("vendor1", "value1"),
+            ]
+        )
+        assert (
+            sampler.capture_tracestate(trace_state)
+            == trace_state.delete(INTL_SWO_X_OPTIONS_RESPONSE_KEY).to_header()
+        )
+
 
 class TestEntrySpanWithValidSwContextXTraceOptions:
     def test_respects_keys_and_values(self):
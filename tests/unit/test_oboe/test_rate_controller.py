@@ -0,0 +1,71 @@
+# © 2026 SolarWinds Worldwide, LLC. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with the License. You may obtain a copy of the License at:http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
+
+import pytest
+
+from solarwinds_apm.oboe.rate_controller import _RateController
+
+SCALE = 1_000_000
+
+
+def drive(controller, clock, requests_per_second, seconds, ceiling=SCALE):
+    rate = None
+    for _ in range(seconds):
+        for _ in range(requests_per_second):
+            rate = controller.sample_rate(ceiling)
+            clock.advance(1 / requests_per_second)
+    return rate
+
+
+def test_uses_ceiling_until_first_interval(clock):
+    controller = _RateController(target=10, scale=SCALE, clock=clock)
+    assert controller.average is None
+    assert controller.sample_rate(500_000) == 500_000
+
+
+def test_samples_target_share_of_requests(clock):
+    controller = _RateController(
+        target=10, scale=SCALE, time_constant=1, clock=clock
+    )
+    rate = drive(controller, clock, requests_per_second=100, seconds=5)
+    assert controller.average == pytest.approx(100)
+    assert rate == pytest.approx(100_000, abs=1)
+
+
+def test_samples_everything_below_target(clock):
+    controller = _RateController(target=10, scale=SCALE, clock=clock)
+    assert drive(controller, clock, requests_per_second=5, seconds=3) == SCALE
+
+
+def test_is_bounded_by_ceiling(clock):
+    controller = _RateController(target=10, scale=SCALE, clock=clock)
+    rate = drive(
+        controller, clock, requests_per_second=5, seconds=3, ceiling=1_000
+    )
+    assert rate == 1_000
+
+
+def test_smooths_traffic_swings(clock):
+    controller = _RateController(
+        target=10, scale=SCALE, time_constant=10, clock=clock
+    )
+    drive(controller, clock, requests_per_second=100, seconds=30)
+    # A short peak at 10x traffic moves the average only partway, instead
+    # of dropping the rate to the 10_000 of the peak at once
+    rate = drive(controller, clock, requests_per_second=1_000, seconds=2)
+    assert 30_000 < rate < 100_000
+    drive(controller, clock, requests_per_second=1_000, seconds=60)
+    assert abs(controller.average - 1_000) < 10
+
+
+def test_idle_gap_decays_average(clock):
+    controller = _RateController(
+        target=10, scale=SCALE, time_constant=10, clock=clock
+    )
+    drive(controller, clock, requests_per_second=100, seconds=30)
+    clock.advance(60)
+    assert controller.sample_rate(SCALE) == SCALE
+    assert controller.average < 10
@@ -5,9 +5,11 @@
 # Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
 from __future__ import annotations
 
+import re
 import time
 from typing import Any
 
+import pytest
 from opentelemetry import trace
 from opentelemetry.sdk.metrics import AlwaysOnExemplarFilter, MeterProvider
 from opentelemetry.sdk.metrics._internal.export import InMemoryMetricReader
@@ -16,6 +18,7 @@ from opentelemetry.sdk.trace.export import SimpleSpanProcessor
 from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
     InMemorySpanExporter,
 )
+from opentelemetry.sdk.trace.sampling import Decision
 from opentelemetry.semconv._incubating.attributes.http_attributes import (
     HTTP_METHOD,
     HTTP_SCHEME,
@@ -36,7 +39,9 @@ from opentelemetry.semconv.attributes.url_attributes import (
 )
 from opentelemetry.trace import SpanKind
 
+from solarwinds_apm.oboe.clock import CLOCK, Clock
 from solarwinds_apm.oboe.configuration import Configuration, TransactionSetting
+from solarwinds_apm.oboe.oboe_sampler import SAMPLE_RATE_ATTRIBUTE
 from solarwinds_apm.oboe.sampler import (
     Sampler,
     http_span_metadata,
@@ -46,8 +51,10 @@ from solarwinds_apm.oboe.settings import (
     BucketSettings,
     BucketType,
     Flags,
+    RemoteTransactionSetting,
     SampleSource,
     Settings,
+    TracingMode,
 )
 
 
@@ -57,9 +64,13 @@ class MockSampler(Sampler):
         meter_provider: MeterProvider,
         config: Configuration,
         initial: Any,
+        clock: Clock = CLOCK,
     ):
         super().__init__(
-            meter_provider=meter_provider, config=config, initial=initial
+            meter_provider=meter_provider,
+            config=config,
+            initial=initial,
+            clock=clock,
         )
 
     def __str__(self):
@@ -70,8 +81,12 @@ def options(
     tracing: bool | None,
     trigger_trace: bool,
     transaction_settings: list[TransactionSetting],
+    transaction_buckets: int = 0,
+    target_traces_per_second: float = 0.0,
 ) -> Configuration:
     return Configuration(
+        transaction_buckets=transaction_buckets,
+        target_traces_per_second=target_traces_per_second,
         tracing_mode=tracing,
         trigger_trace_enabled=trigger_trace,
         transaction_settings=transaction_settings,
@@ -211,6 +226,35 @@ class TestParseSettingsName:
         )
         assert warnings == "warning"
 
+    def test_parses_transaction_settings(self):
+        unparsed = settings(enabled=True, signature_key=None)
+        unparsed["transactionSettings"] = [
+            {"regex": "^CLIENT:health", "tracing": "disabled"},
+            {"regex": ".*/api/", "value": 10_000},
+            {"regex": "^SERVER:", "tracing": "enabled", "value": 0},
+            {"regex": "(", "tracing": "disabled"},
+            {"regex": "no-override"},
+            {"regex": "bad-rate", "value": 2_000_000},
+            {"tracing": "disabled"},
+            "invalid",
+        ]
+        output, _ = parse_settings(unparsed)
+        assert output.transaction_settings == [
+            RemoteTransactionSetting(
+                regex=re.compile("^CLIENT:health"), tracing=False
+            ),
+            RemoteTransactionSetting(
+                regex=re.compile(".*/api/"), sample_rate=10_000
+            ),
+            RemoteTransactionSetting(
+                regex=re.compile("^SERVER:"), tracing=True, sample_rate=0
+            ),
+        ]
+
+    def test_transaction_settings_default_empty(self):
+        output, _ = parse_settings(settings(enabled=True, signature_key=None))
+        assert output.transaction_settings == []
+
 
 class TestSamplerName:
     def test_respects_enabled_settings_when_no_config_or_transaction_settings(
@@ -564,3 +608,331 @@ class TestSamplerName:
         assert spans[0].attributes["SampleSource"] == 6
         assert spans[0].attributes["BucketCapacity"] == 10
         assert spans[0].attributes["BucketRate"] == 1
+
+
+class TestUpdateConfiguration:
+    def sampler(self, config: Configuration) -> MockSampler:
+        return MockSampler(
+            meter_provider=MeterProvider(),
+            config=config,
+            initial=settings(enabled=True, signature_key=None),
+        )
+
+    def test_swaps_transaction_settings(self):
+        sampler = self.sampler(
+            options(tracing=True, trigger_trace=True, transaction_settings=[])
+        )
+        local = sampler.local_settings(None, 0, "test", SpanKind.INTERNAL)
+        assert local.tracing_mode == TracingMode.ALWAYS
+
+        sampler.update_configuration(
+            options(
+                tracing=True,
+                trigger_trace=False,
+                transaction_settings=[
+                    TransactionSetting(tracing=False, matcher=lambda s: True)
+                ],
+            )
+        )
+        local = sampler.local_settings(None, 0, "test", SpanKind.INTERNAL)
+        assert local.tracing_mode == TracingMode.NEVER
+        assert local.trigger_mode is False
+        assert sampler.trigger_mode is False
+
+    def test_swaps_tracing_mode(self):
+        sampler = self.sampler(
+            options(tracing=True, trigger_trace=True, transaction_settings=[])
+        )
+        sampler.update_configuration(
+            options(tracing=False, trigger_trace=True, transaction_settings=[])
+        )
+        assert sampler.tracing_mode == TracingMode.NEVER
+        local = sampler.local_settings(None, 0, "test", SpanKind.INTERNAL)
+        assert local.tracing_mode == TracingMode.NEVER
+
+
+class TestMergedSettingsCache:
+    @staticmethod
+    def _sampler(transaction_settings=None):
+        meter_provider = MeterProvider(
+            metric_readers=[InMemoryMetricReader()],
+            exemplar_filter=AlwaysOnExemplarFilter(),
+        )
+        return MockSampler(
+            meter_provider=meter_provider,
+            config=options(
+                tracing=True,
+                trigger_trace=True,
+                transaction_settings=transaction_settings or [],
+            ),
+            initial=settings(enabled=True, signature_key=None),
+        )
+
+    def test_reuses_merged_settings(self):
+        sampler = self._sampler()
+        first = sampler.get_settings(None, 0, "test")
+        second = sampler.get_settings(None, 0, "test")
+        assert first is not None
+        assert first is second
+
+    def test_merges_per_local_tracing_mode(self):
+        sampler = self._sampler(
+            [
+                TransactionSetting(
+                    tracing=False, matcher=lambda s: s == "INTERNAL:off"
+                )
+            ]
+        )
+        enabled = sampler.get_settings(None, 0, "on", kind=SpanKind.INTERNAL)
+        disabled = sampler.get_settings(None, 0, "off", kind=SpanKind.INTERNAL)
+        assert enabled.flags & Flags.SAMPLE_START
+        assert not disabled.flags & Flags.SAMPLE_START
+        assert (
+            sampler.get_settings(None, 0, "off", kind=SpanKind.INTERNAL)
+            is disabled
+        )
+
+    def test_new_remote_settings_invalidate_cache(self):
+        sampler = self._sampler()
+        first = sampler.get_settings(None, 0, "test")
+        updated = settings(enabled=False, signature_key=None)
+        updated["timestamp"] += 1
+        sampler.update_settings(updated)
+        second = sampler.get_settings(None, 0, "test")
+        assert second is not first
+        assert second.timestamp == first.timestamp + 1
+
+    def test_expires_at_monotonic_deadline(self, clock):
+        sampler = MockSampler(
+            meter_provider=MeterProvider(),
+            config=options(
+                tracing=True, trigger_trace=True, transaction_settings=[]
+            ),
+            initial=None,
+            clock=clock,
+        )
+        initial = settings(enabled=True, signature_key=None)
+        initial["timestamp"] = int(clock.time())
+        sampler.update_settings(initial)
+        assert sampler.get_settings(None, 0, "test") is not None
+        # wall clock jumps do not move the deadline once computed
+        clock.jump_wall(3600)
+        assert sampler.get_settings(None, 0, "test") is not None
+        clock.advance(61)
+        assert sampler.get_settings(None, 0, "test") is None
+        assert sampler.settings is None
+
+
+class TestRemoteTransactionSettings:
+    @staticmethod
+    def _sampler(remote, transaction_settings=None):
+        initial = settings(enabled=True, signature_key=None)
+        initial["transactionSettings"] = remote
+        return MockSampler(
+            meter_provider=MeterProvider(),
+            config=options(
+                tracing=True,
+                trigger_trace=True,
+                transaction_settings=transaction_settings or [],
+            ),
+            initial=initial,
+        )
+
+    def test_disables_matching_transaction(self):
+        sampler = self._sampler(
+            [{"regex": "^INTERNAL:health$", "tracing": "disabled"}]
+        )
+        disabled = sampler.get_settings(
+            None, 0, "health", kind=SpanKind.INTERNAL
+        )
+        enabled = sampler.get_settings(
+            None, 0, "order", kind=SpanKind.INTERNAL
+        )
+        assert not disabled.flags & Flags.SAMPLE_START
+        assert enabled.flags & Flags.SAMPLE_START
+
+    def test_throttles_matching_transaction(self):
+        sampler = self._sampler([{"regex": "^INTERNAL:batch", "value": 100}])
+        throttled = sampler.get_settings(
+            None, 0, "batch-1", kind=SpanKind.INTERNAL
+        )
+        other = sampler.get_settings(None, 0, "order", kind=SpanKind.INTERNAL)
+        assert throttled.sample_rate == 100
+        assert throttled.flags & Flags.SAMPLE_START
+        assert other.sample_rate == 1_000_000
+
+    def test_remote_overrides_local_transaction_settings(self):
+        sampler = self._sampler(
+            [{"regex": "^INTERNAL:batch", "tracing": "enabled"}],
+            [TransactionSetting(tracing=False, matcher=lambda s: True)],
+        )
+        local = sampler.local_settings(None, 0, "batch", SpanKind.INTERNAL)
+        assert local.tracing_mode == TracingMode.ALWAYS
+        local = sampler.local_settings(None, 0, "order", SpanKind.INTERNAL)
+        assert local.tracing_mode == TracingMode.NEVER
+
+    def test_caches_matches_per_transaction(self):
+        calls = []
+
+        def matcher(identifier):
+            calls.append(identifier)
+            return False
+
+        sampler = self._sampler(
+            [{"regex": "^INTERNAL:batch", "value": 100}],
+            [TransactionSetting(tracing=False, matcher=matcher)],
+        )
+        for _ in range(3):
+            sampler.local_settings(None, 0, "order", SpanKind.INTERNAL)
+        assert calls == ["INTERNAL:order"]
+
+        updated = settings(enabled=True, signature_key=None)
+        updated["timestamp"] += 1
+        sampler.update_settings(updated)
+        local = sampler.local_settings(None, 0, "batch", SpanKind.INTERNAL)
+        assert local.sample_rate is None
+        assert calls == ["INTERNAL:order", "INTERNAL:batch"]
+
+
+class TestTransactionBuckets:
+    @staticmethod
+    def _sampler(clock, transaction_buckets=10):
+        initial = settings(enabled=True, signature_key=None)
+        initial["timestamp"] = int(clock.time())
+        return MockSampler(
+            meter_provider=MeterProvider(),
+            config=options(
+                tracing=True,
+                trigger_trace=True,
+                transaction_settings=[],
+                transaction_buckets=transaction_buckets,
+            ),
+            initial=initial,
+            clock=clock,
+        )
+
+    @staticmethod
+    def _sample(sampler, path):
+        return sampler.should_sample(
+            None,
+            0,
+            "GET",
+            SpanKind.SERVER,
+            {HTTP_REQUEST_METHOD: "GET", URL_PATH: path},
+        ).decision
+
+    def test_groups_http_spans_by_route(self, clock):
+        sampler = self._sampler(clock)
+        assert (
+            sampler.transaction_name(
+                "GET",
+                SpanKind.SERVER,
+                {HTTP_REQUEST_METHOD: "GET", URL_PATH: "/api/orders/42"},
+            )
+            == "/api/orders"
+        )
+        assert (
+            sampler.transaction_name("job", SpanKind.CONSUMER, {})
+            == "CONSUMER:job"
+        )
+
+    def test_busy_transaction_leaves_budget_to_others(self, clock):
+        sampler = self._sampler(clock)
+        # Default bucket of capacity 10, shared with a quiet transaction
+        assert (
+            self._sample(sampler, "/health/live") == Decision.RECORD_AND_SAMPLE
+        )
+        decisions = [self._sample(sampler, "/api/orders/1") for _ in range(20)]
+        assert decisions.count(Decision.RECORD_AND_SAMPLE) == 5
+        assert (
+            self._sample(sampler, "/health/ready")
+            == Decision.RECORD_AND_SAMPLE
+        )
+
+    def test_default_bucket_refusal_refunds_share(self, clock):
+        sampler = self._sampler(clock)
+        sampler.buckets[BucketType.DEFAULT].update(new_capacity=1, new_rate=0)
+        assert self._sample(sampler, "/api/orders/1") == (
+            Decision.RECORD_AND_SAMPLE
+        )
+        share = sampler.transaction_buckets.get("/api/orders")
+        tokens = share.tokens
+        assert self._sample(sampler, "/api/orders/1") == Decision.RECORD_ONLY
+        assert share.tokens == tokens
+
+    def test_single_bucket_when_disabled(self, clock):
+        sampler = self._sampler(clock, transaction_buckets=0)
+        assert sampler.transaction_buckets is None
+        decisions = [self._sample(sampler, "/api/orders/1") for _ in range(20)]
+        assert decisions.count(Decision.RECORD_AND_SAMPLE) == 10
+        assert self._sample(sampler, "/health") == Decision.RECORD_ONLY
+
+    def test_update_configuration(self, clock):
+        sampler = self._sampler(clock)
+        buckets = sampler.transaction_buckets
+        assert buckets.max_count == 10
+        config = options(
+            tracing=True,
+            trigger_trace=True,
+            transaction_settings=[],
+            transaction_buckets=10,
+        )
+        sampler.update_configuration(config)
+        assert sampler.transaction_buckets is buckets
+        config.transaction_buckets = 0
+        sampler.update_configuration(config)
+        assert sampler.transaction_buckets is None
+
+
+class TestRateController:
+    @staticmethod
+    def _sampler(clock, target_traces_per_second=10.0):
+        initial = settings(enabled=True, signature_key=None)
+        initial["timestamp"] = int(clock.time())
+        initial["arguments"]["BucketCapacity"] = 1_000
+        initial["arguments"]["BucketRate"] = 1_000
+        return MockSampler(
+            meter_provider=MeterProvider(),
+            config=options(
+                tracing=True,
+                trigger_trace=True,
+                transaction_settings=[],
+                target_traces_per_second=target_traces_per_second,
+            ),
+            initial=initial,
+            clock=clock,
+        )
+
+    def test_adapts_dice_rate_to_target(self, clock):
+        sampler = self._sampler(clock)
+        for _ in range(200):
+            result = sampler.should_sample(None, 0, "test", SpanKind.INTERNAL)
+            clock.advance(0.01)
+        assert sampler.rate_controller.average == pytest.approx(100)
+        assert result.attributes[SAMPLE_RATE_ATTRIBUTE] == pytest.approx(
+            100_000, abs=1
+        )
+
+    def test_uses_remote_rate_when_disabled(self, clock):
+        sampler = self._sampler(clock, target_traces_per_second=0)
+        assert sampler.rate_controller is None
+        result = sampler.should_sample(None, 0, "test", SpanKind.INTERNAL)
+        assert result.attributes[SAMPLE_RATE_ATTRIBUTE] == 1_000_000
+
+    def test_update_configuration(self, clock):
+        sampler = self._sampler(clock)
+        controller = sampler.rate_controller
+        config = options(
+            tracing=True,
+            trigger_trace=True,
+            transaction_settings=[],
+            target_traces_per_second=10.0,
+        )
+        sampler.update_configuration(config)
+        assert sampler.rate_controller is controller
+        config.target_traces_per_second = 20.0
+        sampler.update_configuration(config)
+        assert sampler.rate_controller.target == 20.0
+        config.target_traces_per_second = 0.0
+        sampler.update_configuration(config)
+        assert sampler.rate_controller is None
@@ -121,3 +121,27 @@ def test_merge_override_set_defaults_to_remote():
 
     merged = merge(remote, local)
     assert merged == remote
+
+
+def test_merge_local_sample_rate_overrides_remote():
+    remote = Settings(
+        sample_rate=1_000_000,
+        sample_source=SampleSource.REMOTE,
+        flags=Flags.SAMPLE_START | Flags.SAMPLE_THROUGH_ALWAYS,
+        buckets={},
+        signature_key=None,
+        timestamp=int(time.time()),
+        ttl=60,
+    )
+    local = LocalSettings(
+        tracing_mode=None, trigger_mode=False, sample_rate=10_000
+    )
+
+    merged = merge(remote, local)
+    assert merged.sample_rate == 10_000
+    assert (
+        merge(
+            remote, LocalSettings(tracing_mode=None, trigger_mode=False)
+        ).sample_rate
+        == 1_000_000
+    )
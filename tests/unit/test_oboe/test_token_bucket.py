@@ -8,7 +8,11 @@ import os
 import threading
 import time
 
-from solarwinds_apm.oboe.token_bucket import _TokenBucket
+from solarwinds_apm.oboe.token_bucket import (
+    TRANSACTION_BUCKETS_OTHER,
+    _TokenBucket,
+    _TransactionBuckets,
+)
 
 
 def test_initialization():
@@ -50,6 +54,25 @@ def test_replenishes_over_time():
     assert bucket.consume(2) is True
 
 
+def test_replenishes_with_injected_clock(clock):
+    bucket = _TokenBucket(capacity=2, rate=1, clock=clock)
+    assert bucket.consume(2) is True
+    assert bucket.consume(1) is False
+    clock.advance(1)
+    assert bucket.consume(1) is True
+    assert bucket.consume(1) is False
+
+
+def test_ignores_wall_clock_jumps(clock):
+    bucket = _TokenBucket(capacity=2, rate=1, clock=clock)
+    assert bucket.consume(2) is True
+    clock.jump_wall(3600)
+    assert bucket.consume(1) is False
+    clock.jump_wall(-7200)
+    clock.advance(2)
+    assert bucket.consume(2) is True
+
+
 def test_does_not_replenish_more_than_its_capacity():
     bucket = _TokenBucket(capacity=2, rate=1)
     assert bucket.consume(2) is True
@@ -84,6 +107,16 @@ def test_defaults_to_zero():
     assert bucket.consume() is False
 
 
+def test_refund():
+    bucket = _TokenBucket(2, 0)
+    assert bucket.consume() is True
+    assert bucket.consume() is True
+    bucket.refund()
+    assert bucket.tokens == 1
+    bucket.refund(5)
+    assert bucket.tokens == 2
+
+
 def test_concurrent_consume_does_not_over_consume():
     bucket = _TokenBucket(capacity=100, rate=0)
     consumed_count = [0]
@@ -285,3 +318,96 @@ def test_multiple_threads_replenishing_and_consuming():
     assert (
         total_consumed[0] <= 100
     )  # But not more than initial + 1 sec replenishment
+
+
+def test_transaction_buckets_share_budget(clock):
+    buckets = _TransactionBuckets(max_count=10, clock=clock)
+    buckets.update(capacity=4, rate=2)
+    first = buckets.get("first")
+    assert first.capacity == 4
+    assert first.rate == 2
+    second = buckets.get("second")
+    assert first.capacity == 2
+    assert first.rate == 1
+    assert second.capacity == 2
+    assert buckets.get("first") is first
+    assert len(buckets) == 2
+
+
+def test_transaction_buckets_busy_transaction_leaves_others_tokens(clock):
+    buckets = _TransactionBuckets(max_count=10, clock=clock)
+    buckets.update(capacity=4, rate=2)
+    busy = buckets.get("busy")
+    quiet = buckets.get("quiet")
+    assert sum(busy.consume() for _ in range(100)) == 2
+    assert quiet.consume() is True
+    clock.advance(1)
+    assert sum(busy.consume() for _ in range(100)) == 1
+
+
+def test_transaction_buckets_share_other_bucket_when_full(clock):
+    buckets = _TransactionBuckets(max_count=2, clock=clock)
+    buckets.update(capacity=30, rate=3)
+    buckets.get("first")
+    second = buckets.get("second")
+    assert buckets.get("third") is second
+    assert buckets.get(TRANSACTION_BUCKETS_OTHER) is second
+    assert len(buckets) == 2
+    assert second.capacity == 15
+
+
+def test_transaction_buckets_keep_other_bucket_after_drop(clock):
+    buckets = _TransactionBuckets(max_count=3, clock=clock)
+    buckets.update(capacity=30, rate=3)
+    for name in ("first", "second", "third"):
+        buckets.get(name)
+    buckets.update(capacity=30, rate=3)
+    buckets.get("third")
+    buckets.update(capacity=30, rate=3)
+    # Only the shared bucket is left, so two transactions get their own
+    assert len(buckets) == 1
+    other = buckets.get(TRANSACTION_BUCKETS_OTHER)
+    assert buckets.get("fourth") is not other
+    assert buckets.get("third") is not other
+    assert buckets.get("fifth") is other
+    assert len(buckets) == 3
+
+
+def test_transaction_buckets_minimum_capacity(clock):
+    buckets = _TransactionBuckets(max_count=10, clock=clock)
+    buckets.update(capacity=2, rate=1)
+    for name in ("first", "second", "third", "fourth"):
+        buckets.get(name)
+    assert buckets.get("first").capacity == 1
+    assert buckets.get("first").rate == 0.25
+
+
+def test_transaction_buckets_drop_unused_on_update(clock):
+    buckets = _TransactionBuckets(max_count=10, clock=clock)
+    buckets.update(capacity=4, rate=2)
+    used = buckets.get("used")
+    buckets.get("unused")
+    buckets.update(capacity=4, rate=2)
+    assert len(buckets) == 2
+    buckets.get("used")
+    buckets.update(capacity=4, rate=2)
+    assert len(buckets) == 1
+    assert buckets.get("used") is used
+    assert used.capacity == 4
+
+
+def test_transaction_buckets_mark_used_under_lock(clock):
+    buckets = _TransactionBuckets(max_count=10, clock=clock)
+    buckets.update(capacity=4, rate=2)
+
+    class _LockCheckingSet(set):
+        def add(self, element):
+            # update swaps the set under the lock, so an add outside of it
+            # could land in the set being discarded
+            assert buckets._lock.locked()
+            super().add(element)
+
+    buckets._used = _LockCheckingSet()
+    first = buckets.get("first")
+    assert buckets.get("first") is first
+    assert buckets._used == {"first"}
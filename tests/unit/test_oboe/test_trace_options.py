@@ -354,3 +354,17 @@ def test_stringify_trace_options_response():
 def test_validate_signature(header, signature, key, timestamp, expected):
     result = validate_signature(header, signature, key, timestamp)
     assert result == expected
+
+
+def test_validate_signature_against_given_now():
+    header = "trigger-trace;pd-keys=lo:se,check-id:123;ts=1564597681"
+    signature = "2c1c398c3e6be898f47f74bf74f035903b48b59c"
+    key = "8mZ98ZnZhhggcsUmdMbS"
+    assert (
+        validate_signature(header, signature, key, 1564597681, now=1564597741)
+        == Auth.OK
+    )
+    assert (
+        validate_signature(header, signature, key, 1564597681, now=1564598281)
+        == Auth.BAD_TIMESTAMP
+    )
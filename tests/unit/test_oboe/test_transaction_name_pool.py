@@ -54,3 +54,14 @@ def test_update_timestamp(pool):
     pool.registered(name)
     new_timestamp = pool._pool[name].timestamp
     assert new_timestamp > old_timestamp
+
+
+def test_housekeep_with_injected_clock(clock):
+    pool = TransactionNamePool(ttl=60, clock=clock)
+    pool.registered("test_name")
+    clock.advance(60)
+    assert pool.registered("other_name") == "other_name"
+    assert "test_name" in pool._pool
+    clock.advance(2)
+    pool._housekeep()
+    assert "test_name" not in pool._pool
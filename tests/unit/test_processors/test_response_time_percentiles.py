@@ -0,0 +1,76 @@
+# © 2026 SolarWinds Worldwide, LLC. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with the License. You may obtain a copy of the License at:http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
+
+from solarwinds_apm.trace.response_time_percentiles import (
+    ResponseTimePercentiles,
+)
+
+
+class TestResponseTimePercentiles:
+    def test_percentiles_no_data(self):
+        store = ResponseTimePercentiles()
+        assert store.percentiles("foo", now=0) == {}
+
+    def test_percentiles_exact_small_values(self):
+        store = ResponseTimePercentiles()
+        for value in range(1, 51):
+            store.record("foo", value, now=0)
+        assert store.percentiles("foo", (0.5, 0.9, 1.0), now=0) == {
+            0.5: 25.0,
+            0.9: 45.0,
+            1.0: 50.0,
+        }
+
+    def test_percentiles_relative_error(self):
+        store = ResponseTimePercentiles()
+        for value in range(1, 100001):
+            store.record("foo", value, now=0)
+        result = store.percentiles("foo", now=0)
+        for quantile, expected in ((0.5, 50000), (0.95, 95000), (0.99, 99000)):
+            assert abs(result[quantile] - expected) / expected < 1 / 32
+
+    def test_percentiles_zero_and_negative(self):
+        store = ResponseTimePercentiles()
+        store.record("foo", 0, now=0)
+        store.record("foo", -5, now=0)
+        assert store.percentiles("foo", (1.0,), now=0) == {1.0: 0.0}
+
+    def test_percentiles_per_transaction(self):
+        store = ResponseTimePercentiles()
+        store.record("foo", 10, now=0)
+        store.record("bar", 20, now=0)
+        assert store.percentiles("foo", (0.5,), now=0) == {0.5: 10.0}
+        assert store.percentiles("bar", (0.5,), now=0) == {0.5: 20.0}
+        assert sorted(store.transactions()) == ["bar", "foo"]
+
+    def test_percentiles_sliding_window(self):
+        store = ResponseTimePercentiles(window=60, slots=6)
+        store.record("foo", 10, now=0)
+        store.record("foo", 20, now=30)
+        assert store.percentiles("foo", (1.0,), now=59) == {1.0: 20.0}
+        assert store.percentiles("foo", (0.0,), now=59) == {0.0: 10.0}
+        # First slot expired
+        assert store.percentiles("foo", (0.0,), now=60) == {0.0: 20.0}
+        # Both expired
+        assert store.percentiles("foo", now=90) == {}
+
+    def test_record_reuses_expired_slot(self):
+        store = ResponseTimePercentiles(window=60, slots=6)
+        store.record("foo", 10, now=0)
+        store.record("foo", 20, now=60)
+        assert store.percentiles("foo", (0.0, 1.0), now=60) == {
+            0.0: 20.0,
+            1.0: 20.0,
+        }
+
+    def test_record_max_transactions(self):
+        store = ResponseTimePercentiles(max_transactions=1)
+        store.record("foo", 10, now=0)
+        store.record("bar", 10, now=0)
+        assert store.transactions() == ["foo"]
+        # foo expired so is swept for bar
+        store.record("bar", 10, now=120)
+        assert store.transactions() == ["bar"]
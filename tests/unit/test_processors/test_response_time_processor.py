@@ -4,6 +4,8 @@
 #
 # Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
 
+import pytest
+
 from solarwinds_apm.trace import ResponseTimeProcessor
 
 
@@ -1036,3 +1038,92 @@ class TestResponseTimeProcessor:
         assert "http.response.status_code" not in call_args[1]["attributes"]
         assert "http.request.method" not in call_args[1]["attributes"]
         assert call_args[1]["attributes"]["sw.transaction"] == "foo"
+
+    def test_valid_status_code(self, mocker):
+        processor = ResponseTimeProcessor(self.get_mock_apm_config(mocker))
+        assert processor.valid_status_code(200) == 200
+        assert processor.valid_status_code("404") == 404
+        assert processor.valid_status_code(0) is None
+        assert processor.valid_status_code(-1) is None
+        assert processor.valid_status_code("-1") is None
+        assert processor.valid_status_code("foo") is None
+        assert processor.valid_status_code([200]) is None
+        assert processor.valid_status_code(None) is None
+
+    def test_get_meter_attrs_http(self, mocker):
+        processor = ResponseTimeProcessor(self.get_mock_apm_config(mocker))
+        result = processor.get_meter_attrs("foo", False, 200, "GET")
+        assert result == {
+            "sw.is_error": False,
+            "sw.transaction": "foo",
+            "http.response.status_code": 200,
+            "http.request.method": "GET",
+        }
+
+    def test_get_meter_attrs_not_http(self, mocker):
+        processor = ResponseTimeProcessor(self.get_mock_apm_config(mocker))
+        result = processor.get_meter_attrs("foo", True)
+        assert result == {
+            "sw.is_error": True,
+            "sw.transaction": "foo",
+        }
+
+    def test_get_meter_attrs_reused_and_read_only(self, mocker):
+        processor = ResponseTimeProcessor(self.get_mock_apm_config(mocker))
+        first = processor.get_meter_attrs("foo", False, 200, "GET")
+        assert processor.get_meter_attrs("foo", False, 200, "GET") is first
+        assert processor.get_meter_attrs("foo", True, 200, "GET") is not first
+        with pytest.raises(TypeError):
+            first["sw.is_error"] = True
+
+    def test_get_meter_attrs_cache_bounded(self, mocker):
+        processor = ResponseTimeProcessor(
+            self.get_mock_apm_config(mocker),
+            meter_attrs_cache_max=2,
+        )
+        processor.get_meter_attrs("foo", False)
+        processor.get_meter_attrs("bar", False)
+        result = processor.get_meter_attrs("baz", False)
+        assert result == {"sw.is_error": False, "sw.transaction": "baz"}
+        assert len(processor._meter_attrs_cache) == 2
+        assert processor.get_meter_attrs("baz", False) is not result
+
+    def test_record_response_time_percentiles(self, mocker):
+        (
+            _,
+            mock_apm_config,
+            mock_histogram,
+            mock_basic_span,
+        ) = self.patch_for_on_end(mocker)
+        mock_apm_config.get = mocker.Mock(
+            side_effect=lambda key: key == "response_time_percentiles"
+        )
+        mock_set = mocker.patch(
+            "solarwinds_apm.trace.response_time_processor._set_response_time_percentiles"
+        )
+        mock_store = mocker.Mock()
+        mocker.patch(
+            "solarwinds_apm.trace.response_time_processor.get_response_time_percentiles",
+            return_value=mock_store,
+        )
+        processor = ResponseTimeProcessor(mock_apm_config)
+        mock_set.assert_called_once()
+        assert processor.response_time_percentiles == mock_store
+
+        processor.record_response_time(mock_basic_span)
+        mock_store.record.assert_called_once_with("foo", 123)
+        mock_histogram.record.assert_called_once()
+
+    def test_record_response_time_no_percentiles(self, mocker):
+        (
+            _,
+            mock_apm_config,
+            _,
+            _,
+        ) = self.patch_for_on_end(mocker)
+        mock_set = mocker.patch(
+            "solarwinds_apm.trace.response_time_processor._set_response_time_percentiles"
+        )
+        processor = ResponseTimeProcessor(mock_apm_config)
+        mock_set.assert_not_called()
+        assert processor.response_time_percentiles is None
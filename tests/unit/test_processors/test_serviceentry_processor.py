@@ -5,6 +5,7 @@
 # Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
 
 import os
+import threading
 
 from solarwinds_apm.apm_constants import (
     INTL_SWO_OTEL_CONTEXT_ENTRY_SPAN,
@@ -207,9 +208,9 @@ class TestServiceEntrySpanProcessor:
         mock_span.configure_mock(
             **{
                 "attributes.get": mocker.Mock(
-                    side_effect=lambda key, default=None: "faas-value"
-                    if key == "faas.name"
-                    else default
+                    side_effect=lambda key, default=None: (
+                        "faas-value" if key == "faas.name" else default
+                    )
                 )
             }
         )
@@ -250,9 +251,9 @@ class TestServiceEntrySpanProcessor:
         mock_span.configure_mock(
             **{
                 "attributes.get": mocker.Mock(
-                    side_effect=lambda key, default=None: "http-route"
-                    if key == "http.route"
-                    else default
+                    side_effect=lambda key, default=None: (
+                        "http-route" if key == "http.route" else default
+                    )
                 )
             }
         )
@@ -273,9 +274,9 @@ class TestServiceEntrySpanProcessor:
         mock_span.configure_mock(
             **{
                 "attributes.get": mocker.Mock(
-                    side_effect=lambda key, default=None: "url-path"
-                    if key == "url.path"
-                    else default
+                    side_effect=lambda key, default=None: (
+                        "url-path" if key == "url.path" else default
+                    )
                 )
             }
         )
@@ -335,11 +336,127 @@ class TestServiceEntrySpanProcessor:
             }
         )
 
-        mocker.patch(
-            "solarwinds_apm.trace.serviceentry_processor.W3CTransformer.trace_and_span_id_from_context",
-            return_value="some-id",
-        )
+        mock_span.context.configure_mock(trace_id=0x1111, span_id=0x2222)
+        processor = ServiceEntrySpanProcessor()
+        processor.context_tokens = {(0x1111, 0x2222): ("mock-token", 0)}
+        assert processor.on_end(mock_span) is None
+        mock_context.detach.assert_called_once_with("mock-token")
+        assert processor.context_tokens == {}
+
+    def test_on_end_no_token(self, mocker):
+        _, mock_context = self.patch_for_on_start(mocker)
+        mock_span = mocker.Mock()
+        mock_span.configure_mock(parent=None)
+        mock_span.context.configure_mock(trace_id=0x1111, span_id=0x2222)
         processor = ServiceEntrySpanProcessor()
-        processor.context_tokens = {"some-id": "mock-token"}
+        processor.context_tokens = {(0x3333, 0x4444): ("mock-token", 0)}
         assert processor.on_end(mock_span) is None
+        mock_context.detach.assert_not_called()
+        assert len(processor.context_tokens) == 1
+
+    def test_on_start_stores_token_by_int_ids(self, mocker):
+        _, mock_context = self.patch_for_on_start(mocker)
+        mock_context.attach.return_value = "mock-token"
+        mock_span = mocker.Mock()
+        mock_span.configure_mock(
+            **{
+                "parent": None,
+                "attributes.get": mocker.Mock(return_value=None),
+                "name": "default-span-name",
+            }
+        )
+        mock_span.context.configure_mock(trace_id=0x1111, span_id=0x2222)
+        processor = ServiceEntrySpanProcessor()
+        processor.on_start(mock_span, None)
+        assert list(processor.context_tokens) == [(0x1111, 0x2222)]
+        assert processor.context_tokens[(0x1111, 0x2222)][0] == "mock-token"
+
+    def test_store_token_sweeps_expired(self, mocker):
+        mock_monotonic = mocker.patch(
+            "solarwinds_apm.trace.serviceentry_processor.time.monotonic",
+            return_value=100,
+        )
+        processor = ServiceEntrySpanProcessor(token_ttl=10)
+        processor._store_token((1, 1), "token-1")
+        mock_monotonic.return_value = 105
+        processor._store_token((1, 2), "token-2")
+        mock_monotonic.return_value = 111
+        processor._store_token((1, 3), "token-3")
+        assert list(processor.context_tokens) == [(1, 2), (1, 3)]
+
+    def test_store_token_bounded(self, mocker):
+        processor = ServiceEntrySpanProcessor(max_tokens=2)
+        assert processor._store_token((1, 1), "token-1") is True
+        assert processor._store_token((1, 2), "token-2") is True
+        assert processor._store_token((1, 3), "token-3") is False
+        assert list(processor.context_tokens) == [(1, 1), (1, 2)]
+
+    def test_store_token_bounded_warns_once(self, mocker):
+        mock_logger = mocker.patch(
+            "solarwinds_apm.trace.serviceentry_processor.logger"
+        )
+        processor = ServiceEntrySpanProcessor(max_tokens=1)
+        processor._store_token((1, 1), "token-1")
+        processor._store_token((1, 2), "token-2")
+        processor._store_token((1, 3), "token-3")
+        mock_logger.warning.assert_called_once()
+
+    def test_store_token_bounded_sweeps_expired(self, mocker):
+        mock_monotonic = mocker.patch(
+            "solarwinds_apm.trace.serviceentry_processor.time.monotonic",
+            return_value=100,
+        )
+        processor = ServiceEntrySpanProcessor(max_tokens=2, token_ttl=10)
+        processor._store_token((1, 1), "token-1")
+        mock_monotonic.return_value = 105
+        processor._store_token((1, 2), "token-2")
+        mock_monotonic.return_value = 111
+        assert processor._store_token((1, 3), "token-3") is True
+        assert list(processor.context_tokens) == [(1, 2), (1, 3)]
+
+    def test_on_start_cache_full_detaches(self, mocker):
+        _, mock_context = self.patch_for_on_start(mocker)
+        mock_context.attach.return_value = "mock-token"
+        mock_span = mocker.Mock()
+        mock_span.configure_mock(
+            **{
+                "parent": None,
+                "attributes.get": mocker.Mock(return_value=None),
+                "name": "default-span-name",
+            }
+        )
+        mock_span.context.configure_mock(trace_id=0x1111, span_id=0x2222)
+        processor = ServiceEntrySpanProcessor(max_tokens=0)
+        processor.on_start(mock_span, None)
+        assert processor.context_tokens == {}
         mock_context.detach.assert_called_once_with("mock-token")
+
+    def test_store_and_pop_token_concurrently(self, mocker):
+        processor = ServiceEntrySpanProcessor(max_tokens=8)
+        errors = []
+
+        def store():
+            try:
+                for span_id in range(5_000):
+                    processor._store_token((1, span_id), "token")
+            except Exception as exc:  # pylint: disable=broad-except
+                errors.append(exc)
+
+        def pop():
+            try:
+                for span_id in range(5_000):
+                    processor.pop_entry_token(
+                        mocker.Mock(trace_id=1, span_id=span_id)
+                    )
+            except Exception as exc:  # pylint: disable=broad-except
+                errors.append(exc)
+
+        threads = [threading.Thread(target=store)] + [
+            threading.Thread(target=pop) for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+        assert len(processor.context_tokens) <= 8
@@ -0,0 +1,134 @@
+# © 2026 SolarWinds Worldwide, LLC. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with the License. You may obtain a copy of the License at:http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
+
+from solarwinds_apm.trace import SolarWindsSpanProcessor
+
+
+class TestSolarWindsSpanProcessor:
+    def patch_processors(self, mocker):
+        mock_entry = mocker.Mock()
+        mocker.patch(
+            "solarwinds_apm.trace.solarwinds_processor.ServiceEntrySpanProcessor",
+            return_value=mock_entry,
+        )
+        mock_response_time = mocker.Mock()
+        mock_rtp_cls = mocker.patch(
+            "solarwinds_apm.trace.solarwinds_processor.ResponseTimeProcessor",
+            return_value=mock_response_time,
+        )
+        return mock_entry, mock_response_time, mock_rtp_cls
+
+    def test_init(self, mocker):
+        mock_entry, mock_response_time, mock_rtp_cls = self.patch_processors(
+            mocker
+        )
+        processor = SolarWindsSpanProcessor("mock-config")
+        assert processor.service_entry_processor == mock_entry
+        assert processor.response_time_processor == mock_response_time
+        mock_rtp_cls.assert_called_once_with("mock-config")
+
+    def test_init_no_response_time(self, mocker):
+        _, _, mock_rtp_cls = self.patch_processors(mocker)
+        processor = SolarWindsSpanProcessor(
+            "mock-config", record_response_time=False
+        )
+        assert processor.response_time_processor is None
+        mock_rtp_cls.assert_not_called()
+
+    def test_on_start_not_entry(self, mocker):
+        mock_entry, _, _ = self.patch_processors(mocker)
+        mocker.patch(
+            "solarwinds_apm.trace.solarwinds_processor.is_entry_span",
+            return_value=False,
+        )
+        processor = SolarWindsSpanProcessor("mock-config")
+        processor.on_start("mock-span", None)
+        mock_entry.start_entry_span.assert_not_called()
+
+    def test_on_start_entry(self, mocker):
+        mock_entry, _, _ = self.patch_processors(mocker)
+        mocker.patch(
+            "solarwinds_apm.trace.solarwinds_processor.is_entry_span",
+            return_value=True,
+        )
+        processor = SolarWindsSpanProcessor("mock-config")
+        processor.on_start("mock-span", None)
+        mock_entry.start_entry_span.assert_called_once_with("mock-span")
+
+    def test_on_ending_not_entry(self, mocker):
+        mock_entry, _, _ = self.patch_processors(mocker)
+        mocker.patch(
+            "solarwinds_apm.trace.solarwinds_processor.is_entry_span",
+            return_value=False,
+        )
+        processor = SolarWindsSpanProcessor("mock-config")
+        processor._on_ending(mocker.Mock())
+        mock_entry.finalize_entry_span.assert_not_called()
+
+    def test_on_ending_entry(self, mocker):
+        mock_entry, _, _ = self.patch_processors(mocker)
+        mocker.patch(
+            "solarwinds_apm.trace.solarwinds_processor.is_entry_span",
+            return_value=True,
+        )
+        mock_span = mocker.Mock()
+        processor = SolarWindsSpanProcessor("mock-config")
+        processor._on_ending(mock_span)
+        mock_entry.finalize_entry_span.assert_called_once_with(mock_span)
+
+    def test_on_end_not_entry(self, mocker):
+        mock_entry, mock_response_time, _ = self.patch_processors(mocker)
+        mocker.patch(
+            "solarwinds_apm.trace.solarwinds_processor.is_entry_span",
+            return_value=False,
+        )
+        processor = SolarWindsSpanProcessor("mock-config")
+        processor.on_end(mocker.Mock())
+        mock_entry.pop_entry_token.assert_not_called()
+        mock_entry.detach_entry_token.assert_not_called()
+        mock_response_time.record_response_time.assert_not_called()
+
+    def test_on_end_entry_token_swept(self, mocker):
+        mock_entry, mock_response_time, _ = self.patch_processors(mocker)
+        mock_entry.pop_entry_token.return_value = None
+        mocker.patch(
+            "solarwinds_apm.trace.solarwinds_processor.is_entry_span",
+            return_value=True,
+        )
+        mock_span = mocker.Mock()
+        processor = SolarWindsSpanProcessor("mock-config")
+        processor.on_end(mock_span)
+        mock_entry.pop_entry_token.assert_called_once_with(mock_span.context)
+        mock_entry.detach_entry_token.assert_not_called()
+        mock_response_time.record_response_time.assert_called_once_with(
+            mock_span
+        )
+
+    def test_on_end_entry(self, mocker):
+        mock_entry, mock_response_time, _ = self.patch_processors(mocker)
+        mock_entry.pop_entry_token.return_value = "mock-token"
+        mock_span = mocker.Mock()
+        processor = SolarWindsSpanProcessor("mock-config")
+        processor.on_end(mock_span)
+        mock_entry.detach_entry_token.assert_called_once_with(
+            mock_span.context, "mock-token"
+        )
+        mock_response_time.record_response_time.assert_called_once_with(
+            mock_span
+        )
+
+    def test_on_end_entry_no_response_time(self, mocker):
+        mock_entry, mock_response_time, _ = self.patch_processors(mocker)
+        mock_entry.pop_entry_token.return_value = "mock-token"
+        mock_span = mocker.Mock()
+        processor = SolarWindsSpanProcessor(
+            "mock-config", record_response_time=False
+        )
+        processor.on_end(mock_span)
+        mock_entry.detach_entry_token.assert_called_once_with(
+            mock_span.context, "mock-token"
+        )
+        mock_response_time.record_response_time.assert_not_called()
@@ -6,12 +6,20 @@
 
 from unittest.mock import call
 
+import pytest
 from opentelemetry.context.context import Context
 from opentelemetry.propagators import textmap
+from opentelemetry.trace import get_current_span
+from opentelemetry.trace.propagation.tracecontext import (
+    TraceContextTextMapPropagator,
+)
 from opentelemetry.trace.span import TraceState
 
 from solarwinds_apm.apm_constants import INTL_SWO_X_OPTIONS_KEY
-from solarwinds_apm.propagator import SolarWindsPropagator
+from solarwinds_apm.propagator import (
+    EMPTY_XTRACEOPTIONS,
+    SolarWindsPropagator,
+)
 
 
 class TestSolarWindsPropagator:
@@ -57,6 +65,70 @@ class TestSolarWindsPropagator:
         assert actual_xto.options_header == "foo"
         assert actual_xto.signature == "bar"
 
+    def test_extract_no_xtraceoptions_shared_empty(self):
+        first = SolarWindsPropagator().extract({})
+        second = SolarWindsPropagator().extract({"foo": "bar"})
+        assert first.get(INTL_SWO_X_OPTIONS_KEY) is EMPTY_XTRACEOPTIONS
+        assert second.get(INTL_SWO_X_OPTIONS_KEY) is EMPTY_XTRACEOPTIONS
+        assert EMPTY_XTRACEOPTIONS.options_header == ""
+        assert EMPTY_XTRACEOPTIONS.signature == ""
+        assert not EMPTY_XTRACEOPTIONS.include_response
+
+    def test_extract_reads_each_header_once(self, mocker):
+        mock_getter = mocker.Mock()
+        mock_getter.get.return_value = None
+        SolarWindsPropagator().extract({}, getter=mock_getter)
+        assert sorted(
+            call_args.args[1] for call_args in mock_getter.get.call_args_list
+        ) == [
+            "traceparent",
+            "tracestate",
+            "x-trace-options",
+            "x-trace-options-signature",
+        ]
+
+    @pytest.mark.parametrize(
+        "carrier",
+        [
+            {},
+            {"tracestate": "sw=1000100010001000-01"},
+            {
+                "traceparent": "00-3a02f8a392478c3700000000deadbeef-1000100010001000-01"
+            },
+            {
+                "traceparent": "00-3a02f8a392478c3700000000deadbeef-1000100010001000-00",
+                "tracestate": "sw=1000100010001000-00,foo=bar",
+            },
+            {
+                "traceparent": "01-3a02f8a392478c3700000000deadbeef-1000100010001000-01-extra",
+                "tracestate": "sw=1000100010001000-01",
+            },
+            {
+                "traceparent": "00-3a02f8a392478c3700000000deadbeef-1000100010001000-01-extra"
+            },
+            {
+                "traceparent": "ff-3a02f8a392478c3700000000deadbeef-1000100010001000-01"
+            },
+            {
+                "traceparent": "00-00000000000000000000000000000000-1000100010001000-01"
+            },
+            {
+                "traceparent": "00-3a02f8a392478c3700000000deadbeef-0000000000000000-01"
+            },
+            {"traceparent": "not-a-traceparent"},
+        ],
+    )
+    def test_extract_span_context_matches_tracecontext(self, carrier):
+        expected = get_current_span(
+            TraceContextTextMapPropagator().extract(carrier)
+        ).get_span_context()
+        actual = get_current_span(
+            SolarWindsPropagator().extract(carrier)
+        ).get_span_context()
+        assert actual == expected
+        assert actual.trace_state == expected.trace_state
+        assert actual.is_remote == expected.is_remote
+
     def mock_otel_context(
         self, mocker, valid_span_id=True, trace_flags=0x01, trace_state=None
     ):
@@ -381,6 +453,75 @@ class TestSolarWindsPropagator:
             ]
         )
 
+    def test_inject_max_members_no_sw(self, mocker):
+        """sw not added to full tracestate, xtrace_options_response removed"""
+        members = [(f"key{i}", "val") for i in range(31)]
+        trace_state = TraceState(
+            [("xtrace_options_response", "abc123"), *members]
+        )
+        self.mock_otel_context(mocker, True, trace_state=trace_state)
+        mock_carrier = {}
+        SolarWindsPropagator().inject(mock_carrier, mocker.Mock())
+        assert mock_carrier["tracestate"] == TraceState(members).to_header()
+
+    def test_inject_max_members_existing_sw(self, mocker):
+        """sw updated in full tracestate"""
+        members = [(f"key{i}", "val") for i in range(31)]
+        trace_state = TraceState([*members, ("sw", "some-existing-value")])
+        self.mock_otel_context(mocker, True, trace_state=trace_state)
+        mock_carrier = {}
+        SolarWindsPropagator().inject(mock_carrier, mocker.Mock())
+        assert (
+            mock_carrier["tracestate"]
+            == TraceState(
+                [("sw", "1000100010001000-01"), *members]
+            ).to_header()
+        )
+
+    def test_tracestate_suffix_cached(self):
+        trace_state = TraceState(
+            [("sw", "1000100010001000-01"), ("foo", "bar"), ("baz", "qux")]
+        )
+        propagator = SolarWindsPropagator()
+        assert propagator._tracestate_suffix(trace_state) == (
+            "foo=bar,baz=qux",
+            True,
+        )
+        first = propagator._tracestate_suffix_cache[id(trace_state)]
+        assert propagator._tracestate_suffix(trace_state)[0] is first[1]
+
+    def test_tracestate_suffix_cache_identity_checked(self):
+        trace_state = TraceState([("foo", "bar")])
+        other_trace_state = TraceState([("baz", "qux")])
+        propagator = SolarWindsPropagator()
+        # Simulate id reuse by a different TraceState
+        propagator._tracestate_suffix_cache[id(other_trace_state)] = (
+            trace_state,
+            "foo=bar",
+            True,
+        )
+        assert propagator._tracestate_suffix(other_trace_state) == (
+            "baz=qux",
+            True,
+        )
+
+    def test_tracestate_suffix_cache_bounded(self):
+        propagator = SolarWindsPropagator(tracestate_cache_max=2)
+        trace_states = [TraceState([("foo", str(i))]) for i in range(3)]
+        for trace_state in trace_states:
+            propagator._tracestate_suffix(trace_state)
+        assert len(propagator._tracestate_suffix_cache) == 1
+        assert propagator._tracestate_suffix(trace_states[0]) == (
+            "foo=0",
+            True,
+        )
+
+    def test_tracestate_suffix_empty(self):
+        propagator = SolarWindsPropagator()
+        assert propagator._tracestate_suffix(None) == ("", True)
+        assert propagator._tracestate_suffix(TraceState()) == ("", True)
+        assert not propagator._tracestate_suffix_cache
+
 
 class TestSolarWindsPropagatorNonDictCarriers:
     """Test SolarWindsPropagator with non-dict carriers from heterogeneous instrumentors"""
@@ -6,13 +6,23 @@
 
 from unittest.mock import call
 
+from opentelemetry.context.context import Context
+
+from solarwinds_apm.apm_constants import INTL_SWO_X_OPTIONS_KEY
+from solarwinds_apm.propagator import EMPTY_XTRACEOPTIONS
 from solarwinds_apm.response_propagator import (
     SolarWindsTraceResponsePropagator,
 )
+from solarwinds_apm.traceoptions import XTraceOptions
 
 
 class TestSwTraceResponsePropagator:
-    def mock_otel_trace_and_sw(self, mocker, valid_span_context=True) -> None:
+    def mock_otel_trace_and_sw(
+        self,
+        mocker,
+        valid_span_context=True,
+        recovered="my_recovered_response",
+    ) -> None:
         """Shared mocks for OTel trace and some sw parts"""
         # Mock sw parts external to response propagator inject
         mock_traceparent = mocker.Mock()
@@ -25,7 +35,7 @@ class TestSwTraceResponsePropagator:
         )
         mocker.patch(
             "solarwinds_apm.response_propagator.SolarWindsTraceResponsePropagator.recover_response_from_tracestate",
-            return_value="my_recovered_response",
+            return_value=recovered,
         )
 
         # Mock OTel trace API and current span context
@@ -105,3 +115,61 @@ class TestSwTraceResponsePropagator:
             {"xtrace_options_response": "bar####baz....qux####quux"}
         )
         assert result == "bar=baz,qux=quux"
+
+    def test_recover_response_from_tracestate_none(self):
+        propagator = SolarWindsTraceResponsePropagator()
+        assert propagator.recover_response_from_tracestate(None) == ""
+        assert propagator.recover_response_from_tracestate({}) == ""
+
+    def test_inject_valid_span_context_no_xtraceoptions(self, mocker):
+        """Only x-trace set and exposed"""
+        self.mock_otel_trace_and_sw(mocker, True, recovered="")
+        mock_carrier = {}
+        mock_setter = mocker.Mock()
+        SolarWindsTraceResponsePropagator().inject(
+            mock_carrier,
+            mocker.Mock(),
+            mock_setter,
+        )
+        assert mock_setter.set.call_args_list == [
+            call(mock_carrier, "x-trace", "my_x_trace"),
+            call(mock_carrier, "Access-Control-Expose-Headers", "x-trace"),
+        ]
+
+    def test_inject_trigger_trace_only_not_requested(self, mocker):
+        """Nothing set if request had no x-trace-options"""
+        self.mock_otel_trace_and_sw(mocker, True)
+        mock_carrier = {}
+        mock_setter = mocker.Mock()
+        propagator = SolarWindsTraceResponsePropagator(trigger_trace_only=True)
+        propagator.inject(mock_carrier, Context(), mock_setter)
+        propagator.inject(
+            mock_carrier,
+            Context({INTL_SWO_X_OPTIONS_KEY: EMPTY_XTRACEOPTIONS}),
+            mock_setter,
+        )
+        mock_setter.set.assert_not_called()
+
+    def test_inject_trigger_trace_only_requested(self, mocker):
+        """Headers set if request had x-trace-options"""
+        self.mock_otel_trace_and_sw(mocker, True)
+        mock_carrier = {}
+        mock_setter = mocker.Mock()
+        SolarWindsTraceResponsePropagator(trigger_trace_only=True).inject(
+            mock_carrier,
+            Context({INTL_SWO_X_OPTIONS_KEY: XTraceOptions("trigger-trace")}),
+            mock_setter,
+        )
+        assert mock_setter.set.call_args_list == [
+            call(mock_carrier, "x-trace", "my_x_trace"),
+            call(
+                mock_carrier,
+                "x-trace-options-response",
+                "my_recovered_response",
+            ),
+            call(
+                mock_carrier,
+                "Access-Control-Expose-Headers",
+                "x-trace,x-trace-options-response",
+            ),
+        ]
@@ -11,10 +11,16 @@ from solarwinds_apm.oboe.json_sampler import JsonSampler
 from solarwinds_apm.sampler import ParentBasedSwSampler
 
 
+def _config_get(key):
+    if key in ("transaction_buckets", "target_traces_per_second"):
+        return 0
+    return "foo"
+
+
 class TestParentBasedSwSampler:
     def test_init(self, mocker):
         mock_apm_config = mocker.Mock()
-        mock_apm_config.get = mocker.Mock(return_value="foo")
+        mock_apm_config.get = mocker.Mock(side_effect=_config_get)
         mock_apm_config.is_lambda = False
         sampler = ParentBasedSwSampler(mock_apm_config)
         assert isinstance(sampler._root, HttpSampler)
@@ -25,7 +31,7 @@ class TestParentBasedSwSampler:
 
     def test_init_is_lambda(self, mocker):
         mock_apm_config = mocker.Mock()
-        mock_apm_config.get = mocker.Mock(return_value="foo")
+        mock_apm_config.get = mocker.Mock(side_effect=_config_get)
         mock_apm_config.is_lambda = True
         sampler = ParentBasedSwSampler(mock_apm_config)
         assert isinstance(sampler._root, JsonSampler)
@@ -33,3 +39,15 @@ class TestParentBasedSwSampler:
         assert isinstance(sampler._remote_parent_not_sampled, JsonSampler)
         assert isinstance(sampler._local_parent_sampled, StaticSampler)
         assert isinstance(sampler._local_parent_not_sampled, StaticSampler)
+
+    def test_update_configuration(self, mocker):
+        mock_apm_config = mocker.Mock()
+        mock_apm_config.get = mocker.Mock(side_effect=_config_get)
+        mock_apm_config.is_lambda = True
+        sampler = ParentBasedSwSampler(mock_apm_config)
+        mock_update = mocker.patch.object(
+            sampler.sampler, "update_configuration"
+        )
+        configuration = mocker.Mock()
+        sampler.update_configuration(configuration)
+        mock_update.assert_called_once_with(configuration)
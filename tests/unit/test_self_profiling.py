@@ -0,0 +1,100 @@
+# © 2026 SolarWinds Worldwide, LLC. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with the License. You may obtain a copy of the License at:http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
+
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from solarwinds_apm.self_profiling import SelfProfiler
+
+
+class Component:
+    def work(self, value):
+        return value * 2
+
+    def fail(self):
+        raise ValueError("failed")
+
+
+@pytest.fixture(name="reader")
+def fixture_reader():
+    return InMemoryMetricReader()
+
+
+@pytest.fixture(name="profiler")
+def fixture_profiler(reader):
+    return SelfProfiler(meter_provider=MeterProvider(metric_readers=[reader]))
+
+
+def _points(reader):
+    points = {}
+    for resource_metrics in reader.get_metrics_data().resource_metrics:
+        for scope_metrics in resource_metrics.scope_metrics:
+            for metric in scope_metrics.metrics:
+                for point in metric.data.data_points:
+                    points[(metric.name, point.attributes["component"])] = (
+                        point.value
+                    )
+    return points
+
+
+class TestSelfProfiler:
+    def test_profile_counts_and_times_calls(self, profiler):
+        component = Component()
+        profiler.profile("component", component, "work")
+        assert component.work(2) == 4
+        assert component.work(3) == 6
+        calls, total_ns, max_ns = profiler.snapshot()["component"]
+        assert calls == 2
+        assert total_ns >= max_ns > 0
+
+    def test_profile_counts_calls_that_raise(self, profiler):
+        component = Component()
+        profiler.profile("component", component, "fail")
+        with pytest.raises(ValueError):
+            component.fail()
+        assert profiler.snapshot()["component"][0] == 1
+
+    def test_profile_only_replaces_on_instance(self, profiler):
+        component = Component()
+        profiler.profile("component", component, "work")
+        Component().work(1)
+        assert profiler.snapshot()["component"][0] == 0
+
+    def test_profile_skips_missing(self, profiler):
+        profiler.profile("component", Component(), "missing")
+        profiler.profile("none", None, "work")
+        assert not profiler.snapshot()
+
+    def test_exports_internal_metrics(self, profiler, reader):
+        component = Component()
+        profiler.profile("component", component, "work")
+        component.work(1)
+        points = _points(reader)
+        assert points[("sw.apm.internal.calls", "component")] == 1
+        assert points[("sw.apm.internal.time", "component")] > 0
+        assert points[("sw.apm.internal.max_time", "component")] > 0
+
+    def test_max_time_same_for_every_reader(self):
+        readers = [InMemoryMetricReader(), InMemoryMetricReader()]
+        profiler = SelfProfiler(
+            meter_provider=MeterProvider(metric_readers=readers)
+        )
+        component = Component()
+        profiler.profile("component", component, "work")
+        component.work(1)
+        max_ns = profiler.snapshot()["component"][2]
+        for reader in readers:
+            points = _points(reader)
+            assert points[("sw.apm.internal.max_time", "component")] == max_ns
+        points = _points(readers[0])
+        assert points[("sw.apm.internal.max_time", "component")] == max_ns
+
+    def test_components_have_own_locks(self, profiler):
+        first, second = Component(), Component()
+        profiler.profile("first", first, "work")
+        profiler.profile("second", second, "work", "fail")
+        assert profiler._stats["first"][1] is not profiler._stats["second"][1]
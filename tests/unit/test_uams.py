@@ -7,12 +7,14 @@
 
 import os
 import tempfile
+import threading
 import uuid
 from unittest.mock import MagicMock, patch
 
 import pytest
 from opentelemetry.semconv.resource import ResourceAttributes
 
+from solarwinds_apm import uams
 from solarwinds_apm.uams import ATTR_UAMS_CLIENT_ID, UamsResourceDetector
 
 UAMS_FILE_ID = str(uuid.uuid4())
@@ -118,3 +120,84 @@ def test_detects_nothing_when_file_not_present_and_unrelated_running(mock_get):
     assert resource.attributes == {}
     # Ensure the unrelated API was called
     mock_get.assert_called_once()
+
+
+@pytest.fixture
+def background_lookup(mocker):
+    mocker.patch.dict(os.environ, {"SW_APM_UAMS_BACKGROUND": "true"})
+    mocker.patch("solarwinds_apm.uams._background_lookup", None)
+    mock_response = MagicMock()
+    mock_response.json.return_value = {
+        "uamsclient_id": UAMS_API_ID,
+    }
+    mock_response.status_code = 200
+    return mocker.patch("requests.get", return_value=mock_response)
+
+
+def test_background_detects_nothing_and_defers_api(background_lookup):
+    detector = UamsResourceDetector(UAMS_FILE)
+    resource = detector.detect()
+    assert resource.attributes == {}
+    assert detector.deferred is True
+    assert uams._background_lookup.wait(5)
+    background_lookup.assert_called_once()
+
+
+def test_background_reads_file_without_api(background_lookup, setup_file):
+    detector = UamsResourceDetector(UAMS_FILE)
+    resource = detector.detect()
+    assert resource.attributes[ATTR_UAMS_CLIENT_ID] == UAMS_FILE_ID
+    assert detector.deferred is False
+    assert uams._background_lookup is None
+    background_lookup.assert_not_called()
+
+
+def test_background_attributes_after_lookup(background_lookup):
+    UamsResourceDetector(UAMS_FILE).detect()
+    assert uams.background_attributes(5) == {
+        ATTR_UAMS_CLIENT_ID: UAMS_API_ID,
+        ResourceAttributes.HOST_ID: UAMS_API_ID,
+    }
+
+
+def test_background_attributes_empty_if_lookup_not_done(background_lookup):
+    lookup_started = threading.Event()
+    release = threading.Event()
+    response = background_lookup.return_value
+
+    def slow_get(*args, **kwargs):
+        lookup_started.set()
+        release.wait(5)
+        return response
+
+    background_lookup.side_effect = slow_get
+    UamsResourceDetector(UAMS_FILE).detect()
+    assert lookup_started.wait(5)
+    try:
+        assert uams.background_attributes(0.01) == {}
+    finally:
+        release.set()
+    assert uams._background_lookup.wait(5)
+
+
+def test_background_attributes_empty_if_lookup_failed(background_lookup):
+    background_lookup.side_effect = Exception("no uams")
+    UamsResourceDetector(UAMS_FILE).detect()
+    assert uams.background_attributes(5) == {}
+
+
+def test_background_keeps_configured_resource_attributes(
+    background_lookup, mocker
+):
+    mocker.patch.dict(
+        os.environ, {"OTEL_RESOURCE_ATTRIBUTES": "host.id=configured"}
+    )
+    UamsResourceDetector(UAMS_FILE).detect()
+    assert uams.background_attributes(5) == {
+        ATTR_UAMS_CLIENT_ID: UAMS_API_ID,
+    }
+
+
+def test_background_attributes_without_background_lookup(mocker):
+    mocker.patch("solarwinds_apm.uams._background_lookup", None)
+    assert uams.background_attributes() == {}
@@ -5,6 +5,7 @@
 # Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific language governing permissions and limitations under the License.
 
 import pytest
+from opentelemetry.trace import SpanContext, TraceFlags
 from opentelemetry.trace.span import TraceState
 
 from solarwinds_apm.w3c_transformer import W3CTransformer
@@ -65,6 +66,31 @@ class TestW3CTransformer:
             1234, "01"
         ) == "{:016x}-{}".format(1234, "01")
 
+    def test_trace_flags_from_int_out_of_range(self):
+        assert W3CTransformer.trace_flags_from_int(0x1AB) == "1ab"
+
+    def test_trace_and_span_id_from_context(self, span_context):
+        assert (
+            W3CTransformer.trace_and_span_id_from_context(span_context)
+            == f"{span_context.trace_id:032x}-{span_context.span_id:016x}"
+        )
+
+    def test_traceparent_from_context_cached(self, span_context):
+        first = W3CTransformer.traceparent_from_context(span_context)
+        assert W3CTransformer.traceparent_from_context(span_context) is first
+
+    def test_traceparent_from_context_trace_flags_int_subclass(self):
+        span_context = SpanContext(
+            trace_id=0x1234,
+            span_id=0x5678,
+            is_remote=False,
+            trace_flags=TraceFlags(TraceFlags.SAMPLED),
+        )
+        assert (
+            W3CTransformer.traceparent_from_context(span_context)
+            == f"00-{0x1234:032x}-{0x5678:016x}-01"
+        )
+
     def test_remove_response_from_sw_key_present(self):
         ts = TraceState([["bar", "456"], ["xtrace_options_response", "123"]])
         assert W3CTransformer.remove_response_from_sw(ts) == TraceState(